@@ -0,0 +1,133 @@
+"""
+Benchmark loading a dbt manifest with the different parsers.
+
+Generates a synthetic manifest and compares the legacy YAML loader with
+``load_manifest``, with and without streaming:
+
+    % python benchmarks/dbt_manifest.py --models 2000 --other-nodes 20000
+
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import yaml
+
+from preset_cli.cli.superset.sync.dbt.lib import load_manifest
+
+
+def make_node(unique_id: str, resource_type: str, columns: int) -> Dict[str, Any]:
+    """
+    Build a synthetic manifest node.
+    """
+    name = unique_id.split(".")[-1]
+    return {
+        "unique_id": unique_id,
+        "resource_type": resource_type,
+        "name": name,
+        "schema": "public",
+        "database": "analytics",
+        "description": f"Description of {name}. " * 5,
+        "raw_code": f"SELECT * FROM {{{{ ref('{name}') }}}}",
+        "compiled_code": f"SELECT * FROM analytics.public.{name}",
+        "depends_on": {"nodes": [], "macros": []},
+        "config": {"materialized": "table", "meta": {}, "tags": []},
+        "meta": {},
+        "columns": {
+            f"column_{i}": {
+                "name": f"column_{i}",
+                "description": f"Column {i} of {name}",
+                "data_type": "varchar",
+                "meta": {},
+            }
+            for i in range(columns)
+        },
+    }
+
+
+def make_manifest(models: int, other_nodes: int, columns: int) -> Dict[str, Any]:
+    """
+    Build a synthetic manifest.
+    """
+    nodes = {}
+    for i in range(models):
+        unique_id = f"model.project.model_{i}"
+        nodes[unique_id] = make_node(unique_id, "model", columns)
+    for i in range(other_nodes):
+        unique_id = f"test.project.test_{i}"
+        nodes[unique_id] = make_node(unique_id, "test", columns)
+
+    return {
+        "metadata": {"dbt_version": "1.7.0"},
+        "nodes": nodes,
+        "sources": {},
+        "macros": {
+            f"macro.project.macro_{i}": {"macro_sql": "{% macro m() %}{% endmacro %}"}
+            for i in range(other_nodes)
+        },
+        "metrics": {},
+        "parent_map": {unique_id: [] for unique_id in nodes},
+        "child_map": {unique_id: [] for unique_id in nodes},
+    }
+
+
+def load_manifest_yaml(path: Path) -> Dict[str, Any]:
+    """
+    Load the manifest the way the ``dbt-core`` command used to.
+    """
+    with open(path, encoding="utf-8") as input_:
+        return yaml.load(input_, Loader=yaml.SafeLoader)
+
+
+def measure(name: str, function: Callable[[], Any]) -> None:
+    """
+    Print the wall time and peak memory of a function.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<10} {elapsed:>8.2f}s {peak / 2**20:>10.1f} MiB")
+
+
+def main() -> None:
+    """
+    Run the benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--models", type=int, default=2000)
+    parser.add_argument("--other-nodes", type=int, default=20000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument(
+        "--skip-yaml",
+        action="store_true",
+        help="Skip the YAML loader, which is very slow on large manifests",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "manifest.json"
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(
+                make_manifest(args.models, args.other_nodes, args.columns),
+                output,
+            )
+        print(f"manifest.json: {path.stat().st_size / 2**20:.1f} MiB\n")
+
+        print(f"{'loader':<10} {'time':>9} {'peak memory':>14}")
+        if not args.skip_yaml:
+            measure("yaml", lambda: load_manifest_yaml(path))
+        measure("json", lambda: load_manifest(path))
+        measure("streaming", lambda: load_manifest(path, stream=True))
+
+
+if __name__ == "__main__":
+    main()
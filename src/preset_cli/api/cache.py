@@ -0,0 +1,309 @@
+"""
+Persistent caches for HTTP GET requests and query results.
+
+Responses are stored on disk, keyed by URL and by an auth scope, so that different
+credentials never share responses. Responses with an ``ETag`` or ``Last-Modified``
+header are revalidated with a conditional request every time they're read; other
+responses are reused for ``ttl`` seconds. When the cache grows over ``max_size``
+bytes the least recently used responses are evicted.
+
+Query results are stored as Parquet files, keyed by the instance, the auth scope,
+the database, the schema, the normalized SQL and the row limit. They're reused for
+``ttl`` seconds, and evicted the same way.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+import pandas as pd
+from requests import Response, Session
+from requests.structures import CaseInsensitiveDict
+from yarl import URL
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:  # pragma: no cover
+    pa = None  # pylint: disable=invalid-name
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300
+DEFAULT_RESULT_TTL = 3600
+DEFAULT_MAX_SIZE = 100 * 2**20
+
+CacheEntry = Tuple[Dict[str, Any], bytes]
+ResultKey = Tuple[Any, ...]
+
+# quoted strings, quoted identifiers and block comments, which are kept as is, and
+# runs of whitespace and line comments, which are collapsed
+SQL_TOKENS = re.compile(
+    r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|`[^`]*`|/\*.*?\*/|(?P<space>(?:\s|--[^\n]*)+)""",
+    re.DOTALL,
+)
+
+
+class DiskCache:  # pylint: disable=too-few-public-methods
+    """
+    A persistent, size-bounded cache of files, evicting the least recently used.
+    """
+
+    suffix = ".cache"
+
+    def __init__(
+        self,
+        directory: Path,
+        ttl: float = DEFAULT_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._size = sum(path.stat().st_size for path in self._get_paths())
+
+    def _get_paths(self) -> Iterator[Path]:
+        return (path for path in self.directory.iterdir() if path.suffix == self.suffix)
+
+    def clear(self) -> None:
+        """
+        Remove all cached entries.
+        """
+        for path in list(self._get_paths()):
+            self._remove(path)
+
+    def _hit(self, path: Path) -> None:
+        with self._lock:
+            self.hits += 1
+
+        try:
+            self._touch(path)
+        except FileNotFoundError:  # pragma: no cover
+            pass
+
+    def _miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """
+        Update the modification time of an entry, used for LRU eviction.
+        """
+        now = time.time()
+        os.utime(path, (now, now))
+
+    def _store(self, path: Path, data: bytes) -> None:
+        # write to a temporary file first, so that readers never see partial entries
+        with tempfile.NamedTemporaryFile(dir=self.directory, delete=False) as output:
+            output.write(data)
+        previous = path.stat().st_size if path.exists() else 0
+        os.replace(output.name, path)
+        self._touch(path)
+
+        with self._lock:
+            self._size += len(data) - previous
+            if self._size > self.max_size:
+                self._evict()
+
+    def _remove(self, path: Path) -> None:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return
+
+        with self._lock:
+            self._size -= size
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits ``max_size``.
+
+        Must be called with the lock held.
+        """
+        paths = []
+        for path in self._get_paths():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # pragma: no cover
+                continue
+            paths.append((stat.st_mtime, stat.st_size, path))
+
+        for _, size, path in sorted(paths):
+            if self._size <= self.max_size:
+                break
+            _logger.debug("Evicting %s from the cache", path)
+            path.unlink(missing_ok=True)
+            self._size -= size
+
+
+class HTTPCache(DiskCache):
+    """
+    A persistent, size-bounded cache for GET responses.
+    """
+
+    def _get_path(self, url: Union[str, URL], scope: str) -> Path:
+        key = hashlib.sha256(f"{scope}\n{url}".encode()).hexdigest()
+        return self.directory / f"{key}.cache"
+
+    def get(self, session: Session, url: Union[str, URL], scope: str) -> Response:
+        """
+        Fetch a URL, reusing or revalidating a cached response if possible.
+        """
+        path = self._get_path(url, scope)
+        entry = self._read(path)
+
+        headers = {}
+        if entry:
+            metadata, content = entry
+            if metadata["etag"]:
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata["last_modified"]:
+                headers["If-Modified-Since"] = metadata["last_modified"]
+            if not headers and time.time() < metadata["stored_at"] + self.ttl:
+                self._hit(path)
+                return self._build_response(url, metadata, content)
+
+        response = session.get(str(url), headers=headers)
+
+        if entry and response.status_code == 304:
+            self._hit(path)
+            return self._build_response(url, metadata, content)
+
+        self._miss()
+        if response.status_code == 200:
+            self._write(path, response)
+
+        return response
+
+    def invalidate(self, url: Union[str, URL], scope: str) -> None:
+        """
+        Remove the cached response for a URL.
+        """
+        self._remove(self._get_path(url, scope))
+
+    def _read(self, path: Path) -> Optional[CacheEntry]:
+        try:
+            with open(path, "rb") as input_:
+                metadata = json.loads(input_.readline())
+                content = input_.read()
+        except (FileNotFoundError, ValueError):
+            return None
+
+        return metadata, content
+
+    def _write(self, path: Path, response: Response) -> None:
+        metadata = {
+            "stored_at": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "headers": dict(response.headers),
+        }
+        data = json.dumps(metadata).encode() + b"\n" + response.content
+        self._store(path, data)
+
+    @staticmethod
+    def _build_response(
+        url: Union[str, URL],
+        metadata: Dict[str, Any],
+        content: bytes,
+    ) -> Response:
+        response = Response()
+        response.status_code = 200
+        response.url = str(url)
+        response.headers = CaseInsensitiveDict(metadata["headers"])
+        response._content = content  # pylint: disable=protected-access
+        return response
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Normalize a SQL query for caching its results.
+
+    Line comments are removed and whitespace is collapsed outside of quoted strings,
+    quoted identifiers and block comments, and trailing semicolons are removed, so
+    that reformatted queries share results.
+    """
+    sql = SQL_TOKENS.sub(
+        lambda match: " " if match.group("space") else match.group(),
+        sql,
+    )
+    return sql.strip().rstrip(";").strip()
+
+
+class ResultCache(DiskCache):
+    """
+    A persistent, size-bounded cache for query results, stored as Parquet.
+    """
+
+    suffix = ".parquet"
+
+    def __init__(
+        self,
+        directory: Path,
+        ttl: float = DEFAULT_RESULT_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        if pa is None:
+            raise ImportError(
+                "Caching query results requires ``pyarrow``. Please run "
+                "``pip install --upgrade preset-cli[arrow]``",
+            )
+        super().__init__(directory, ttl, max_size)
+
+    def _get_path(self, key: ResultKey) -> Path:
+        digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+        return self.directory / f"{digest}.parquet"
+
+    def get(self, key: ResultKey) -> Optional[pd.DataFrame]:
+        """
+        Return the cached results for a key, if they haven't expired.
+        """
+        path = self._get_path(key)
+        try:
+            table = pq.read_table(path)
+            stored_at = float(table.schema.metadata[b"stored_at"])
+        except (FileNotFoundError, KeyError, TypeError, pa.ArrowException):
+            self._miss()
+            return None
+
+        if time.time() >= stored_at + self.ttl:
+            self._miss()
+            return None
+
+        self._hit(path)
+        return table.to_pandas()
+
+    def set(self, key: ResultKey, dataframe: pd.DataFrame) -> None:
+        """
+        Store the results for a key.
+
+        Results that can't be converted to Arrow, eg, with columns of mixed types,
+        are not cached.
+        """
+        try:
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        except pa.ArrowException:
+            _logger.debug("Unable to cache results with types %s", dataframe.dtypes)
+            return
+
+        metadata = dict(table.schema.metadata or {})
+        metadata[b"stored_at"] = str(time.time()).encode()
+        buffer = BytesIO()
+        pq.write_table(table.replace_schema_metadata(metadata), buffer)
+        self._store(self._get_path(key), buffer.getvalue())
@@ -21,14 +21,19 @@ Data is returned in a Pandas Dataframe.
 import json
 import logging
 import re
+import tempfile
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import IntEnum
 from io import BytesIO
 from typing import (
+    IO,
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterator,
     List,
     Literal,
@@ -46,19 +51,37 @@ import pandas as pd
 import prison
 import yaml
 from bs4 import BeautifulSoup
+from requests import Response
 from yarl import URL
 
 from preset_cli import __version__
+from preset_cli.api.cache import HTTPCache, ResultCache, normalize_sql
 from preset_cli.api.clients.preset import PresetClient
-from preset_cli.api.operators import Equal, In, Operator
+from preset_cli.api.memo import Memo
+from preset_cli.api.multipart import MultipartBody
+from preset_cli.api.operators import Equal, GreaterThan, In, Operator
 from preset_cli.auth.main import Auth
-from preset_cli.lib import remove_root, validate_response
+from preset_cli.exceptions import ErrorLevel, SupersetError
+from preset_cli.lib import copy_zip_member, remove_root, validate_response
 from preset_cli.typing import UserType
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ModuleNotFoundError:  # pragma: no cover
+    pa = None  # pylint: disable=invalid-name
+
 _logger = logging.getLogger(__name__)
 
 MAX_PAGE_SIZE = 100
 MAX_IDS_IN_EXPORT = 50
+EXPORT_CHUNK_SIZE = 2**16
+MAX_WORKERS = 8
+DEFAULT_ORDER_COLUMN = "changed_on_delta_humanized"
+QUERY_CHUNK_SIZE = 10000
+QUERY_POLL_INTERVAL = 0.5
+MAX_QUERY_POLL_INTERVAL = 10.0
+QUERY_FINISHED_STATUSES = {"success", "failed", "stopped", "timed_out"}
 
 
 PERMISSION_MAP = {
@@ -183,6 +206,323 @@ def shortid() -> str:
     return str(uuid.uuid4())[-12:]
 
 
+def build_query_payload(
+    database_id: int,
+    sql: str,
+    schema: Optional[str] = None,
+    limit: Optional[int] = 1000,
+    run_async: bool = False,
+) -> Dict[str, Any]:
+    """
+    Build the payload for running a query in SQL Lab.
+
+    Without a limit the server caps the results at ``SQL_MAX_ROW``.
+    """
+    return {
+        "client_id": shortid()[:10],
+        "database_id": database_id,
+        "runAsync": run_async,
+        "schema": schema,
+        "sql": sql,
+        "sql_editor_id": "1",
+        "tab": "Untitled Query 2",
+        "tmp_table_name": "",
+        "select_as_cta": False,
+        "ctas_method": "TABLE",
+        "queryLimit": limit,
+        "expand_data": True,
+    }
+
+
+class DataQueryType(TypedDict, total=False):
+    """
+    A dimensional query, with the arguments of ``get_data``.
+
+    Only ``metrics`` and ``columns`` are required.
+    """
+
+    metrics: List[str]
+    columns: List[str]
+    order_by: Optional[List[str]]
+    order_desc: bool
+    is_timeseries: bool
+    time_column: Optional[str]
+    start: Optional[datetime]
+    end: Optional[datetime]
+    granularity: Optional[str]
+    where: str
+    having: str
+    row_limit: int
+
+
+def build_data_query(  # pylint: disable=too-many-locals, too-many-arguments
+    dataset: Dict[str, Any],
+    metrics: List[str],
+    columns: List[str],
+    order_by: Optional[List[str]] = None,
+    order_desc: bool = True,
+    is_timeseries: bool = False,
+    time_column: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    granularity: Optional[str] = None,
+    where: str = "",
+    having: str = "",
+    row_limit: int = 10000,
+) -> Dict[str, Any]:
+    """
+    Build a single query for the chart data API.
+    """
+    if time_column is None:
+        time_columns = [
+            column["column_name"] for column in dataset["columns"] if column["is_dttm"]
+        ]
+        if len(time_columns) > 1:
+            options = ", ".join(time_columns)
+            raise Exception(
+                f"Unable to determine time column, please pass `time_series` "
+                f"as one of: {options}",
+            )
+        time_column = time_columns[0]
+
+    time_range = (
+        "No filter" if start is None and end is None else f"{start or ''} : {end or ''}"
+    )
+
+    # convert adhoc metrics to a proper object, if needed
+    metric_names = [metric["metric_name"] for metric in dataset["metrics"]]
+    processed_metrics = [
+        metric if metric in metric_names else convert_to_adhoc_metric(metric)
+        for metric in metrics
+    ]
+
+    # same for columns
+    column_names = [column["column_name"] for column in dataset["columns"]]
+    processed_columns = [
+        column if column in column_names else convert_to_adhoc_column(column)
+        for column in columns
+    ]
+
+    # and order bys
+    processed_orderbys = [
+        (
+            (orderby, not order_desc)
+            if orderby in metric_names
+            else (convert_to_adhoc_metric(orderby), not order_desc)
+        )
+        for orderby in (order_by or [])
+    ]
+
+    query: Dict[str, Any] = {
+        "annotation_layers": [],
+        "applied_time_extras": {},
+        "columns": processed_columns,
+        "custom_form_data": {},
+        "custom_params": {},
+        "extras": {"having": having, "having_druid": [], "where": where},
+        "filters": [],
+        "is_timeseries": is_timeseries,
+        "metrics": processed_metrics,
+        "order_desc": order_desc,
+        "orderby": processed_orderbys,
+        "row_limit": row_limit,
+        "time_range": time_range,
+        "timeseries_limit": 0,
+        "url_params": {},
+    }
+
+    if is_timeseries:
+        query["granularity"] = time_column
+        query["extras"]["time_grain_sqla"] = granularity
+
+    return query
+
+
+# offsets of the time grains supported by Superset, used to align time windows
+TIME_GRAIN_OFFSETS = {
+    "PT1S": pd.offsets.Second(),
+    "PT1M": pd.offsets.Minute(),
+    "PT5M": pd.offsets.Minute(5),
+    "PT10M": pd.offsets.Minute(10),
+    "PT15M": pd.offsets.Minute(15),
+    "PT30M": pd.offsets.Minute(30),
+    "PT1H": pd.offsets.Hour(),
+    "P1D": pd.offsets.Day(),
+    "P1W": pd.offsets.Week(weekday=0),
+    "1969-12-28T00:00:00Z/P1W": pd.offsets.Week(weekday=6),
+    "1969-12-29T00:00:00Z/P1W": pd.offsets.Week(weekday=0),
+    "P1W/1970-01-03T00:00:00Z": pd.offsets.Week(weekday=6),
+    "P1W/1970-01-04T00:00:00Z": pd.offsets.Week(weekday=0),
+    "P1M": pd.offsets.MonthBegin(),
+    "P3M": pd.offsets.QuarterBegin(startingMonth=1),
+    "P1Y": pd.offsets.YearBegin(),
+}
+
+
+def build_time_windows(
+    start: datetime,
+    end: datetime,
+    granularity: str,
+    window: int,
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Split the time range ``[start, end)`` into windows of ``window`` time grains.
+
+    The window boundaries are aligned with the time grain, so that no time bucket is
+    split between two windows; only the first and last windows can be partial.
+    """
+    if granularity not in TIME_GRAIN_OFFSETS:
+        raise ValueError(f"Unable to split time range with granularity {granularity}")
+    if window < 1:
+        raise ValueError("Windows should have at least one time grain")
+
+    offset = TIME_GRAIN_OFFSETS[granularity]
+    timestamp = pd.Timestamp(start)
+    if isinstance(offset, pd.offsets.Tick):
+        boundary = timestamp.floor(offset)
+    else:
+        boundary = offset.rollback(timestamp.normalize())
+
+    windows: List[Tuple[datetime, datetime]] = []
+    while boundary < end:
+        next_boundary = boundary + offset * window
+        windows.append(
+            (
+                max(boundary.to_pydatetime(), start),
+                min(next_boundary.to_pydatetime(), end),
+            ),
+        )
+        boundary = next_boundary
+
+    return windows
+
+
+def build_data_batch_payload(
+    dataset_id: int,
+    queries: List[Dict[str, Any]],
+    force: bool = False,
+    result_format: str = "json",
+) -> Dict[str, Any]:
+    """
+    Build the payload for one or more queries against the chart data API.
+    """
+    return {
+        "datasource": {"id": dataset_id, "type": "table"},
+        "force": force,
+        "queries": queries,
+        "result_format": result_format,
+        "result_type": "full",
+    }
+
+
+def build_data_payload(  # pylint: disable=too-many-locals, too-many-arguments
+    dataset_id: int,
+    dataset: Dict[str, Any],
+    metrics: List[str],
+    columns: List[str],
+    order_by: Optional[List[str]] = None,
+    order_desc: bool = True,
+    is_timeseries: bool = False,
+    time_column: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    granularity: Optional[str] = None,
+    where: str = "",
+    having: str = "",
+    row_limit: int = 10000,
+    force: bool = False,
+    result_format: str = "json",
+) -> Dict[str, Any]:
+    """
+    Build the payload for a dimensional query against the chart data API.
+    """
+    query = build_data_query(
+        dataset,
+        metrics,
+        columns,
+        order_by,
+        order_desc,
+        is_timeseries,
+        time_column,
+        start,
+        end,
+        granularity,
+        where,
+        having,
+        row_limit,
+    )
+
+    return build_data_batch_payload(dataset_id, [query], force, result_format)
+
+
+def check_pyarrow() -> None:
+    """
+    Check that ``pyarrow``, needed for Arrow results, is installed.
+    """
+    if pa is None:
+        raise ImportError(
+            "Arrow results require ``pyarrow``. Please run "
+            "``pip install --upgrade preset-cli[arrow]``",
+        )
+
+
+def convert_to_arrow_table(
+    rows: List[Dict[str, Any]],
+    columns: List[Dict[str, Any]],
+) -> "pa.Table":
+    """
+    Build an Arrow table from the rows and columns of a SQL Lab payload.
+
+    Each column is converted directly into an Arrow array. SQL Lab serializes
+    temporal values as ISO strings, so temporal columns are parsed back into
+    timestamps; columns with mixed types are kept as strings.
+    """
+    arrays = {}
+    for column in columns:
+        name = column["name"]
+        values = [row.get(name) for row in rows]
+        try:
+            array = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            array = pa.array(
+                [value if value is None else str(value) for value in values],
+                type=pa.string(),
+            )
+
+        # Superset <= 1.4 returns ``is_date`` instead of ``is_dttm``
+        if (column.get("is_dttm") or column.get("is_date")) and pa.types.is_string(
+            array.type,
+        ):
+            try:
+                array = array.cast(pa.timestamp("us"))
+            except pa.ArrowInvalid:
+                pass
+
+        arrays[name] = array
+
+    return pa.table(arrays)
+
+
+def read_csv_batches(response: Response) -> "pa.RecordBatchReader":
+    """
+    Parse a streamed CSV response into Arrow record batches, as it's read.
+
+    Column types are inferred from the first block of the file. The response is
+    closed once all the batches have been read.
+    """
+    try:
+        reader = pa_csv.open_csv(response.raw)
+    except BaseException:
+        response.close()
+        raise
+
+    def read_batches() -> Iterator["pa.RecordBatch"]:
+        with response:
+            yield from reader
+
+    return pa.RecordBatchReader.from_batches(reader.schema, read_batches())
+
+
 def parse_html_array(value: str) -> List[str]:
     """
     Parse an array scraped from the HTML CRUD view.
@@ -231,63 +571,280 @@ class OwnershipType(TypedDict):
     owners: List[str]
 
 
-class SupersetClient:  # pylint: disable=too-many-public-methods
+NAME_KEYS = {
+    "database": ("database_name",),
+    "dataset": ("schema", "table_name"),
+    "chart": ("slice_name",),
+    "dashboard": ("dashboard_title",),
+}
+EXPORT_ID_SUFFIX = re.compile(r"_(?P<id>\d+)\.yaml$")
+
+
+def iter_primary_configs(
+    resource_name: str,
+    content: bytes,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield the file name and config of the primary resources in an export bundle.
+
+    Only the YAML files of the exported resource type are parsed; dependencies like
+    databases in a chart export are skipped.
+    """
+    with ZipFile(BytesIO(content)) as export:
+        for name in export.namelist():
+            if not remove_root(name).startswith(resource_name):
+                continue
+            yield name, yaml.load(export.read(name), Loader=yaml.SafeLoader)
+
+
+def match_configs_to_ids(
+    resource_name: str,
+    resources: List[Dict[str, Any]],
+    configs: List[Tuple[str, Dict[str, Any]]],
+) -> Dict[int, UUID]:
+    """
+    Match exported configs back to the resources that were exported.
+
+    Configs are matched by name; when several resources share a name the ID suffix
+    that Superset adds to the file name is used to disambiguate. Configs that can't
+    be matched unambiguously are ignored.
+    """
+    keys = NAME_KEYS.get(resource_name)
+    if keys is None:
+        return {}
+
+    uuids: Dict[int, UUID] = {}
+    for file_name, config in configs:
+        candidates = [
+            resource
+            for resource in resources
+            if all(key in resource and resource[key] == config.get(key) for key in keys)
+        ]
+        if len(candidates) > 1 and (match_ := EXPORT_ID_SUFFIX.search(file_name)):
+            candidates = [
+                resource
+                for resource in candidates
+                if resource["id"] == int(match_.group("id"))
+            ]
+        if len(candidates) == 1 and candidates[0]["id"] not in uuids:
+            uuids[candidates[0]["id"]] = UUID(config["uuid"])
+
+    return uuids
+
+
+class SupersetClient:  # pylint: disable=too-many-public-methods, too-many-instance-attributes
     """
     A client for running queries against Superset.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         baseurl: Union[str, URL],
         auth: Auth,
         preset_baseurl: Union[str, URL] = "https://api.app.preset.io/",
+        max_workers: int = MAX_WORKERS,
+        cache: Optional[HTTPCache] = None,
+        memoize: bool = False,
+        keyset_pagination: bool = True,
+        result_cache: Optional[ResultCache] = None,
     ):
         # convert to URL if necessary
         self.baseurl = URL(baseurl)
         self.auth = auth
         self.preset_baseurl = URL(preset_baseurl)
+        self.max_workers = max_workers
+        self.cache = cache
+        self.memo = Memo() if memoize else None
+        self.keyset_pagination = keyset_pagination
+        self.result_cache = result_cache
+
+        # resources where listing by ID is not supported by the server
+        self._no_keyset: Set[str] = set()
 
         self.session = auth.session
         self.session.headers.update(auth.get_headers())
         self.session.headers["Referer"] = str(self.baseurl)
         self.session.headers["User-Agent"] = f"Apache Superset Client ({__version__})"
 
-    def run_query(
+    def run_query(  # pylint: disable=too-many-arguments
         self,
         database_id: int,
         sql: str,
         schema: Optional[str] = None,
         limit: int = 1000,
+        refresh: bool = False,
     ) -> pd.DataFrame:
         """
         Run a SQL query, returning a Pandas dataframe.
+
+        If the client has a result cache, results are reused until they expire, unless
+        ``refresh`` is true. Results are cached per credentials, and only when the
+        credentials can be identified.
         """
+        scope = self.auth.get_scope() if self.result_cache else None
+        if self.result_cache is None or scope is None:
+            payload = self._run_query(database_id, sql, schema, limit)
+            return pd.DataFrame(payload["data"])
+
+        key = (str(self.baseurl), scope, database_id, schema, normalize_sql(sql), limit)
+        if not refresh:
+            dataframe = self.result_cache.get(key)
+            if dataframe is not None:
+                return dataframe
+
         payload = self._run_query(database_id, sql, schema, limit)
+        dataframe = pd.DataFrame(payload["data"])
+        self.result_cache.set(key, dataframe)
 
-        return pd.DataFrame(payload["data"])
+        return dataframe
 
-    def _run_query(
+    def run_query_async(  # pylint: disable=too-many-arguments
         self,
         database_id: int,
         sql: str,
         schema: Optional[str] = None,
-        limit: int = 1000,
+        limit: Optional[int] = None,
+        chunk_size: int = QUERY_CHUNK_SIZE,
+        timeout: Optional[float] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Run a SQL query asynchronously, returning an iterator of Pandas dataframes.
+
+        The query runs in a worker, storing its results in the results backend, and
+        its status is polled with exponential backoff. The results are then streamed
+        as CSV and parsed in dataframes of up to ``chunk_size`` rows, so that large
+        results can be read with bounded memory. Databases that don't allow async
+        queries run them synchronously, and their results are split in chunks.
+
+        Note that columns are parsed from CSV, so types are inferred by Pandas.
+        """
+        payload = self._run_query(database_id, sql, schema, limit, run_async=True)
+
+        if "data" in payload:
+            dataframe = pd.DataFrame(payload["data"])
+            return iter(
+                [
+                    dataframe.iloc[start : start + chunk_size]
+                    for start in range(0, max(len(dataframe), 1), chunk_size)
+                ],
+            )
+
+        self._wait_for_query(payload["query"]["queryId"], timeout)
+        response = self._open_query_results(payload["query"]["id"])
+
+        def read_chunks() -> Iterator[pd.DataFrame]:
+            with response:
+                yield from pd.read_csv(response.raw, chunksize=chunk_size)
+
+        return read_chunks()
+
+    def run_query_arrow(  # pylint: disable=too-many-arguments
+        self,
+        database_id: int,
+        sql: str,
+        schema: Optional[str] = None,
+        limit: Optional[int] = 1000,
+        run_async: bool = False,
+        timeout: Optional[float] = None,
+    ) -> "pa.RecordBatchReader":
+        """
+        Run a SQL query, returning the results as a reader of Arrow record batches.
+
+        Synchronous results are converted column by column from the JSON payload,
+        parsing temporal columns into timestamps. With ``run_async`` the query runs
+        like in ``run_query_async``, and the results are parsed incrementally from
+        the CSV export; in that case column types are inferred from the first block.
+        """
+        check_pyarrow()
+
+        payload = self._run_query(database_id, sql, schema, limit, run_async)
+        if "data" in payload:
+            table = convert_to_arrow_table(payload["data"], payload["columns"])
+            return pa.RecordBatchReader.from_batches(table.schema, table.to_batches())
+
+        self._wait_for_query(payload["query"]["queryId"], timeout)
+        return read_csv_batches(self._open_query_results(payload["query"]["id"]))
+
+    def _wait_for_query(
+        self,
+        query_id: int,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Poll an async query until it finishes, returning it.
+
+        Raises an exception if the query didn't succeed.
+        """
+        url = self.baseurl / "api/v1/query" / str(query_id)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = QUERY_POLL_INTERVAL
+        while True:
+            _logger.debug("GET %s", url)
+            response = self.session.get(url)
+            validate_response(response)
+            query = response.json()["result"]
+            if query["status"] == "success":
+                return query
+            if query["status"] in QUERY_FINISHED_STATUSES:
+                raise SupersetError(
+                    errors=[
+                        {
+                            "message": query.get("error_message")
+                            or f"Query finished with status {query['status']}",
+                            "error_type": "GENERIC_DB_ENGINE_ERROR",
+                            "level": ErrorLevel.ERROR,
+                        },
+                    ],
+                )
+
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise SupersetError(
+                    errors=[
+                        {
+                            "message": f"Query {query_id} is still {query['status']}",
+                            "error_type": "SQLLAB_TIMEOUT_ERROR",
+                            "level": ErrorLevel.ERROR,
+                        },
+                    ],
+                )
+
+            time.sleep(delay)
+            delay = min(delay * 2, MAX_QUERY_POLL_INTERVAL)
+
+    def _open_query_results(self, client_id: str) -> Response:
+        """
+        Start streaming the results of a finished query as CSV.
+        """
+        url = self.baseurl / "api/v1/sqllab/export" / f"{client_id}/"
+        _logger.debug("GET %s", url)
+        response = self.session.get(url, stream=True)
+
+        # Legacy superset installations don't have the SQL API endpoint yet
+        if response.status_code == 404:
+            response.close()
+            url = self.baseurl / "superset/csv" / client_id
+            _logger.debug("GET %s", url)
+            response = self.session.get(url, stream=True)
+
+        try:
+            validate_response(response)
+        except SupersetError:
+            response.close()
+            raise
+        response.raw.decode_content = True
+
+        return response
+
+    def _run_query(  # pylint: disable=too-many-arguments
+        self,
+        database_id: int,
+        sql: str,
+        schema: Optional[str] = None,
+        limit: Optional[int] = 1000,
+        run_async: bool = False,
     ) -> Dict[str, Any]:
         url = self.baseurl / "api/v1/sqllab/execute/"
-        data = {
-            "client_id": shortid()[:10],
-            "database_id": database_id,
-            "runAsync": False,
-            "schema": schema,
-            "sql": sql,
-            "sql_editor_id": "1",
-            "tab": "Untitled Query 2",
-            "tmp_table_name": "",
-            "select_as_cta": False,
-            "ctas_method": "TABLE",
-            "queryLimit": limit,
-            "expand_data": True,
-        }
+        data = build_query_payload(database_id, sql, schema, limit, run_async)
         headers = {
             "Accept": "application/json",
         }
@@ -323,86 +880,111 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         having: str = "",
         row_limit: int = 10000,
         force: bool = False,
+        window: Optional[int] = None,
     ) -> pd.DataFrame:
         """
         Run a dimensional query.
+
+        If ``window`` is passed the time range ``[start, end)`` is split into windows
+        of that many time grains, aligned with ``granularity``. The windows are queried
+        concurrently, and their results are concatenated in time order. Windows with
+        results truncated by ``row_limit`` are logged, and listed in the
+        ``truncated_windows`` attribute of the dataframe.
         """
-        dataset = self.get_dataset(dataset_id)
+        query: DataQueryType = {
+            "metrics": metrics,
+            "columns": columns,
+            "order_by": order_by,
+            "order_desc": order_desc,
+            "is_timeseries": is_timeseries,
+            "time_column": time_column,
+            "start": start,
+            "end": end,
+            "granularity": granularity,
+            "where": where,
+            "having": having,
+            "row_limit": row_limit,
+        }
 
-        if time_column is None:
-            time_columns = [
-                column["column_name"]
-                for column in dataset["columns"]
-                if column["is_dttm"]
-            ]
-            if len(time_columns) > 1:
-                options = ", ".join(time_columns)
-                raise Exception(
-                    f"Unable to determine time column, please pass `time_series` "
-                    f"as one of: {options}",
-                )
-            time_column = time_columns[0]
+        if window is not None:
+            return self._get_data_windowed(dataset_id, query, force, window)
 
-        time_range = (
-            "No filter"
-            if start is None and end is None
-            else f"{start or ''} : {end or ''}"
-        )
+        return self.get_data_batch(dataset_id, [query], force)[0]
 
-        # convert adhoc metrics to a proper object, if needed
-        metric_names = [metric["metric_name"] for metric in dataset["metrics"]]
-        processed_metrics = [
-            metric if metric in metric_names else convert_to_adhoc_metric(metric)
-            for metric in metrics
-        ]
+    def _get_data_windowed(  # pylint: disable=too-many-locals
+        self,
+        dataset_id: int,
+        query: DataQueryType,
+        force: bool,
+        window: int,
+    ) -> pd.DataFrame:
+        """
+        Run a dimensional query in concurrent time windows.
+        """
+        start = query.get("start")
+        end = query.get("end")
+        granularity = query.get("granularity")
+        if start is None or end is None or granularity is None:
+            raise ValueError(
+                "Splitting a query in time windows requires `start`, `end`, "
+                "and `granularity`",
+            )
 
-        # same for columns
-        column_names = [column["column_name"] for column in dataset["columns"]]
-        processed_columns = [
-            column if column in column_names else convert_to_adhoc_column(column)
-            for column in columns
-        ]
+        windows = build_time_windows(start, end, granularity, window)
+        if not windows:
+            return self.get_data_batch(dataset_id, [query], force)[0]
 
-        # and order bys
-        processed_orderbys = [
-            (
-                (orderby, not order_desc)
-                if orderby in metric_names
-                else (convert_to_adhoc_metric(orderby), not order_desc)
-            )
-            for orderby in (order_by or [])
+        def get_window(bounds: Tuple[datetime, datetime]) -> pd.DataFrame:
+            window_query = query.copy()
+            window_query["start"], window_query["end"] = bounds
+            return self.get_data_batch(dataset_id, [window_query], force)[0]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(get_window, windows))
+
+        row_limit = query.get("row_limit", 10000)
+        truncated_windows = [
+            bounds
+            for bounds, result in zip(windows, results)
+            if len(result) >= row_limit
         ]
+        for window_start, window_end in truncated_windows:
+            _logger.warning(
+                "Results from %s to %s were truncated at %d rows",
+                window_start,
+                window_end,
+                row_limit,
+            )
 
-        url = self.baseurl / "api/v1/chart/data"
-        data: Dict[str, Any] = {
-            "datasource": {"id": dataset_id, "type": "table"},
-            "force": force,
-            "queries": [
-                {
-                    "annotation_layers": [],
-                    "applied_time_extras": {},
-                    "columns": processed_columns,
-                    "custom_form_data": {},
-                    "custom_params": {},
-                    "extras": {"having": having, "having_druid": [], "where": where},
-                    "filters": [],
-                    "is_timeseries": is_timeseries,
-                    "metrics": processed_metrics,
-                    "order_desc": order_desc,
-                    "orderby": processed_orderbys,
-                    "row_limit": row_limit,
-                    "time_range": time_range,
-                    "timeseries_limit": 0,
-                    "url_params": {},
-                },
-            ],
-            "result_format": "json",
-            "result_type": "full",
-        }
+        dataframe = pd.concat(results, ignore_index=True)
+        dataframe.attrs["truncated_windows"] = truncated_windows
 
-        if is_timeseries:
-            data["queries"][0]["granularity"] = time_column
-            data["queries"][0]["extras"]["time_grain_sqla"] = granularity
+        return dataframe
+
+    def get_data_batch(
+        self,
+        dataset_id: int,
+        queries: List[DataQueryType],
+        force: bool = False,
+    ) -> List[pd.DataFrame]:
+        """
+        Run dimensional queries against a dataset in a single request.
+
+        Each query has the arguments of ``get_data``, and a dataframe is returned for
+        each one, in order. The dataset is fetched once for all the queries, and reused
+        in later calls while the client memoizes resources.
+        """
+        if not queries:
+            return []
+
+        dataset = self.get_dataset(dataset_id)
+
+        url = self.baseurl / "api/v1/chart/data"
+        data = build_data_batch_payload(
+            dataset_id,
+            [build_data_query(dataset, **query) for query in queries],
+            force,
+        )
 
         headers = {
             "Accept": "application/json",
@@ -415,16 +997,99 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
 
         payload = response.json()
 
-        return pd.DataFrame(payload["result"][0]["data"])
+        return [pd.DataFrame(result["data"]) for result in payload["result"]]
+
+    def get_data_arrow(
+        self,
+        dataset_id: int,
+        metrics: List[str],
+        columns: List[str],
+        **kwargs: Any,
+    ) -> "pa.RecordBatchReader":
+        """
+        Run a dimensional query, returning a reader of Arrow record batches.
+
+        Takes the same arguments as ``get_data``. The results are requested as CSV,
+        and parsed incrementally as they're downloaded.
+        """
+        check_pyarrow()
+
+        dataset = self.get_dataset(dataset_id)
+
+        url = self.baseurl / "api/v1/chart/data"
+        data = build_data_payload(
+            dataset_id,
+            dataset,
+            metrics,
+            columns,
+            result_format="csv",
+            **kwargs,
+        )
+
+        _logger.debug("POST %s\n%s", url, json.dumps(data, indent=4))
+        response = self.session.post(url, json=data, stream=True)
+        try:
+            validate_response(response)
+        except SupersetError:
+            response.close()
+            raise
+        response.raw.decode_content = True
+
+        return read_csv_batches(response)
+
+    def _get_cached(self, url: URL) -> Response:
+        """
+        GET a URL, going through the HTTP cache if there's one.
+        """
+        scope = self.auth.get_scope() if self.cache else None
+        if self.cache is None or scope is None:
+            return self.session.get(url)
+
+        return self.cache.get(self.session, url, scope)
+
+    def _invalidate_cached(self, url: URL) -> None:
+        """
+        Remove a URL from the HTTP cache, after the resource was modified.
+        """
+        scope = self.auth.get_scope() if self.cache else None
+        if self.cache is not None and scope is not None:
+            self.cache.invalidate(url, scope)
+
+    def _memoize(
+        self,
+        resource_name: str,
+        key: Hashable,
+        function: Callable[[], Any],
+    ) -> Any:
+        """
+        Call ``function``, reusing results from this run if memoization is enabled.
+        """
+        if self.memo is None:
+            return function()
+        return self.memo.get(resource_name, key, function)
+
+    def _invalidate_memo(self, resource_name: Optional[str] = None) -> None:
+        """
+        Forget memoized reads of a resource, or of all resources.
+        """
+        if self.memo is not None:
+            self.memo.invalidate(resource_name)
 
     def get_resource(self, resource_name: str, resource_id: int) -> Any:
         """
         Return a single resource.
         """
+        return self._memoize(
+            resource_name,
+            ("resource", resource_id),
+            lambda: self._get_resource(resource_name, resource_id),
+        )
+
+    def _get_resource(self, resource_name: str, resource_id: int) -> Any:
         url = self.baseurl / "api/v1" / resource_name / str(resource_id)
 
         _logger.debug("GET %s", url)
-        response = self.session.get(url)
+        response = self._get_cached(url)
         validate_response(response)
 
         resource = response.json()["result"]
@@ -434,40 +1099,103 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
     def get_resources(
         self,
         resource_name: str,
-        order_column: str = "changed_on_delta_humanized",
+        order_column: str = DEFAULT_ORDER_COLUMN,
+        columns: Optional[List[str]] = None,
         **kwargs: Any,
     ) -> List[Any]:
         """
         Return one or more of a resource, possibly filtered.
+
+        Full scans (no filters and the default order) use keyset pagination: see
+        ``_get_resources_by_id``. Otherwise the first page is used to read the total
+        ``count``; the remaining pages are then fetched concurrently and merged in
+        order. Older versions of Superset that don't return a count are paginated
+        serially until an empty page.
+
+        When ``columns`` is passed only those columns are requested, reducing the
+        payload; related columns use dots (eg, ``owners.id``). Superset ignores
+        columns that are not in the default listing.
         """
-        resources = []
         operations = {
             k: v if isinstance(v, Operator) else Equal(v) for k, v in kwargs.items()
         }
+        filters = [
+            dict(col=col, opr=value.operator, value=value.value)
+            for col, value in operations.items()
+        ]
 
-        # paginate endpoint until no results are returned
-        page = 0
-        while True:
-            query = prison.dumps(
-                {
-                    "filters": [
-                        dict(col=col, opr=value.operator, value=value.value)
-                        for col, value in operations.items()
-                    ],
-                    "order_column": order_column,
-                    "order_direction": "desc",
-                    "page": page,
-                    "page_size": MAX_PAGE_SIZE,
-                },
-            )
-            url = self.baseurl / "api/v1" / resource_name / "" % {"q": query}
+        return self._memoize(
+            resource_name,
+            (
+                "resources",
+                order_column,
+                json.dumps(filters, default=str),
+                tuple(columns) if columns else None,
+            ),
+            lambda: self._get_resources(resource_name, filters, order_column, columns),
+        )
 
-            _logger.debug("GET %s", url)
-            response = self.session.get(url)
-            validate_response(response)
+    def _get_resources(
+        self,
+        resource_name: str,
+        filters: List[Dict[str, Any]],
+        order_column: str,
+        columns: Optional[List[str]] = None,
+    ) -> List[Any]:
+        if (
+            self.keyset_pagination
+            and not filters
+            and order_column == DEFAULT_ORDER_COLUMN
+            and resource_name not in self._no_keyset
+        ):
+            resources = self._get_resources_by_id(resource_name, columns)
+            if resources is not None:
+                return resources
+            self._no_keyset.add(resource_name)
+
+        payload = self._get_resources_page(
+            resource_name,
+            filters,
+            order_column,
+            0,
+            columns,
+        )
+        resources = list(payload["result"])
+        if not resources:
+            return resources
+
+        page = 1
+        if "count" in payload and self.max_workers > 1:
+            pages = -(-payload["count"] // MAX_PAGE_SIZE)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = executor.map(
+                    lambda page_: self._get_resources_page(
+                        resource_name,
+                        filters,
+                        order_column,
+                        page_,
+                        columns,
+                    )["result"],
+                    range(1, pages),
+                )
+                for result in results:
+                    resources.extend(result)
 
-            payload = response.json()
+            # if we got more resources than the original count some were created
+            # while listing, and we need to continue paginating serially
+            if len(resources) <= payload["count"]:
+                return resources
+            page = pages
 
+        # paginate endpoint until no results are returned
+        while True:
+            payload = self._get_resources_page(
+                resource_name,
+                filters,
+                order_column,
+                page,
+                columns,
+            )
             if not payload["result"]:
                 break
 
@@ -476,11 +1204,98 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
 
         return resources
 
+    def _get_resources_by_id(
+        self,
+        resource_name: str,
+        columns: Optional[List[str]] = None,
+    ) -> Optional[List[Any]]:
+        """
+        Return all resources using keyset pagination.
+
+        Resources are ordered by ID, and each page is filtered to IDs greater than
+        the last one seen. Deep pages are as fast as the first one, and resources
+        modified while listing don't shift between pages, so each one is returned
+        exactly once.
+
+        Returns ``None`` if the server doesn't support ordering or filtering by ID.
+        """
+        if columns and "id" not in columns:
+            columns = [*columns, "id"]
+
+        resources: List[Any] = []
+        filters: List[Dict[str, Any]] = []
+        last_id: Optional[int] = None
+        while True:
+            try:
+                payload = self._get_resources_page(
+                    resource_name,
+                    filters,
+                    "id",
+                    0,
+                    columns,
+                    order_direction="asc",
+                )
+            except SupersetError:
+                if last_id is not None:
+                    raise
+                _logger.debug("Unable to list %s by ID", resource_name)
+                return None
+
+            if not payload["result"]:
+                return resources
+
+            ids = payload.get("ids") or [
+                resource["id"] for resource in payload["result"]
+            ]
+            if last_id is not None and min(ids) <= last_id:
+                _logger.warning(
+                    "Server ignored the ID filter when listing %s, falling back "
+                    "to offset pagination",
+                    resource_name,
+                )
+                return None
+
+            resources.extend(payload["result"])
+            last_id = max(ids)
+            operator = GreaterThan(last_id)
+            filters = [dict(col="id", opr=operator.operator, value=operator.value)]
+
+    def _get_resources_page(  # pylint: disable=too-many-arguments
+        self,
+        resource_name: str,
+        filters: List[Dict[str, Any]],
+        order_column: str,
+        page: int,
+        columns: Optional[List[str]] = None,
+        order_direction: str = "desc",
+    ) -> Dict[str, Any]:
+        """
+        Return a single page of a resource listing.
+        """
+        params: Dict[str, Any] = {
+            "filters": filters,
+            "order_column": order_column,
+            "order_direction": order_direction,
+            "page": page,
+            "page_size": MAX_PAGE_SIZE,
+        }
+        if columns:
+            params["columns"] = columns
+        query = prison.dumps(params)
+        url = self.baseurl / "api/v1" / resource_name / "" % {"q": query}
+
+        _logger.debug("GET %s", url)
+        response = self.session.get(url)
+        validate_response(response)
+
+        return response.json()
+
     def create_resource(self, resource_name: str, **kwargs: Any) -> Any:
         """
         Create a resource.
         """
         url = self.baseurl / "api/v1" / resource_name / ""
+        self._invalidate_memo(resource_name)
 
         _logger.debug("POST %s\n%s", url, json.dumps(kwargs, indent=4))
         response = self.session.post(url, json=kwargs)
@@ -501,6 +1316,8 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         Update a resource.
         """
         url = self.baseurl / "api/v1" / resource_name / str(resource_id)
+        self._invalidate_cached(url)
+        self._invalidate_memo(resource_name)
         if query_args:
             url %= query_args
 
@@ -517,6 +1334,8 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         Delete a resource.
         """
         url = self.baseurl / "api/v1" / resource_name / str(resource_id)
+        self._invalidate_cached(url)
+        self._invalidate_memo(resource_name)
 
         response = self.session.delete(url)
         validate_response(response)
@@ -527,9 +1346,16 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         """
         query = prison.dumps({"keys": list(kwargs["keys"])} if "keys" in kwargs else {})
 
+        return self._memoize(
+            resource_name,
+            ("info", query),
+            lambda: self._get_resource_endpoint_info(resource_name, query),
+        )
+
+    def _get_resource_endpoint_info(self, resource_name: str, query: str) -> Any:
         url = self.baseurl / "api/v1" / resource_name / "_info" % {"q": query}
         _logger.debug("GET %s", url)
-        response = self.session.get(url)
+        response = self._get_cached(url)
         validate_response(response)
 
         endpoint_info = response.json()
@@ -571,7 +1397,7 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
 
         return resource
 
-    def get_databases(self, **kwargs: str) -> List[Any]:
+    def get_databases(self, **kwargs: Any) -> List[Any]:
         """
         Return databases, possibly filtered.
         """
@@ -607,7 +1433,7 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         resource = response.json()
         return resource
 
-    def get_datasets(self, **kwargs: str) -> List[Any]:
+    def get_datasets(self, **kwargs: Any) -> List[Any]:
         """
         Return datasets, possibly filtered.
         """
@@ -663,6 +1489,7 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         data = {"data": json.dumps(payload)}
 
         url = self.baseurl / "superset/sqllab_viz/"
+        self._invalidate_memo("dataset")
         _logger.debug("POST %s\n%s", url, json.dumps(data, indent=4))
         response = self.session.post(url, data=data)
         validate_response(response)
@@ -690,7 +1517,7 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         """
         return self.get_resource("chart", chart_id)
 
-    def get_charts(self, **kwargs: str) -> List[Any]:
+    def get_charts(self, **kwargs: Any) -> List[Any]:
         """
         Return charts, possibly filtered.
         """
@@ -726,7 +1553,7 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         """
         return self.get_resource("dashboard", dashboard_id)
 
-    def get_dashboards(self, **kwargs: str) -> List[Any]:
+    def get_dashboards(self, **kwargs: Any) -> List[Any]:
         """
         Return dashboards, possibly filtered.
         """
@@ -750,7 +1577,7 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         """
         self.delete_resource("dashboard", dashboard_id)
 
-    def get_users(self, **kwargs: str) -> List[Any]:
+    def get_users(self, **kwargs: Any) -> List[Any]:
         """
         Return users, possibly filtered.
         """
@@ -762,7 +1589,7 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         """
         return self.get_resource("report", report_id)
 
-    def get_reports(self, **kwargs: str) -> List[Any]:
+    def get_reports(self, **kwargs: Any) -> List[Any]:
         """
         Return reports, possibly filtered.
         """
@@ -780,29 +1607,78 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         """
         return self.update_resource("report", report_id, **kwargs)
 
-    def export_zip(self, resource_name: str, ids: List[int]) -> BytesIO:
+    def export_zip(self, resource_name: str, ids: List[int]) -> IO[bytes]:
         """
         Export one or more of a resource.
+
+        Resources are exported in chunks of ``MAX_IDS_IN_EXPORT``, downloaded
+        concurrently. Each response is streamed to a temporary file, and its members
+        are copied to the bundle in the order of the chunks, without recompressing
+        them, so memory use doesn't grow with the export. Dependencies shared by
+        resources in different chunks are only written once.
+
+        Returns a temporary file with the bundle, deleted when it's closed.
         """
         url = self.baseurl / "api/v1" / resource_name / "export/"
+        pages = [
+            ids[i : i + MAX_IDS_IN_EXPORT]
+            for i in range(0, len(ids), MAX_IDS_IN_EXPORT)
+        ]
 
-        buf = BytesIO()
-        with ZipFile(buf, "w") as bundle:
-            while ids:
-                page, ids = ids[:MAX_IDS_IN_EXPORT], ids[MAX_IDS_IN_EXPORT:]
-                params = {"q": prison.dumps(page)}
-                _logger.debug("GET %s", url % params)
-                response = self.session.get(url, params=params)
-                validate_response(response)
+        output = tempfile.TemporaryFile()
+        try:
+            with ZipFile(output, "w") as bundle:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = [
+                        executor.submit(self._export_zip_chunk, url, page)
+                        for page in pages
+                    ]
+                    try:
+                        # the root directory has a timestamp, so it can differ between
+                        # chunks and is ignored when looking for shared dependencies
+                        seen: Set[str] = set()
+                        for future in futures:
+                            with future.result() as chunk, ZipFile(chunk) as subset:
+                                for info in subset.infolist():
+                                    name = info.filename.split("/", 1)[-1]
+                                    if name not in seen:
+                                        seen.add(name)
+                                        copy_zip_member(subset, info, bundle)
+                    finally:
+                        # on errors, discard the chunks that were not copied yet
+                        for future in futures:
+                            future.cancel()
+                        for future in futures:
+                            if not future.cancelled() and not future.exception():
+                                future.result().close()
+        except BaseException:
+            output.close()
+            raise
+
+        output.seek(0)
+
+        return output
+
+    def _export_zip_chunk(self, url: URL, ids: List[int]) -> IO[bytes]:
+        """
+        Stream the export of a chunk of IDs to a temporary file.
+        """
+        params = {"q": prison.dumps(ids)}
+        _logger.debug("GET %s", url % params)
 
-                # write files from response to main ZIP bundle
-                with ZipFile(BytesIO(response.content)) as subset:
-                    for name in subset.namelist():
-                        bundle.writestr(name, subset.read(name))
+        chunk = tempfile.TemporaryFile()
+        try:
+            with self.session.get(url, params=params, stream=True) as response:
+                validate_response(response)
+                for data in response.iter_content(EXPORT_CHUNK_SIZE):
+                    chunk.write(data)
+        except BaseException:
+            chunk.close()
+            raise
 
-        buf.seek(0)
+        chunk.seek(0)
 
-        return buf
+        return chunk
 
     def get_uuids(
         self,
@@ -812,62 +1688,120 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         """
         Get UUID of a list of resources, possibly filtering by IDs.
 
-        This method is very inneficient, but it's the only way to get the mapping
-        between IDs and UUIDs in older versions of Superset.
+        This is the only way to get the mapping between IDs and UUIDs in older
+        versions of Superset. Resources are exported in concurrent batches of
+        ``MAX_IDS_IN_EXPORT``, and the primary resource of each YAML file is matched
+        back to its ID by name; IDs that can't be resolved from their batch (because
+        the export failed or the name is ambiguous) are exported individually.
 
         #TODO: Rely on UUIDs from API responses
         """
-        url = self.baseurl / "api/v1" / resource_name / "export/"
-
-        uuids: Dict[int, UUID] = {}
+        # only the ID and the names used to match exported configs are needed
+        columns = ["id", *NAME_KEYS.get(resource_name, ())]
         resources = (
-            self.get_resources(resource_name, id=In(list(ids)))
+            self.get_resources(resource_name, columns=columns, id=In(list(ids)))
             if ids
-            else self.get_resources(resource_name)
+            else self.get_resources(resource_name, columns=columns)
         )
-        for resource in resources:
-            id_ = resource["id"]
-            params = {"q": prison.dumps([id_])}
-            _logger.debug("GET %s", url % params)
-            response = self.session.get(url, params=params)
+        chunks = [
+            resources[i : i + MAX_IDS_IN_EXPORT]
+            for i in range(0, len(resources), MAX_IDS_IN_EXPORT)
+        ]
 
-            with ZipFile(BytesIO(response.content)) as export:
-                for name in export.namelist():
-                    config = yaml.load(export.read(name), Loader=yaml.SafeLoader)
-                    name = remove_root(name)
-                    if name.startswith(resource_name):
-                        uuids[id_] = UUID(config["uuid"])
+        uuids: Dict[int, UUID] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for chunk, chunk_uuids in zip(
+                chunks,
+                executor.map(
+                    lambda chunk: self._get_uuids_batch(resource_name, chunk),
+                    chunks,
+                ),
+            ):
+                uuids.update(chunk_uuids)
+                for resource in chunk:
+                    if resource["id"] not in uuids:
+                        if uuid_ := self._get_uuid(resource_name, resource["id"]):
+                            uuids[resource["id"]] = uuid_
 
         return uuids
 
+    def _get_uuids_batch(
+        self,
+        resource_name: str,
+        resources: List[Dict[str, Any]],
+    ) -> Dict[int, UUID]:
+        """
+        Get the UUIDs of a batch of resources from a single export.
+
+        Returns an empty dictionary if the export fails.
+        """
+        url = self.baseurl / "api/v1" / resource_name / "export/"
+        params = {"q": prison.dumps([resource["id"] for resource in resources])}
+        _logger.debug("GET %s", url % params)
+        try:
+            response = self.session.get(url, params=params)
+            validate_response(response)
+            configs = list(iter_primary_configs(resource_name, response.content))
+        except Exception:  # pylint: disable=broad-except
+            _logger.warning(
+                "Unable to export %s in batch, falling back to individual exports",
+                resource_name,
+            )
+            return {}
+
+        return match_configs_to_ids(resource_name, resources, configs)
+
+    def _get_uuid(self, resource_name: str, id_: int) -> Optional[UUID]:
+        """
+        Get the UUID of a single resource by exporting it.
+        """
+        url = self.baseurl / "api/v1" / resource_name / "export/"
+        params = {"q": prison.dumps([id_])}
+        _logger.debug("GET %s", url % params)
+        response = self.session.get(url, params=params)
+
+        uuid_ = None
+        for _, config in iter_primary_configs(resource_name, response.content):
+            uuid_ = UUID(config["uuid"])
+
+        return uuid_
+
     def import_zip(
         self,
         resource_name: str,
-        form_data: BytesIO,
+        form_data: IO[bytes],
         overwrite: bool = False,
     ) -> bool:
         """
         Import a ZIP bundle.
+
+        The bundle is streamed in the body of the request, read from its current
+        position.
         """
         key = "bundle" if resource_name == "assets" else "formData"
-        files = {key: form_data}
         url = self.baseurl / "api/v1" / resource_name / "import/"
 
         self.session.headers.update({"Accept": "application/json"})
         data = {"overwrite": json.dumps(overwrite)}
         _logger.debug("POST %s\n%s", url, json.dumps(data, indent=4))
+        body = MultipartBody(data, {key: form_data})
         response = self.session.post(
             url,
-            files=files,
-            data=data,
+            data=body,
+            headers={"Content-Type": body.content_type},
         )
         validate_response(response)
 
+        # an import can modify any number of resources
+        if self.cache:
+            self.cache.clear()
+        self._invalidate_memo()
+
         payload = response.json()
 
         return payload["message"] == "OK"
 
-    def get_rls(self, **kwargs: str) -> List[Any]:
+    def get_rls(self, **kwargs: Any) -> List[Any]:
         """
         Return RLS rules, possibly filtered.
         """
@@ -1160,11 +2094,13 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
 
                 update_url = self.baseurl / "roles/edit" / str(role_id)
                 _logger.debug("POST %s\n%s", update_url, json.dumps(data, indent=4))
+                self._invalidate_memo()
                 response = self.session.post(update_url, data=data)
                 validate_response(response)
                 return
 
         _logger.debug("POST %s\n%s", url, json.dumps(data, indent=4))
+        self._invalidate_memo()
         response = self.session.post(url, data=data)
         validate_response(response)
 
@@ -1207,6 +2143,7 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
             "clause": rls["clause"],
         }
         _logger.debug("POST %s\n%s", url, json.dumps(data, indent=4))
+        self._invalidate_memo("rowlevelsecurity")
         response = self.session.post(url, data=data)
         validate_response(response)
 
@@ -1270,10 +2207,15 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
             "dashboard": "dashboard_title",
         }[resource_name]
 
+        columns = ["id", name_key, "owners.id", "owners.first_name", "owners.last_name"]
         resources = (
-            self.get_resources(resource_name, id=In(list(requested_ids)))
+            self.get_resources(
+                resource_name,
+                columns=columns,
+                id=In(list(requested_ids)),
+            )
             if requested_ids
-            else self.get_resources(resource_name)
+            else self.get_resources(resource_name, columns=columns)
         )
         for resource in resources:
             info: OwnershipType = {
@@ -1349,4 +2291,5 @@ class SupersetClient:  # pylint: disable=too-many-public-methods
         data.update(kwargs)
 
         _logger.debug("POST %s\n%s", url, json.dumps(data, indent=4))
+        self._invalidate_memo()
         self.session.post(url, data=data)
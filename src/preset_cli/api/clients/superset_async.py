@@ -0,0 +1,485 @@
+"""
+An asyncio client for Superset, mirroring ``SupersetClient``:
+
+    >>> import asyncio
+    >>> from yarl import URL
+    >>> from preset_cli.api.clients.superset_async import AsyncSupersetClient
+    >>> from preset_cli.auth.superset import UsernamePasswordAuth
+    >>> url = URL("http://localhost:8088/")
+    >>> auth = UsernamePasswordAuth(url, "admin", "admin")  # doctest: +SKIP
+    >>> async def main():
+    ...     async with AsyncSupersetClient(url, auth) as client:
+    ...         return await asyncio.gather(
+    ...             *(client.get_resource("chart", id_) for id_ in range(1, 1001))
+    ...         )
+    >>> charts = asyncio.run(main())  # doctest: +SKIP
+
+The client uses the same ``Auth`` objects as the synchronous client: headers and
+cookies are copied from the auth session, and on a 401 the auth is refreshed (once,
+regardless of how many requests failed concurrently) and the request is retried.
+"""
+
+import asyncio
+import json
+import logging
+from io import BytesIO
+from types import TracebackType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, Union, cast
+from zipfile import ZipFile
+
+import aiohttp
+import pandas as pd
+import prison
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from yarl import URL
+
+from preset_cli import __version__
+from preset_cli.api.clients.superset import (
+    MAX_IDS_IN_EXPORT,
+    MAX_PAGE_SIZE,
+    build_data_payload,
+    build_query_payload,
+)
+from preset_cli.api.operators import Equal, Operator
+from preset_cli.auth.main import Auth
+from preset_cli.lib import validate_response
+
+_logger = logging.getLogger(__name__)
+
+MAX_CONNECTIONS = 100
+
+
+class BufferedResponse:
+    """
+    A fully read response, with the parts of ``requests.Response`` used for validation.
+    """
+
+    def __init__(self, status: int, headers: Mapping[str, str], content: bytes):
+        self.status_code = status
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self) -> bool:  # pylint: disable=invalid-name
+        """
+        Return if the request was successful.
+        """
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        """
+        Return the body as text.
+        """
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """
+        Return the body decoded as JSON.
+        """
+        return json.loads(self.content)
+
+
+class AsyncSupersetClient:
+    """
+    An asyncio client for Superset.
+
+    The client should be used as an async context manager, or closed with ``close``.
+    """
+
+    def __init__(
+        self,
+        baseurl: Union[str, URL],
+        auth: Auth,
+        max_connections: int = MAX_CONNECTIONS,
+    ):
+        # convert to URL if necessary
+        self.baseurl = URL(baseurl)
+        self.auth = auth
+        self.max_connections = max_connections
+
+        self.headers: Dict[str, str] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._auth_lock = asyncio.Lock()
+        self._auth_generation = 0
+
+    async def __aenter__(self) -> "AsyncSupersetClient":
+        await self._get_session()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the underlying HTTP session.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+            )
+            await self._sync_auth()
+
+        return self._session
+
+    async def _sync_auth(self) -> None:
+        """
+        Copy headers and cookies from the auth session.
+
+        ``get_headers`` might do blocking requests (eg, to fetch a CSRF token), so it
+        runs in a thread.
+        """
+        auth_headers = await asyncio.to_thread(self.auth.get_headers)
+        self.auth.session.headers.update(auth_headers)
+
+        self.headers = {
+            key: value
+            for key, value in self.auth.session.headers.items()
+            if key.lower() != "connection"
+        }
+        self.headers.update(
+            {
+                "Referer": str(self.baseurl),
+                "User-Agent": f"Apache Superset Client ({__version__})",
+                "Accept": "application/json",
+            },
+        )
+        cast(aiohttp.ClientSession, self._session).cookie_jar.update_cookies(
+            self.auth.session.cookies.get_dict(),
+            response_url=self.baseurl,
+        )
+
+    async def _reauth(self, generation: int) -> bool:
+        """
+        Re-authenticate after a 401, returning if the request should be retried.
+
+        Only the first request to fail in a given generation re-authenticates; the
+        others wait for it and reuse the new credentials.
+        """
+        async with self._auth_lock:
+            if generation == self._auth_generation:
+                try:
+                    await asyncio.to_thread(self.auth.auth)
+                except NotImplementedError:
+                    return False
+                self._auth_generation += 1
+                await self._sync_auth()
+
+        return True
+
+    async def _request(
+        self,
+        method: str,
+        url: URL,
+        payload: Optional[Any] = None,
+        form: Optional[Dict[str, Any]] = None,
+    ) -> BufferedResponse:
+        """
+        Send a request, re-authenticating and retrying once on a 401.
+
+        Form fields can be a string, or a tuple with a file name and its content.
+        """
+        session = await self._get_session()
+        generation = self._auth_generation
+        response = await self._send(session, method, url, payload, form)
+        if response.status_code == 401 and await self._reauth(generation):
+            response = await self._send(session, method, url, payload, form)
+
+        return response
+
+    async def _send(  # pylint: disable=too-many-arguments
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: URL,
+        payload: Optional[Any] = None,
+        form: Optional[Dict[str, Any]] = None,
+    ) -> BufferedResponse:
+        data = None
+        if form is not None:
+            # form data can only be sent once, so it's built for every attempt
+            data = aiohttp.FormData()
+            for name, value in form.items():
+                if isinstance(value, tuple):
+                    filename, content = value
+                    data.add_field(name, content, filename=filename)
+                else:
+                    data.add_field(name, value)
+
+        async with session.request(
+            method,
+            url,
+            json=payload,
+            data=data,
+            headers=self.headers,
+        ) as response:
+            return BufferedResponse(
+                response.status,
+                CaseInsensitiveDict(response.headers),
+                await response.read(),
+            )
+
+    @staticmethod
+    def _validate(response: BufferedResponse) -> None:
+        validate_response(cast(Response, response))
+
+    async def run_query(
+        self,
+        database_id: int,
+        sql: str,
+        schema: Optional[str] = None,
+        limit: int = 1000,
+    ) -> pd.DataFrame:
+        """
+        Run a SQL query, returning a Pandas dataframe.
+        """
+        url = self.baseurl / "api/v1/sqllab/execute/"
+        data = build_query_payload(database_id, sql, schema, limit)
+
+        _logger.debug("POST %s\n%s", url, json.dumps(data, indent=4))
+        response = await self._request("POST", url, payload=data)
+
+        # Legacy superset installations don't have the SQL API endpoint yet
+        if response.status_code == 404:
+            url = self.baseurl / "superset/sql_json/"
+            _logger.debug("POST %s\n%s", url, json.dumps(data, indent=4))
+            response = await self._request("POST", url, payload=data)
+
+        self._validate(response)
+
+        return pd.DataFrame(response.json()["data"])
+
+    async def get_data(
+        self,
+        dataset_id: int,
+        *args: Any,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """
+        Run a dimensional query.
+
+        Takes the same arguments as ``SupersetClient.get_data``.
+        """
+        dataset = await self.get_dataset(dataset_id)
+
+        url = self.baseurl / "api/v1/chart/data"
+        data = build_data_payload(dataset_id, dataset, *args, **kwargs)
+
+        _logger.debug("POST %s\n%s", url, json.dumps(data, indent=4))
+        response = await self._request("POST", url, payload=data)
+        self._validate(response)
+
+        return pd.DataFrame(response.json()["result"][0]["data"])
+
+    async def get_resource(self, resource_name: str, resource_id: int) -> Any:
+        """
+        Return a single resource.
+        """
+        url = self.baseurl / "api/v1" / resource_name / str(resource_id)
+
+        _logger.debug("GET %s", url)
+        response = await self._request("GET", url)
+        self._validate(response)
+
+        return response.json()["result"]
+
+    async def get_resources(
+        self,
+        resource_name: str,
+        order_column: str = "changed_on_delta_humanized",
+        columns: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        Return one or more of a resource, possibly filtered.
+
+        The first page is used to read the total ``count``; the remaining pages are
+        then fetched concurrently and merged in order. Older versions of Superset
+        that don't return a count are paginated serially until an empty page.
+
+        When ``columns`` is passed only those columns are requested.
+        """
+        operations = {
+            k: v if isinstance(v, Operator) else Equal(v) for k, v in kwargs.items()
+        }
+        filters = [
+            dict(col=col, opr=value.operator, value=value.value)
+            for col, value in operations.items()
+        ]
+
+        payload = await self._get_resources_page(
+            resource_name,
+            filters,
+            order_column,
+            0,
+            columns,
+        )
+        resources = list(payload["result"])
+        if not resources:
+            return resources
+
+        page = 1
+        if "count" in payload:
+            pages = -(-payload["count"] // MAX_PAGE_SIZE)
+            results = await asyncio.gather(
+                *(
+                    self._get_resources_page(
+                        resource_name,
+                        filters,
+                        order_column,
+                        page_,
+                        columns,
+                    )
+                    for page_ in range(1, pages)
+                ),
+            )
+            for result in results:
+                resources.extend(result["result"])
+
+            # if we got more resources than the original count some were created
+            # while listing, and we need to continue paginating serially
+            if len(resources) <= payload["count"]:
+                return resources
+            page = pages
+
+        # paginate endpoint until no results are returned
+        while True:
+            payload = await self._get_resources_page(
+                resource_name,
+                filters,
+                order_column,
+                page,
+                columns,
+            )
+            if not payload["result"]:
+                break
+
+            resources.extend(payload["result"])
+            page += 1
+
+        return resources
+
+    async def _get_resources_page(  # pylint: disable=too-many-arguments
+        self,
+        resource_name: str,
+        filters: List[Dict[str, Any]],
+        order_column: str,
+        page: int,
+        columns: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Return a single page of a resource listing.
+        """
+        params: Dict[str, Any] = {
+            "filters": filters,
+            "order_column": order_column,
+            "order_direction": "desc",
+            "page": page,
+            "page_size": MAX_PAGE_SIZE,
+        }
+        if columns:
+            params["columns"] = columns
+        query = prison.dumps(params)
+        url = self.baseurl / "api/v1" / resource_name / "" % {"q": query}
+
+        _logger.debug("GET %s", url)
+        response = await self._request("GET", url)
+        self._validate(response)
+
+        return response.json()
+
+    async def update_resource(
+        self,
+        resource_name: str,
+        resource_id: int,
+        query_args: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Update a resource.
+        """
+        url = self.baseurl / "api/v1" / resource_name / str(resource_id)
+        if query_args:
+            url %= query_args
+
+        _logger.debug("PUT %s\n%s", url, json.dumps(kwargs, indent=4))
+        response = await self._request("PUT", url, payload=kwargs)
+        self._validate(response)
+
+        return response.json()
+
+    async def get_dataset(self, dataset_id: int) -> Any:
+        """
+        Return a single dataset.
+        """
+        return await self.get_resource("dataset", dataset_id)
+
+    async def export_zip(self, resource_name: str, ids: List[int]) -> BytesIO:
+        """
+        Export one or more of a resource.
+
+        IDs are exported concurrently in batches of ``MAX_IDS_IN_EXPORT``, and the
+        files are merged into a single ZIP bundle.
+        """
+        url = self.baseurl / "api/v1" / resource_name / "export/"
+
+        async def export_page(page: List[int]) -> bytes:
+            page_url = url % {"q": prison.dumps(page)}
+            _logger.debug("GET %s", page_url)
+            response = await self._request("GET", page_url)
+            self._validate(response)
+            return response.content
+
+        pages = [
+            ids[i : i + MAX_IDS_IN_EXPORT]
+            for i in range(0, len(ids), MAX_IDS_IN_EXPORT)
+        ]
+        contents = await asyncio.gather(*(export_page(page) for page in pages))
+
+        buf = BytesIO()
+        with ZipFile(buf, "w") as bundle:
+            for content in contents:
+                # write files from response to main ZIP bundle
+                with ZipFile(BytesIO(content)) as subset:
+                    for name in subset.namelist():
+                        bundle.writestr(name, subset.read(name))
+
+        buf.seek(0)
+
+        return buf
+
+    async def import_zip(
+        self,
+        resource_name: str,
+        form_data: BytesIO,
+        overwrite: bool = False,
+    ) -> bool:
+        """
+        Import a ZIP bundle.
+        """
+        key = "bundle" if resource_name == "assets" else "formData"
+        url = self.baseurl / "api/v1" / resource_name / "import/"
+
+        data = {"overwrite": json.dumps(overwrite)}
+        form: Dict[str, Union[str, Tuple[str, bytes]]] = {
+            key: (f"{resource_name}.zip", form_data.getvalue()),
+            **data,
+        }
+        _logger.debug("POST %s\n%s", url, json.dumps(data, indent=4))
+        response = await self._request("POST", url, form=form)
+        self._validate(response)
+
+        payload = response.json()
+
+        return payload["message"] == "OK"
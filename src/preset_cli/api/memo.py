@@ -0,0 +1,71 @@
+"""
+An in-process memo for API reads.
+
+Results are grouped by resource name, so that writes to a resource can invalidate
+all the reads of that resource. Identical requests made concurrently are sent only
+once, with the other callers waiting for the first one to finish.
+"""
+
+import copy
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class Memo:
+    """
+    A thread-safe memo of results, grouped by resource name.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[Hashable, Future]] = {}
+
+    def get(
+        self,
+        resource_name: str,
+        key: Hashable,
+        function: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the memoized result for a key, calling ``function`` on a miss.
+
+        A copy of the result is returned, so that callers can modify it freely.
+        Errors are not memoized.
+        """
+        with self._lock:
+            entries = self._entries.setdefault(resource_name, {})
+            owner = key not in entries
+            if owner:
+                entries[key] = Future()
+                self.misses += 1
+            else:
+                self.hits += 1
+            future = entries[key]
+
+        if owner:
+            try:
+                future.set_result(function())
+            except Exception as ex:  # pylint: disable=broad-except
+                with self._lock:
+                    if self._entries.get(resource_name, {}).get(key) is future:
+                        del self._entries[resource_name][key]
+                future.set_exception(ex)
+
+        return copy.deepcopy(future.result())
+
+    def invalidate(self, resource_name: Optional[str] = None) -> None:
+        """
+        Forget results for a resource, or for all resources.
+
+        Requests that are in flight still return to their callers, but their
+        results are not reused.
+        """
+        with self._lock:
+            if resource_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(resource_name, None)
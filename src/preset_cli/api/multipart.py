@@ -0,0 +1,97 @@
+"""
+Streamed ``multipart/form-data`` request bodies.
+
+When given ``files`` ``requests`` builds the whole multipart body in memory. A
+``MultipartBody`` is a file-like object that reads the files as the body is sent
+instead, so that large bundles are uploaded without being buffered.
+
+The body is seekable, so that it can be rewound when the request is resent.
+"""
+
+import io
+import os
+import uuid
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+
+class MultipartBody(io.RawIOBase):
+    """
+    A ``multipart/form-data`` body built from form fields and files.
+
+    The parts are encoded like ``requests`` does it, with each file sent under its
+    field name. Files are read from their current position.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        files: Dict[str, IO[bytes]],
+        boundary: Optional[str] = None,
+    ):
+        super().__init__()
+        self.boundary = boundary or uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+
+        # each part is a stream, together with its start and its offset in the body
+        self._parts: List[Tuple[IO[bytes], int, int, int]] = []
+        self._length = 0
+        self._position = 0
+
+        for name, value in fields.items():
+            self._add_bytes(
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n",
+            )
+        for name, file in files.items():
+            self._add_bytes(
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"; '
+                f'filename="{name}"\r\n\r\n',
+            )
+            self._add(file)
+            self._add_bytes("\r\n")
+        self._add_bytes(f"--{self.boundary}--\r\n")
+
+    def _add_bytes(self, text: str) -> None:
+        self._add(io.BytesIO(text.encode("utf-8")))
+
+    def _add(self, stream: IO[bytes]) -> None:
+        start = stream.tell()
+        size = stream.seek(0, os.SEEK_END) - start
+        self._parts.append((stream, start, self._length, size))
+        self._length += size
+
+    def __len__(self) -> int:
+        return self._length
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._length
+        elif whence != os.SEEK_SET:
+            raise ValueError(f"Invalid whence: {whence}")
+
+        self._position = max(offset, 0)
+        return self._position
+
+    def readinto(self, buffer: Any) -> int:
+        for stream, start, offset, size in self._parts:
+            if offset <= self._position < offset + size:
+                stream.seek(start + self._position - offset)
+                data = stream.read(min(len(buffer), offset + size - self._position))
+                buffer[: len(data)] = data
+                self._position += len(data)
+                return len(data)
+
+        return 0
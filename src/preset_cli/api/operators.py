@@ -48,3 +48,11 @@ class Contains(Operator):
     """
 
     operator = "ct"
+
+
+class GreaterThan(Operator):
+    """
+    Operator for greater than filters.
+    """
+
+    operator = "gt"
@@ -0,0 +1,183 @@
+"""
+Statistics about HTTP requests.
+
+The collector is installed as a response hook on a ``requests`` session, and
+aggregates requests by method and endpoint template, with IDs and UUIDs in the path
+collapsed (eg, ``GET /api/v1/chart/{id}``).
+"""
+
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Optional
+
+from requests import Response, Session
+from yarl import URL
+
+ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$",
+    re.IGNORECASE,
+)
+
+
+def get_endpoint_template(url: str) -> str:
+    """
+    Return the path of a URL with IDs and UUIDs replaced by ``{id}``.
+
+        >>> get_endpoint_template("https://example.org/api/v1/chart/42?q=()")
+        '/api/v1/chart/{id}'
+
+    """
+    return "/".join(
+        "{id}" if ID_SEGMENT.match(segment) else segment
+        for segment in URL(url).path.split("/")
+    )
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """
+    Return a percentile of a non-empty list of values, using the nearest rank.
+
+        >>> percentile([1, 2, 3, 4], 50)
+        2
+
+    """
+    values = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+class EndpointStats:  # pylint: disable=too-few-public-methods
+    """
+    Statistics for a single endpoint.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.retries = 0
+        self.reauths = 0
+        self.latencies: List[float] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the statistics as a dictionary.
+        """
+        return {
+            "count": self.count,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "retries": self.retries,
+            "reauths": self.reauths,
+            "latency_p50": percentile(self.latencies, 50),
+            "latency_p95": percentile(self.latencies, 95),
+            "latency_max": max(self.latencies),
+        }
+
+
+class HTTPStats:
+    """
+    A collector of HTTP request statistics.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: DefaultDict[str, EndpointStats] = defaultdict(EndpointStats)
+
+    def install(self, session: Session) -> None:
+        """
+        Start collecting statistics from a session.
+
+        The hook is added first, so that it sees 401 responses before they're
+        replaced by the response from re-authenticating.
+        """
+        if self.record not in session.hooks["response"]:
+            session.hooks["response"].insert(0, self.record)
+
+    # pylint: disable=invalid-name, unused-argument
+    def record(self, r: Response, *args: Any, **kwargs: Any) -> None:
+        """
+        Record a response.
+
+        Latency is the time until the response headers were parsed, so it doesn't
+        include downloading the body. Bytes sent are the size of the request body; for
+        streamed bodies (eg, ``MultipartBody``) it's read from ``Content-Length``, and
+        bodies sent with chunked encoding are not counted.
+        """
+        key = f"{r.request.method} {get_endpoint_template(r.request.url or '')}"
+
+        body = r.request.body
+        if isinstance(body, (bytes, str)):
+            bytes_out = len(body)
+        elif "Content-Length" in r.request.headers:
+            bytes_out = int(r.request.headers["Content-Length"])
+        else:
+            bytes_out = 0
+        if "Content-Length" in r.headers:
+            bytes_in = int(r.headers["Content-Length"])
+        elif not kwargs.get("stream"):
+            bytes_in = len(r.content)
+        else:
+            bytes_in = 0
+
+        retries = getattr(r.raw, "retries", None)
+
+        with self._lock:
+            endpoint = self._endpoints[key]
+            endpoint.count += 1
+            endpoint.bytes_in += bytes_in
+            endpoint.bytes_out += bytes_out
+            endpoint.retries += len(retries.history) if retries else 0
+            endpoint.reauths += r.status_code == 401
+            endpoint.latencies.append(r.elapsed.total_seconds())
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the statistics of all endpoints, from most to least requested.
+        """
+        with self._lock:
+            items = sorted(
+                self._endpoints.items(),
+                key=lambda item: (-item[1].count, item[0]),
+            )
+            return {key: endpoint.to_dict() for key, endpoint in items}
+
+    def format(self, limit: Optional[int] = None) -> str:
+        """
+        Return the statistics as a human-readable table.
+        """
+        rows = [
+            (
+                key,
+                str(stats["count"]),
+                str(stats["bytes_in"]),
+                str(stats["bytes_out"]),
+                str(stats["retries"]),
+                str(stats["reauths"]),
+                f'{stats["latency_p50"]:.3f}',
+                f'{stats["latency_p95"]:.3f}',
+                f'{stats["latency_max"]:.3f}',
+            )
+            for key, stats in list(self.to_dict().items())[:limit]
+        ]
+        header = (
+            "Endpoint",
+            "Count",
+            "Bytes in",
+            "Bytes out",
+            "Retries",
+            "Reauths",
+            "p50 (s)",
+            "p95 (s)",
+            "Max (s)",
+        )
+        widths = [max(len(row[i]) for row in [header, *rows]) for i in range(9)]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in [header, *rows]
+        )
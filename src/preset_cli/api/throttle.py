@@ -0,0 +1,260 @@
+"""
+Client-side throttling of outbound HTTP requests.
+
+Requests are throttled per host by two mechanisms:
+
+- a token bucket, limiting requests to a configurable rate (unlimited by default);
+- an AIMD (additive increase, multiplicative decrease) concurrency controller, which
+  halves the number of concurrent requests when the server answers with a 429 or a
+  5xx, and grows it back by one request for each window of successful requests.
+
+A ``Retry-After`` header in an error response pauses all requests to the host.
+
+The throttle is enforced by a transport adapter mounted on ``Auth.session``, and all
+auths share ``DEFAULT_THROTTLE``, so that concurrent clients for the same host
+(eg, the threads of a ``--workers`` run) are throttled together.
+"""
+
+import email.utils
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from yarl import URL
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 32
+MAX_RETRY_AFTER = 300
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header, returning the delay in seconds.
+
+    The header can have either a number of seconds or an HTTP date.
+
+        >>> parse_retry_after("2")
+        2.0
+
+    """
+    if not value:
+        return None
+
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        delay = date.timestamp() - time.time()
+
+    return min(max(delay, 0), MAX_RETRY_AFTER)
+
+
+def is_overloaded(response: Response) -> bool:
+    """
+    Return true if the server signaled it's overloaded.
+
+    Attempts retried by ``urllib3`` are also taken into account.
+    """
+    statuses = [response.status_code]
+    retries = getattr(response.raw, "retries", None)
+    if retries:
+        statuses.extend(attempt.status for attempt in retries.history)
+
+    return any(
+        status is not None and (status == 429 or status >= 500) for status in statuses
+    )
+
+
+class TokenBucket:
+    """
+    A token bucket rate limiter.
+
+    The bucket holds up to ``burst`` tokens, refilled at ``rate`` tokens per second,
+    and each request takes one token. Without a rate requests are only blocked while
+    the bucket is paused.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst or max(rate or 1, 1)
+        self.tokens = self.burst
+        self.paused_until = 0.0
+
+        self._lock = threading.Lock()
+        self._updated = time.monotonic()
+
+    def pause(self, delay: float) -> None:
+        """
+        Block requests for ``delay`` seconds.
+        """
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + delay)
+
+    def acquire(self) -> None:
+        """
+        Wait until a request is allowed.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if self.rate:
+                    self.tokens = min(
+                        self.burst,
+                        self.tokens + (now - self._updated) * self.rate,
+                    )
+                self._updated = now
+
+                if now < self.paused_until:
+                    delay = self.paused_until - now
+                elif not self.rate:
+                    return
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    delay = (1 - self.tokens) / self.rate
+
+            time.sleep(delay)
+
+
+class ConcurrencyController:
+    """
+    An AIMD controller for the number of concurrent requests.
+
+    The limit starts at ``max_limit``. Each successful request increases it by
+    ``1/limit``, so that it grows by one after a full window of successful requests;
+    a request that overloaded the server halves it, at most once every ``cooldown``
+    seconds so that a burst of errors from the same window counts only once.
+    """
+
+    def __init__(
+        self,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY,
+        min_limit: int = 1,
+        cooldown: float = 1.0,
+    ):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.cooldown = cooldown
+
+        self.limit = float(max_limit)
+        self.in_flight = 0
+
+        self._condition = threading.Condition()
+        self._decreased_at = float("-inf")
+
+    def acquire(self) -> None:
+        """
+        Wait until there's room for another concurrent request.
+        """
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, overloaded: Optional[bool]) -> None:
+        """
+        Finish a request, adjusting the limit.
+
+        The limit is left unchanged when ``overloaded`` is ``None``, eg, when the
+        request failed without a response.
+        """
+        with self._condition:
+            self.in_flight -= 1
+
+            if overloaded:
+                now = time.monotonic()
+                if now - self._decreased_at >= self.cooldown:
+                    self.limit = max(self.min_limit, self.limit / 2)
+                    self._decreased_at = now
+                    _logger.debug("Reducing concurrency to %d", self.limit)
+            elif overloaded is not None:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+            self._condition.notify_all()
+
+
+class Throttle:
+    """
+    Per host rate limiters and concurrency controllers.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        self.rate = rate
+        self.max_concurrency = max_concurrency
+
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Tuple[TokenBucket, ConcurrencyController]] = {}
+
+    def configure(
+        self,
+        rate: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        """
+        Change the settings, discarding the state of all hosts.
+        """
+        with self._lock:
+            self.rate = rate
+            if max_concurrency is not None:
+                self.max_concurrency = max_concurrency
+            self._hosts.clear()
+
+    def get(self, host: str) -> Tuple[TokenBucket, ConcurrencyController]:
+        """
+        Return the rate limiter and the concurrency controller for a host.
+        """
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = (
+                    TokenBucket(self.rate),
+                    ConcurrencyController(self.max_concurrency),
+                )
+            return self._hosts[host]
+
+
+DEFAULT_THROTTLE = Throttle()
+
+
+class ThrottledAdapter(HTTPAdapter):
+    """
+    A transport adapter that sends requests through a throttle.
+    """
+
+    def __init__(self, throttle: Throttle = DEFAULT_THROTTLE, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.throttle = throttle
+
+    def send(  # type: ignore  # pylint: disable=arguments-differ
+        self,
+        request: PreparedRequest,
+        **kwargs: Any,
+    ) -> Response:
+        bucket, controller = self.throttle.get(URL(request.url or "").host or "")
+
+        controller.acquire()
+        overloaded = None
+        try:
+            bucket.acquire()
+            response = super().send(request, **kwargs)
+            overloaded = is_overloaded(response)
+            if overloaded:
+                delay = parse_retry_after(response.headers.get("Retry-After"))
+                if delay:
+                    _logger.debug("Pausing requests for %.1f seconds", delay)
+                    bucket.pause(delay)
+        finally:
+            controller.release(overloaded)
+
+        return response
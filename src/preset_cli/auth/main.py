@@ -2,12 +2,15 @@
 Mechanisms for authentication and authorization.
 """
 
-from typing import Any, Dict
+import copy
+from typing import Any, Dict, Optional
 
 from requests import Response, Session
-from requests.adapters import HTTPAdapter
+from requests.utils import rewind_body
 from urllib3.util import Retry
 
+from preset_cli.api.throttle import DEFAULT_THROTTLE, ThrottledAdapter
+
 
 class Auth:  # pylint: disable=too-few-public-methods
     """
@@ -18,13 +21,42 @@ class Auth:  # pylint: disable=too-few-public-methods
         self.session = Session()
         self.session.hooks["response"].append(self.reauth)
 
+        # the throttle is shared by all auths, so it applies to every client
+        self.throttle = DEFAULT_THROTTLE
+
         retries = Retry(
             total=3,  # max retries count
             backoff_factor=1,  # delay factor between attempts
             respect_retry_after_header=True,
         )
 
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
+        for prefix in ("https://", "http://"):
+            self.session.mount(
+                prefix,
+                ThrottledAdapter(self.throttle, max_retries=retries),
+            )
+
+    def copy(self) -> "Auth":
+        """
+        Return a copy of the auth with its own session.
+
+        Sessions hold per-client state like headers, so concurrent clients should
+        each use a copy of the auth.
+        """
+        clone = copy.copy(self)
+        Auth.__init__(clone)
+        # keep other hooks, like the collector of HTTP statistics
+        clone.session.hooks["response"] = [
+            (
+                clone.reauth
+                if getattr(hook, "__func__", None) is type(self).reauth
+                else hook
+            )
+            for hook in self.session.hooks["response"]
+        ]
+        clone.session.headers.update(self.session.headers)
+        clone.session.cookies.update(self.session.cookies)
+        return clone
 
     def get_headers(self) -> Dict[str, str]:
         """
@@ -32,6 +64,14 @@ class Auth:  # pylint: disable=too-few-public-methods
         """
         return {}
 
+    def get_scope(self) -> Optional[str]:
+        """
+        Return an identifier for the credentials, used to scope cached responses.
+
+        Responses are not cached when the credentials can't be identified.
+        """
+        return None
+
     def auth(self) -> None:
         """
         Perform authentication, fetching JWT tokens, CSRF tokens, cookies, etc.
@@ -53,4 +93,9 @@ class Auth:  # pylint: disable=too-few-public-methods
 
         self.session.headers.update(self.get_headers())
         r.request.headers.update(self.get_headers())
+
+        # streamed bodies were consumed by the first attempt
+        if getattr(r.request, "_body_position", None) is not None:
+            rewind_body(r.request)
+
         return self.session.send(r.request, verify=False)
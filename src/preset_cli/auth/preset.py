@@ -2,7 +2,7 @@
 Preset auth.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 
 import yaml
 from yarl import URL
@@ -35,6 +35,9 @@ class PresetAuth(Auth):  # pylint: disable=too-few-public-methods
     def get_headers(self) -> Dict[str, str]:
         return {"Authorization": f"Bearer {self.token}"}
 
+    def get_scope(self) -> Optional[str]:
+        return f"{self.baseurl}:{self.api_token}"
+
     def auth(self) -> None:
         """
         Fetch the JWT and store it.
@@ -28,6 +28,9 @@ class UsernamePasswordAuth(Auth):  # pylint: disable=too-few-public-methods
     def get_headers(self) -> Dict[str, str]:
         return {"X-CSRFToken": self.csrf_token} if self.csrf_token else {}
 
+    def get_scope(self) -> Optional[str]:
+        return f"{self.baseurl}:{self.username}"
+
     def auth(self) -> None:
         """
         Login to get CSRF token and cookies.
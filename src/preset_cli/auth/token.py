@@ -2,7 +2,7 @@
 Token auth.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 
 from preset_cli.auth.main import Auth
 
@@ -18,3 +18,6 @@ class TokenAuth(Auth):  # pylint: disable=too-few-public-methods, abstract-metho
 
     def get_headers(self) -> Dict[str, str]:
         return {"Authorization": f"Bearer {self.token}"}
+
+    def get_scope(self) -> Optional[str]:
+        return f"token:{self.token}"
@@ -18,13 +18,19 @@ from yarl import URL
 
 from preset_cli.api.clients.preset import PresetClient
 from preset_cli.api.clients.superset import SupersetClient
+from preset_cli.api.throttle import DEFAULT_THROTTLE
 from preset_cli.auth.jwt import JWTAuth
 from preset_cli.auth.lib import get_credentials_path, store_credentials
 from preset_cli.auth.preset import JWTTokenError, PresetAuth
 from preset_cli.cli.export_users import export_users as export_users_command
 from preset_cli.cli.superset.main import superset
 from preset_cli.exceptions import CLIError
-from preset_cli.lib import raise_cli_errors, setup_logging, split_comma
+from preset_cli.lib import (
+    raise_cli_errors,
+    setup_http_stats,
+    setup_logging,
+    split_comma,
+)
 from preset_cli.typing import UserType
 
 _logger = logging.getLogger(__name__)
@@ -126,6 +132,25 @@ def resolve_workspace_role(role_name: str) -> str:
 @click.option("--jwt-token", envvar="PRESET_JWT_TOKEN")
 @click.option("--workspaces", envvar="PRESET_WORKSPACES", callback=split_comma)
 @click.option("--loglevel", default="INFO")
+@click.option(
+    "--http-stats",
+    is_flag=True,
+    default=False,
+    help="Report HTTP request statistics to stderr on exit",
+)
+@click.option(
+    "--http-stats-file",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write HTTP request statistics as JSON to a file on exit",
+)
+@click.option(
+    "--rate-limit",
+    type=float,
+    envvar="PRESET_CLI_RATE_LIMIT",
+    default=None,
+    help="Maximum number of API requests per second to each host",
+)
 @click.version_option()
 @click.pass_context
 @raise_cli_errors
@@ -137,6 +162,9 @@ def preset_cli(  # pylint: disable=too-many-branches, too-many-locals, too-many-
     jwt_token: Optional[str],
     workspaces: List[str],
     loglevel: str,
+    http_stats: bool = False,
+    http_stats_file: Optional[str] = None,
+    rate_limit: Optional[float] = None,
 ) -> None:
     """
     A CLI for Preset.
@@ -145,6 +173,9 @@ def preset_cli(  # pylint: disable=too-many-branches, too-many-locals, too-many-
 
     ctx.ensure_object(dict)
 
+    if rate_limit:
+        DEFAULT_THROTTLE.configure(rate=rate_limit)
+
     # store manager URL for other commands
     ctx.obj["MANAGER_URL"] = manager_api_url = URL(baseurl)
 
@@ -192,6 +223,8 @@ def preset_cli(  # pylint: disable=too-many-branches, too-many-locals, too-many-
             )
             raise CLIError(error_message, 1) from excinfo
 
+    setup_http_stats(ctx, http_stats, http_stats_file)
+
     if not workspaces and ctx.invoked_subcommand == "superset" and not is_help():
         client = PresetClient(ctx.obj["MANAGER_URL"], ctx.obj["AUTH"])
         click.echo("Choose one or more workspaces (eg: 1-3,5,8-):")
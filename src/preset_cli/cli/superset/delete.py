@@ -269,7 +269,7 @@ def _resolve_rollback_settings(
 def _build_superset_client(ctx: click.core.Context) -> SupersetClient:
     auth = ctx.obj["AUTH"]
     url = URL(ctx.obj["INSTANCE"])
-    return SupersetClient(url, auth)
+    return SupersetClient(url, auth, cache=ctx.obj.get("CACHE"), memoize=True)
 
 
 def _delete_resources(
@@ -4,8 +4,7 @@ Cascade planning helpers for delete assets.
 
 from __future__ import annotations
 
-from io import BytesIO
-from typing import Dict, List, Mapping, Sequence, Set, Tuple, cast
+from typing import IO, Dict, List, Mapping, Sequence, Set, Tuple, cast
 
 import click
 
@@ -38,8 +37,11 @@ from preset_cli.cli.superset.lib import (
     is_filter_not_allowed_error,
 )
 
+# only the dataset ID and its database are needed to preflight database deletion
+PREFLIGHT_DATASET_COLUMNS = ["id", "database_id", "database.id"]
 
-def _extract_uuids_from_export(buf: BytesIO) -> Dict[str, Set[str]]:
+
+def _extract_uuids_from_export(buf: IO[bytes]) -> Dict[str, Set[str]]:
     """Extract UUID sets from a dashboard export ZIP."""
     dependencies = dep_utils.extract_dependency_maps(buf)
     return {
@@ -148,7 +150,7 @@ def _find_other_dashboard_ids(
     client: SupersetClient,
     dashboard_ids: Set[int],
 ) -> Set[int]:
-    all_dashboards = client.get_resources(RESOURCE_DASHBOARD)
+    all_dashboards = client.get_resources(RESOURCE_DASHBOARD, columns=["id"])
     return {dashboard["id"] for dashboard in all_dashboards} - dashboard_ids
 
 
@@ -317,6 +319,7 @@ def _fetch_preflight_datasets(
                 List[Dict[str, object]],
                 client.get_resources(
                     RESOURCE_DATASET,
+                    columns=PREFLIGHT_DATASET_COLUMNS,
                     database_id=In(list(database_ids)),
                 ),
             ),
@@ -325,7 +328,13 @@ def _fetch_preflight_datasets(
     except Exception as exc:  # pylint: disable=broad-except
         if is_filter_not_allowed_error(exc):
             return (
-                cast(List[Dict[str, object]], client.get_resources(RESOURCE_DATASET)),
+                cast(
+                    List[Dict[str, object]],
+                    client.get_resources(
+                        RESOURCE_DATASET,
+                        columns=PREFLIGHT_DATASET_COLUMNS,
+                    ),
+                ),
                 False,
             )
         raise click.ClickException(
@@ -3,8 +3,7 @@ Internal data models for the delete-assets command.
 """
 
 from dataclasses import dataclass
-from io import BytesIO
-from typing import Dict, List, Literal, Set, Tuple, TypedDict
+from typing import IO, Dict, List, Literal, Set, Tuple, TypedDict
 
 from typing_extensions import NotRequired
 
@@ -66,7 +65,7 @@ class _DashboardSelection:
 
     dashboards: List[_DashboardSummaryRow]
     dashboard_ids: Set[int]
-    cascade_buf: BytesIO | None = None
+    cascade_buf: IO[bytes] | None = None
 
 
 @dataclass
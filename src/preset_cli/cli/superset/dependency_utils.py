@@ -3,7 +3,7 @@ Reusable dependency and UUID resolution helpers for Superset CLI commands.
 """
 
 from io import BytesIO
-from typing import Dict, List, Set, Tuple
+from typing import IO, Dict, List, Set, Tuple
 from zipfile import ZipFile
 
 from preset_cli.api.clients.superset import SupersetClient
@@ -46,7 +46,7 @@ def extract_backup_uuids_by_type(backup_data: bytes) -> Dict[str, Set[str]]:
 
 
 def extract_dependency_maps(
-    buf: BytesIO,
+    buf: IO[bytes],
 ) -> CascadeDependencies:
     """Extract dashboard export dependency sets and relationship mappings."""
 
@@ -161,8 +161,11 @@ def build_uuid_map(
 ) -> Tuple[Dict[str, int], Dict[int, str], bool]:
     """Build UUID->ID and ID->name maps for a Superset resource type."""
 
-    resources = client.get_resources(resource_name)
     name_keys = RESOURCE_NAME_KEYS.get(resource_name, ("name",))
+    resources = client.get_resources(
+        resource_name,
+        columns=["id", "uuid", *name_keys],
+    )
     name_map: Dict[int, str] = {}
     for resource in resources:
         if "id" not in resource:
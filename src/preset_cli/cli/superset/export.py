@@ -394,7 +394,7 @@ def export_assets(  # pylint: disable=too-many-locals, too-many-arguments, too-m
     """
     auth = ctx.obj["AUTH"]
     url = URL(ctx.obj["INSTANCE"])
-    client = SupersetClient(url, auth)
+    client = SupersetClient(url, auth, cache=ctx.obj.get("CACHE"), memoize=True)
     _validate_export_destination_args(directory, output_zip)
     asset_types = set(asset_type)
     ids, ids_requested = _build_requested_ids(
@@ -470,53 +470,51 @@ def export_resource(  # pylint: disable=too-many-arguments, too-many-locals
     if requested_ids:
         ids = list(requested_ids)
     else:
-        resources = client.get_resources(resource_name)
+        resources = client.get_resources(resource_name, columns=["id"])
         ids = [resource["id"] for resource in resources]
     buf = client.export_zip(resource_name, ids)
 
-    with ZipFile(buf) as bundle:
-        contents = {
-            remove_root(file_name): bundle.read(file_name).decode()
-            for file_name in bundle.namelist()
-        }
-
     # Build UUID mapping for existing files to validate uniqueness
     uuid_mapping = build_local_uuid_mapping(root)
     files_to_delete: List[Path] = []
 
-    for file_name, file_content in contents.items():
-        if skip_related and not file_name.startswith(resource_name):
-            continue
-
-        output_name = (
-            apply_simple_filename(file_name, root, simple_name_registry)
-            if simple_file_names and simple_name_registry is not None
-            else file_name
-        )
-        target = root / output_name
-        check_asset_uniqueness(
-            overwrite,
-            file_content,
-            output_name,
-            target,
-            uuid_mapping,
-            files_to_delete,
-        )
+    # files are read one at a time, so large exports don't need to fit in memory
+    with ZipFile(buf) as bundle:
+        for name in bundle.namelist():
+            file_name = remove_root(name)
+            if skip_related and not file_name.startswith(resource_name):
+                continue
+            file_content = bundle.read(name).decode()
+
+            output_name = (
+                apply_simple_filename(file_name, root, simple_name_registry)
+                if simple_file_names and simple_name_registry is not None
+                else file_name
+            )
+            target = root / output_name
+            check_asset_uniqueness(
+                overwrite,
+                file_content,
+                output_name,
+                target,
+                uuid_mapping,
+                files_to_delete,
+            )
 
-        if not target.parent.exists():
-            target.parent.mkdir(parents=True, exist_ok=True)
+            if not target.parent.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
 
-        # escape any pre-existing Jinja2 templates
-        if not disable_jinja_escaping:
-            asset_yaml = yaml.load(file_content, Loader=yaml.SafeLoader)
-            for key, value in asset_yaml.items():
-                asset_yaml[key] = traverse_data(value, handle_string)
+            # escape any pre-existing Jinja2 templates
+            if not disable_jinja_escaping:
+                asset_yaml = yaml.load(file_content, Loader=yaml.SafeLoader)
+                for key, value in asset_yaml.items():
+                    asset_yaml[key] = traverse_data(value, handle_string)
 
-            file_content = yaml.dump(asset_yaml, sort_keys=False)
+                file_content = yaml.dump(asset_yaml, sort_keys=False)
 
-        newline = get_newline_char(force_unix_eol)
-        with open(target, "w", encoding="utf-8", newline=newline) as output:
-            output.write(file_content)
+            newline = get_newline_char(force_unix_eol)
+            with open(target, "w", encoding="utf-8", newline=newline) as output:
+                output.write(file_content)
 
     # Delete old files that have been replaced (only after successful write)
     failed_deletions = []
@@ -620,7 +618,13 @@ def export_users(
     auth = ctx.obj["AUTH"]
     url = URL(ctx.obj["INSTANCE"])
     preset_baseurl = ctx.obj.get("MANAGER_URL")
-    client = SupersetClient(url, auth, preset_baseurl)
+    client = SupersetClient(
+        url,
+        auth,
+        preset_baseurl,
+        cache=ctx.obj.get("CACHE"),
+        memoize=True,
+    )
 
     users = [
         {k: v for k, v in user.items() if k != "id"} for user in client.export_users()
@@ -654,7 +658,7 @@ def export_roles(
     """
     auth = ctx.obj["AUTH"]
     url = URL(ctx.obj["INSTANCE"])
-    client = SupersetClient(url, auth)
+    client = SupersetClient(url, auth, cache=ctx.obj.get("CACHE"), memoize=True)
 
     newline = get_newline_char(force_unix_eol)
     with open(path, "w", encoding="utf-8", newline=newline) as output:
@@ -684,7 +688,7 @@ def export_rls(
     """
     auth = ctx.obj["AUTH"]
     url = URL(ctx.obj["INSTANCE"])
-    client = SupersetClient(url, auth)
+    client = SupersetClient(url, auth, cache=ctx.obj.get("CACHE"), memoize=True)
 
     newline = get_newline_char(force_unix_eol)
     with open(path, "w", encoding="utf-8", newline=newline) as output:
@@ -745,7 +749,7 @@ def export_ownership(  # pylint: disable=too-many-locals, too-many-arguments
     """
     auth = ctx.obj["AUTH"]
     url = URL(ctx.obj["INSTANCE"])
-    client = SupersetClient(url, auth)
+    client = SupersetClient(url, auth, cache=ctx.obj.get("CACHE"), memoize=True)
 
     users = {user["id"]: user["email"] for user in client.export_users()}
 
@@ -11,6 +11,7 @@ from yarl import URL
 from preset_cli.api.clients.superset import SupersetClient
 from preset_cli.cli.superset.lib import (
     LogType,
+    append_log_to_file,
     clean_logs,
     get_logs,
     write_logs_to_file,
@@ -32,7 +33,7 @@ def import_rls(ctx: click.core.Context, path: str) -> None:
     """
     auth = ctx.obj["AUTH"]
     url = URL(ctx.obj["INSTANCE"])
-    client = SupersetClient(url, auth)
+    client = SupersetClient(url, auth, cache=ctx.obj.get("CACHE"), memoize=True)
 
     with open(path, encoding="utf-8") as input_:
         config = yaml.load(input_, Loader=yaml.SafeLoader)
@@ -53,7 +54,7 @@ def import_roles(ctx: click.core.Context, path: str) -> None:
     """
     auth = ctx.obj["AUTH"]
     url = URL(ctx.obj["INSTANCE"])
-    client = SupersetClient(url, auth)
+    client = SupersetClient(url, auth, cache=ctx.obj.get("CACHE"), memoize=True)
 
     with open(path, encoding="utf-8") as input_:
         config = yaml.load(input_, Loader=yaml.SafeLoader)
@@ -83,9 +84,14 @@ def import_ownership(  # pylint: disable=too-many-locals
     """
     Import resource ownership from a YAML file.
     """
-    client = SupersetClient(baseurl=URL(ctx.obj["INSTANCE"]), auth=ctx.obj["AUTH"])
-
-    log_file_path, logs = get_logs(LogType.OWNERSHIP)
+    client = SupersetClient(
+        baseurl=URL(ctx.obj["INSTANCE"]),
+        auth=ctx.obj["AUTH"],
+        cache=ctx.obj.get("CACHE"),
+        memoize=True,
+    )
+
+    log_file_path, logs = get_logs(LogType.OWNERSHIP, ctx.obj.get("LOG_FILE_PATH"))
     assets_to_skip = {log["uuid"] for log in logs[LogType.OWNERSHIP]} | {
         log["uuid"] for log in logs[LogType.ASSETS] if log["status"] == "FAILED"
     }
@@ -95,6 +101,9 @@ def import_ownership(  # pylint: disable=too-many-locals
 
     users = {user["email"]: user["id"] for user in client.export_users()}
     with open(log_file_path, "w", encoding="utf-8") as log_file:
+        # keep the previous entries, so that they can be appended to
+        write_logs_to_file(log_file, logs)
+
         for resource_name, resources in config.items():
             resource_ids = {
                 str(v): k for k, v in client.get_uuids(resource_name).items()
@@ -127,10 +136,14 @@ def import_ownership(  # pylint: disable=too-many-locals
                             raise
                         asset_log["status"] = "FAILED"
 
-                    logs[LogType.OWNERSHIP].append(asset_log)
-                    write_logs_to_file(log_file, logs)
+                    append_log_to_file(
+                        log_file,
+                        logs,
+                        LogType.OWNERSHIP,
+                        asset_log,
+                    )
 
     if not continue_on_error or not any(
         log["status"] == "FAILED" for log in logs[LogType.OWNERSHIP]
     ):
-        clean_logs(LogType.OWNERSHIP, logs)
+        clean_logs(LogType.OWNERSHIP, logs, log_file_path)
@@ -4,10 +4,12 @@ Helper functions for the Superset commands
 
 from __future__ import annotations
 
+import json
+import logging
 import re
 from enum import Enum
 from pathlib import Path
-from typing import IO, Callable, Dict, List, Tuple, TypeAlias, cast
+from typing import IO, Callable, Dict, List, Optional, Tuple, TypeAlias, cast
 
 import click
 import yaml
@@ -16,7 +18,10 @@ from preset_cli.api.operators import Contains
 from preset_cli.exceptions import ErrorPayload, SupersetError
 from preset_cli.lib import dict_merge
 
+_logger = logging.getLogger(__name__)
+
 LOG_FILE_PATH = Path("progress.log")
+LOG_COMPACTION_INTERVAL = 1000
 FilterValueType: TypeAlias = type[str] | type[int] | type[bool]
 FilterValue: TypeAlias = str | int | bool
 ParsedFilterValue: TypeAlias = FilterValue | Contains
@@ -62,28 +67,77 @@ class LogType(str, Enum):
     OWNERSHIP = "ownership"
 
 
-def get_logs(log_type: LogType) -> Tuple[Path, LogsByType]:
+def get_log_file_path(instance: str) -> Path:
+    """
+    Return the path of the progress log file for a given workspace.
+
+    Used when importing to multiple workspaces concurrently, so that each workspace
+    checkpoints and resumes from its own file.
+    """
+    slug = re.sub(r"[^A-Za-z0-9.-]+", "_", instance).strip("_")
+    return LOG_FILE_PATH.with_name(
+        f"{LOG_FILE_PATH.stem}-{slug}{LOG_FILE_PATH.suffix}",
+    )
+
+
+def get_logs(
+    log_type: LogType,
+    log_file_path: Optional[Path] = None,
+) -> Tuple[Path, LogsByType]:
     """
     Returns the path and content of the progress log file.
 
     Creates the file if it does not exist yet. Filters out FAILED
     entries for the particular log type. Defaults to an empty list.
     """
+    log_file_path = log_file_path or LOG_FILE_PATH
     base_logs: LogsByType = {log_type_: [] for log_type_ in LogType}
 
-    if not LOG_FILE_PATH.exists():
-        LOG_FILE_PATH.touch()
-        return LOG_FILE_PATH, base_logs
+    if not log_file_path.exists():
+        log_file_path.touch()
+        return log_file_path, base_logs
 
-    with open(LOG_FILE_PATH, "r", encoding="utf-8") as log_file:
-        logs = cast(SerializedLogs, yaml.load(log_file, Loader=yaml.SafeLoader) or {})
+    with open(log_file_path, "r", encoding="utf-8") as log_file:
+        logs = read_logs(log_file)
 
-    logs = {LogType(log_type): log_entries for log_type, log_entries in logs.items()}
     dict_merge(base_logs, logs)
     base_logs[log_type] = [
         log for log in base_logs[log_type] if log.get("status") != "FAILED"
     ]
-    return LOG_FILE_PATH, base_logs
+    return log_file_path, base_logs
+
+
+def read_logs(log_file: IO[str]) -> LogsByType:
+    """
+    Read the content of a progress log file.
+
+    The file has one JSON object per line, mapping the log type to an entry. Files in
+    the legacy format, a single YAML document with all the entries, are also read.
+    """
+    logs: LogsByType = {log_type: [] for log_type in LogType}
+
+    lines = [line for line in log_file.read().splitlines() if line.strip()]
+    for i, line in enumerate(lines):
+        try:
+            record = cast(SerializedLogs, json.loads(line))
+        except json.JSONDecodeError:
+            if i == 0:
+                legacy_logs = cast(
+                    SerializedLogs,
+                    yaml.load("\n".join(lines), Loader=yaml.SafeLoader) or {},
+                )
+                for log_type, log_entries in legacy_logs.items():
+                    logs[LogType(log_type)].extend(log_entries)
+                return logs
+
+            # an entry that was only partially written, eg, if the process was killed
+            _logger.warning("Ignoring invalid entry in progress log: %s", line)
+            continue
+
+        for log_type, log_entry in record.items():
+            logs[LogType(log_type)].append(cast(LogEntry, log_entry))
+
+    return logs
 
 
 def serialize_enum_logs_to_string(logs: LogsByType) -> SerializedLogs:
@@ -93,29 +147,66 @@ def serialize_enum_logs_to_string(logs: LogsByType) -> SerializedLogs:
     return {log_type.value: log_entries for log_type, log_entries in logs.items()}
 
 
+def serialize_log_entry(log_type: LogType, log: LogEntry) -> str:
+    """
+    Serialize a log entry to a line in the progress log file.
+    """
+    return json.dumps({log_type.value: log}) + "\n"
+
+
 def write_logs_to_file(log_file: IO[str], logs: LogsByType) -> None:
     """
     Writes logs list to .log file.
+
+    This rewrites the whole file, compacting it.
     """
-    logs_ = serialize_enum_logs_to_string(logs)
     log_file.seek(0)
-    yaml.dump(logs_, log_file)
+    for log_type, log_entries in logs.items():
+        for log in log_entries:
+            log_file.write(serialize_log_entry(log_type, log))
     log_file.truncate()
+    log_file.flush()
+
+
+def append_log_to_file(
+    log_file: IO[str],
+    logs: LogsByType,
+    log_type: LogType,
+    log: LogEntry,
+) -> None:
+    """
+    Add a log entry, appending it to the .log file.
+
+    Only the new entry is written, so that checkpointing N assets is linear. Every
+    ``LOG_COMPACTION_INTERVAL`` entries the file is compacted instead, discarding any
+    entries that were partially written.
+    """
+    logs[log_type].append(log)
+    if len(logs[log_type]) % LOG_COMPACTION_INTERVAL == 0:
+        write_logs_to_file(log_file, logs)
+        return
+
+    log_file.write(serialize_log_entry(log_type, log))
+    log_file.flush()
 
 
-def clean_logs(log_type: LogType, logs: LogsByType) -> None:
+def clean_logs(
+    log_type: LogType,
+    logs: LogsByType,
+    log_file_path: Optional[Path] = None,
+) -> None:
     """
     Cleans the progress log file for the specific log type.
 
     If there are no other log types, the file is deleted.
     """
+    log_file_path = log_file_path or LOG_FILE_PATH
     logs.pop(log_type, None)
     if any(logs.values()):
-        with open(LOG_FILE_PATH, "w", encoding="utf-8") as log_file:
-            logs_ = serialize_enum_logs_to_string(logs)
-            yaml.dump(logs_, log_file)
+        with open(log_file_path, "w", encoding="utf-8") as log_file:
+            write_logs_to_file(log_file, logs)
     else:
-        LOG_FILE_PATH.unlink(missing_ok=True)
+        log_file_path.unlink(missing_ok=True)
 
 
 def _normalize_bool(value: object) -> bool | None:
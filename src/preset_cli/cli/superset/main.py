@@ -2,11 +2,19 @@
 Main entry point for Superset commands.
 """
 
-from typing import Any, Optional
+import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from pathlib import Path
+from typing import Any, Callable, Optional, TextIO, Tuple
 
 import click
 from yarl import URL
 
+from preset_cli.api.cache import HTTPCache
+from preset_cli.api.throttle import DEFAULT_THROTTLE
 from preset_cli.auth.superset import SupersetJWTAuth, UsernamePasswordAuth
 from preset_cli.cli.superset.delete import delete_assets
 from preset_cli.cli.superset.export import (
@@ -17,10 +25,54 @@ from preset_cli.cli.superset.export import (
     export_users,
 )
 from preset_cli.cli.superset.import_ import import_ownership, import_rls, import_roles
+from preset_cli.cli.superset.lib import get_log_file_path
 from preset_cli.cli.superset.sql import sql
 from preset_cli.cli.superset.sync.main import sync
 from preset_cli.cli.superset.sync.native.command import native
-from preset_cli.lib import setup_logging
+from preset_cli.lib import setup_http_stats, setup_logging
+
+_logger = logging.getLogger(__name__)
+
+
+def cache_options(function: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Add the options that control the HTTP cache to a command.
+    """
+    function = click.option(
+        "--no-cache",
+        is_flag=True,
+        default=False,
+        help="Disable the HTTP cache",
+    )(function)
+    function = click.option(
+        "--cache-dir",
+        envvar="PRESET_CLI_CACHE_DIR",
+        default=None,
+        help="Directory for caching read-only API responses between runs",
+    )(function)
+    return function
+
+
+def setup_cache(
+    ctx: click.core.Context,
+    cache_dir: Optional[str],
+    no_cache: bool,
+) -> None:
+    """
+    Store an HTTP cache in the context, if one was requested.
+    """
+    if no_cache:
+        ctx.obj["CACHE"] = None
+    elif cache_dir and not ctx.obj.get("CACHE"):
+        cache = HTTPCache(Path(cache_dir))
+        ctx.obj["CACHE"] = cache
+        ctx.call_on_close(
+            lambda: _logger.info(
+                "HTTP cache: %d hits, %d misses",
+                cache.hits,
+                cache.misses,
+            ),
+        )
 
 
 @click.group()
@@ -37,6 +89,26 @@ from preset_cli.lib import setup_logging
     help="Password (leave empty for prompt)",
 )
 @click.option("--loglevel", default="INFO")
+@click.option(
+    "--http-stats",
+    is_flag=True,
+    default=False,
+    help="Report HTTP request statistics to stderr on exit",
+)
+@click.option(
+    "--http-stats-file",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write HTTP request statistics as JSON to a file on exit",
+)
+@click.option(
+    "--rate-limit",
+    type=float,
+    envvar="PRESET_CLI_RATE_LIMIT",
+    default=None,
+    help="Maximum number of API requests per second to each host",
+)
+@cache_options
 @click.version_option()
 @click.pass_context
 def superset_cli(  # pylint: disable=too-many-arguments
@@ -46,6 +118,11 @@ def superset_cli(  # pylint: disable=too-many-arguments
     username: str,
     password: str,
     loglevel: str,
+    http_stats: bool = False,
+    http_stats_file: Optional[str] = None,
+    rate_limit: Optional[float] = None,
+    cache_dir: Optional[str] = None,
+    no_cache: bool = False,
 ):
     """
     An Apache Superset CLI.
@@ -54,7 +131,11 @@ def superset_cli(  # pylint: disable=too-many-arguments
 
     ctx.ensure_object(dict)
 
+    if rate_limit:
+        DEFAULT_THROTTLE.configure(rate=rate_limit)
+
     ctx.obj["INSTANCE"] = instance
+    setup_cache(ctx, cache_dir, no_cache)
 
     # allow a custom authenticator to be passed via the context
     if "AUTH" not in ctx.obj:
@@ -63,6 +144,8 @@ def superset_cli(  # pylint: disable=too-many-arguments
         else:
             ctx.obj["AUTH"] = UsernamePasswordAuth(URL(instance), username, password)
 
+    setup_http_stats(ctx, http_stats, http_stats_file)
+
 
 superset_cli.add_command(sql)
 superset_cli.add_command(sync)
@@ -80,12 +163,155 @@ superset_cli.add_command(native, name="import-assets")
 
 
 @click.group()
+@click.option(
+    "--parallel",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of workspaces to run concurrently",
+)
+@cache_options
 @click.pass_context
-def superset(ctx: click.core.Context) -> None:
+def superset(
+    ctx: click.core.Context,
+    parallel: int = 1,
+    cache_dir: Optional[str] = None,
+    no_cache: bool = False,
+) -> None:
     """
     Send commands to one or more Superset instances.
     """
     ctx.ensure_object(dict)
+    ctx.obj["PARALLEL"] = parallel
+    setup_cache(ctx, cache_dir, no_cache)
+
+
+class ThreadLocalOutput:
+    """
+    A stream that buffers writes per thread.
+
+    Threads that called ``capture`` write to their own buffer, while other threads
+    write to the original stream.
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.local = threading.local()
+
+    def capture(self) -> StringIO:
+        """
+        Start buffering output from the current thread.
+        """
+        self.local.buffer = StringIO()
+        return self.local.buffer
+
+    def write(self, text: str) -> int:
+        """
+        Write to the buffer of the current thread, if any.
+        """
+        return getattr(self.local, "buffer", self.stream).write(text)
+
+    def flush(self) -> None:
+        """
+        Flush the original stream.
+        """
+        if not hasattr(self.local, "buffer"):
+            self.stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+def run_in_workspace(
+    ctx: click.core.Context,
+    command: click.core.Command,
+    instance: str,
+    output: ThreadLocalOutput,
+    *args: Any,
+    **kwargs: Any,
+) -> Tuple[str, Optional[str]]:
+    """
+    Run a command in a given workspace, returning its output and error (if any).
+
+    Each workspace gets its own context, auth and progress log file, so that they can
+    run concurrently.
+    """
+    buffer = output.capture()
+    obj = dict(ctx.obj, INSTANCE=instance, LOG_FILE_PATH=get_log_file_path(instance))
+    if "AUTH" in obj:
+        obj["AUTH"] = obj["AUTH"].copy()
+    workspace_ctx = click.Context(
+        ctx.command,
+        info_name=ctx.info_name,
+        parent=ctx.parent,
+        obj=obj,
+    )
+
+    error: Optional[str] = None
+    try:
+        with workspace_ctx:
+            workspace_ctx.invoke(command, *args, **kwargs)
+    except SystemExit as ex:
+        if ex.code not in (None, 0):
+            error = f"exited with code {ex.code}"
+    except click.exceptions.Exit as ex:
+        if ex.exit_code != 0:
+            error = f"exited with code {ex.exit_code}"
+    except Exception as ex:  # pylint: disable=broad-except
+        error = str(ex) or ex.__class__.__name__
+
+    return buffer.getvalue(), error
+
+
+def run_in_workspaces(
+    ctx: click.core.Context,
+    command: click.core.Command,
+    *args: Any,
+    **kwargs: Any,
+) -> None:
+    """
+    Run a command concurrently in all the workspaces.
+
+    Output is buffered per workspace and printed in order, followed by a summary.
+    """
+    workspaces = ctx.obj["WORKSPACES"]
+    output = ThreadLocalOutput(sys.stdout)
+
+    sys.stdout = output  # type: ignore
+    try:
+        with ThreadPoolExecutor(max_workers=ctx.obj["PARALLEL"]) as executor:
+            futures = [
+                executor.submit(
+                    run_in_workspace,
+                    ctx,
+                    command,
+                    instance,
+                    output,
+                    *args,
+                    **kwargs,
+                )
+                for instance in workspaces
+            ]
+            results = []
+            for instance, future in zip(workspaces, futures):
+                text, error = future.result()
+                click.echo(f"\n{instance}")
+                click.echo(text, nl=False)
+                if error:
+                    click.echo(click.style(error, fg="bright_red"))
+                results.append((instance, error))
+    finally:
+        sys.stdout = output.stream
+
+    failures = [(instance, error) for instance, error in results if error]
+    click.echo(
+        f"\nSummary: {len(results) - len(failures)} succeeded, "
+        f"{len(failures)} failed",
+    )
+    for instance, error in results:
+        click.echo(f"{'❌' if error else '✅'} {instance}")
+
+    if failures:
+        ctx.exit(1)
 
 
 def mutate_commands(source: click.core.Group, target: click.core.Group) -> None:
@@ -120,6 +346,10 @@ def mutate_commands(source: click.core.Group, target: click.core.Group) -> None:
                 command=command,
                 **kwargs: Any,
             ) -> None:
+                if ctx.obj.get("PARALLEL", 1) > 1:
+                    run_in_workspaces(ctx, command, *args, **kwargs)
+                    return
+
                 for instance in ctx.obj["WORKSPACES"]:
                     click.echo(f"\n{instance}")
                     ctx.obj["INSTANCE"] = instance
@@ -20,12 +20,23 @@ from sqlglot.tokens import Tokenizer
 from tabulate import tabulate
 from yarl import URL
 
+from preset_cli.api.cache import DEFAULT_RESULT_TTL, ResultCache
 from preset_cli.api.clients.superset import SupersetClient
-from preset_cli.exceptions import SupersetError
+from preset_cli.exceptions import CLIError, SupersetError
+from preset_cli.lib import raise_cli_errors
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pa_csv
+except ModuleNotFoundError:  # pragma: no cover
+    pa = None  # pylint: disable=invalid-name
 
 sql_completer = WordCompleter(list(Tokenizer.KEYWORDS))
 style = style_from_pygments_cls(get_style_by_name("stata-dark"))
 
+OUTPUT_FORMATS = {".parquet", ".csv", ".arrow"}
+
 
 @click.command()
 @click.option(
@@ -40,19 +51,89 @@ style = style_from_pygments_cls(get_style_by_name("stata-dark"))
     help="Schema",
 )
 @click.option("-e", "--execute", default=None, help="Run query non-interactively")
+@click.option(
+    "--async",
+    "run_async",
+    is_flag=True,
+    default=False,
+    help="Run the query asynchronously, streaming all the results as CSV (with -e)",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, resolve_path=True),
+    default=None,
+    help="Write the results to a .parquet, .csv, or .arrow file (with -e)",
+)
+@click.option(
+    "--result-cache-dir",
+    envvar="PRESET_CLI_RESULT_CACHE_DIR",
+    default=None,
+    help="Directory for caching query results between runs",
+)
+@click.option(
+    "--result-cache-ttl",
+    type=float,
+    default=DEFAULT_RESULT_TTL,
+    help="Number of seconds cached query results are reused",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    default=False,
+    help="Rerun queries instead of reusing cached results",
+)
 @click.pass_context
-def sql(  # pylint: disable=too-many-arguments
+@raise_cli_errors
+def sql(  # pylint: disable=too-many-arguments, too-many-locals, too-many-branches
     ctx: click.core.Context,
     database_id: Optional[int],
     schema: Optional[str] = None,
     execute: Optional[str] = None,
+    run_async: bool = False,
+    output: Optional[str] = None,
+    result_cache_dir: Optional[str] = None,
+    result_cache_ttl: float = DEFAULT_RESULT_TTL,
+    refresh: bool = False,
 ) -> None:
     """
     Run SQL against an Apache Superset database.
     """
+    if result_cache_dir and pa is None:
+        raise CLIError(
+            "Caching query results requires ``pyarrow``. Please run "
+            "``pip install --upgrade preset-cli[arrow]``",
+            1,
+        )
+    if output:
+        if not execute:
+            raise CLIError("``--output`` requires a query passed with ``-e``", 1)
+        if Path(output).suffix.lower() not in OUTPUT_FORMATS:
+            raise CLIError(
+                "The output file should have one of the extensions: "
+                + ", ".join(sorted(OUTPUT_FORMATS)),
+                1,
+            )
+        if pa is None:
+            raise CLIError(
+                "Writing results to a file requires ``pyarrow``. Please run "
+                "``pip install --upgrade preset-cli[arrow]``",
+                1,
+            )
+
     auth = ctx.obj["AUTH"]
     url = URL(ctx.obj["INSTANCE"])
-    client = SupersetClient(url, auth)
+    result_cache = (
+        ResultCache(Path(result_cache_dir), ttl=result_cache_ttl)
+        if result_cache_dir
+        else None
+    )
+    client = SupersetClient(
+        url,
+        auth,
+        cache=ctx.obj.get("CACHE"),
+        memoize=True,
+        result_cache=result_cache,
+    )
 
     databases = client.get_databases()
     if not databases:
@@ -82,10 +163,21 @@ def sql(  # pylint: disable=too-many-arguments
         if database["id"] == database_id
     ][0]
 
+    if execute and output:
+        return export_query(
+            client,
+            database_id,
+            schema,
+            execute,
+            Path(output),
+            run_async,
+        )
+    if execute and run_async:
+        return run_query_async(client, database_id, schema, execute)
     if execute:
-        return run_query(client, database_id, schema, execute)
+        return run_query(client, database_id, schema, execute, refresh)
 
-    return run_session(client, database_id, database_name, schema, url)
+    return run_session(client, database_id, database_name, schema, url, refresh)
 
 
 def run_query(
@@ -93,12 +185,13 @@ def run_query(
     database_id: int,
     schema: Optional[str],
     query: str,
+    refresh: bool = False,
 ) -> None:
     """
     Run a query in a given database.
     """
     try:
-        results = client.run_query(database_id, query, schema)
+        results = client.run_query(database_id, query, schema, refresh=refresh)
         click.echo(tabulate(results, headers=results.columns, showindex=False))
     except SupersetError as ex:
         click.echo(
@@ -111,12 +204,86 @@ def run_query(
         traceback.print_exc()
 
 
-def run_session(
+def run_query_async(
+    client: SupersetClient,
+    database_id: int,
+    schema: Optional[str],
+    query: str,
+) -> None:
+    """
+    Run a query asynchronously, writing the results as CSV as they're read.
+    """
+    try:
+        for i, results in enumerate(
+            client.run_query_async(database_id, query, schema),
+        ):
+            click.echo(results.to_csv(index=False, header=i == 0), nl=False)
+    except SupersetError as ex:
+        click.echo(
+            click.style(
+                "\n".join(error["message"] for error in ex.errors),
+                fg="bright_red",
+            ),
+        )
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+
+
+def export_query(  # pylint: disable=too-many-arguments
+    client: SupersetClient,
+    database_id: int,
+    schema: Optional[str],
+    query: str,
+    output: Path,
+    run_async: bool = False,
+) -> None:
+    """
+    Run a query, writing the results to a Parquet, CSV, or Arrow IPC file.
+
+    The results are read as Arrow record batches, and written as they're read.
+    """
+    try:
+        reader = client.run_query_arrow(
+            database_id,
+            query,
+            schema,
+            limit=None,
+            run_async=run_async,
+        )
+        write_record_batches(reader, output)
+    except SupersetError as ex:
+        click.echo(
+            click.style(
+                "\n".join(error["message"] for error in ex.errors),
+                fg="bright_red",
+            ),
+        )
+
+
+def write_record_batches(reader: "pa.RecordBatchReader", output: Path) -> None:
+    """
+    Write record batches to a file, in the format given by its extension.
+    """
+    suffix = output.suffix.lower()
+    if suffix == ".parquet":
+        writer = pq.ParquetWriter(str(output), reader.schema)
+    elif suffix == ".csv":
+        writer = pa_csv.CSVWriter(str(output), reader.schema)
+    else:
+        writer = pa.ipc.new_file(str(output), reader.schema)
+
+    with writer:
+        for batch in reader:
+            writer.write_batch(batch)
+
+
+def run_session(  # pylint: disable=too-many-arguments
     client: SupersetClient,
     database_id: int,
     database_name: str,
     schema: Optional[str],
     url: URL,
+    refresh: bool = False,
 ) -> None:
     """
     Run SQL queries in an interactive session.
@@ -151,7 +318,7 @@ def run_session(
 
         is_terminated, quote_context = get_query_termination(query)
         if is_terminated:
-            run_query(client, database_id, schema, query)
+            run_query(client, database_id, schema, query, refresh)
             lines = []
             quote_context = " "
 
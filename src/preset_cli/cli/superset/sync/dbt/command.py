@@ -24,6 +24,7 @@ from preset_cli.cli.superset.sync.dbt.lib import (
     apply_select,
     get_og_metric_from_config,
     list_failed_models,
+    load_manifest,
     load_profiles,
 )
 from preset_cli.cli.superset.sync.dbt.metrics import (
@@ -106,6 +107,18 @@ _logger = logging.getLogger(__name__)
     default=False,
     help="End the execution with an error if a model fails to sync or a deprecated feature is used",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of models to sync concurrently",
+)
+@click.option(
+    "--stream-manifest",
+    is_flag=True,
+    default=False,
+    help="Parse the manifest incrementally to reduce memory usage (requires ijson)",
+)
 @raise_cli_errors
 @click.pass_context
 def dbt_core(  # pylint: disable=too-many-arguments, too-many-branches, too-many-locals ,too-many-statements # noqa: C901
@@ -124,13 +137,15 @@ def dbt_core(  # pylint: disable=too-many-arguments, too-many-branches, too-many
     preserve_metadata: bool = False,
     merge_metadata: bool = False,
     raise_failures: bool = False,
+    workers: int = 1,
+    stream_manifest: bool = False,
 ) -> None:
     """
     Sync models/metrics from dbt Core to Superset and charts/dashboards to dbt exposures.
     """
     auth = ctx.obj["AUTH"]
     url = URL(ctx.obj["INSTANCE"])
-    client = SupersetClient(url, auth)
+    client = SupersetClient(url, auth, cache=ctx.obj.get("CACHE"), memoize=True)
     deprecation_notice: bool = False
 
     if preserve_metadata and merge_metadata:
@@ -176,8 +191,7 @@ def dbt_core(  # pylint: disable=too-many-arguments, too-many-branches, too-many
             1,
         )
 
-    with open(manifest, encoding="utf-8") as input_:
-        configs = yaml.load(input_, Loader=yaml.SafeLoader)
+    configs = load_manifest(manifest, stream_manifest)
 
     config = load_profiles(Path(profiles), project, profile, target)
     dialect = config[project]["outputs"][target]["type"]
@@ -189,10 +203,9 @@ def dbt_core(  # pylint: disable=too-many-arguments, too-many-branches, too-many
     model_schema = ModelSchema()
     models = []
     for config in configs["nodes"].values():
-        if config["resource_type"] == "model":
-            unique_id = config["unique_id"]
-            config["children"] = configs["child_map"][unique_id]
-            models.append(model_schema.load(config))
+        unique_id = config["unique_id"]
+        config["children"] = configs["child_map"][unique_id]
+        models.append(model_schema.load(config))
     models = apply_select(models, select, exclude)
     model_map = {ModelKey(model["schema"], model["name"]): model for model in models}
 
@@ -260,6 +273,7 @@ def dbt_core(  # pylint: disable=too-many-arguments, too-many-branches, too-many
             external_url_prefix,
             reload_columns=reload_columns,
             merge_metadata=merge_metadata,
+            workers=workers,
         )
 
     if exposures:
@@ -528,6 +542,12 @@ def fetch_sl_metrics(
     "--database-name",
     help="The DB connection name to associate the synced models with",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of models to sync concurrently",
+)
 @click.pass_context
 @raise_cli_errors
 def dbt_cloud(  # pylint: disable=too-many-arguments, too-many-locals
@@ -548,13 +568,19 @@ def dbt_cloud(  # pylint: disable=too-many-arguments, too-many-locals
     raise_failures: bool = False,
     database_id: int | None = None,
     database_name: str | None = None,
+    workers: int = 1,
 ) -> None:
     """
     Sync models/metrics from dbt Cloud to Superset.
     """
     superset_auth = ctx.obj["AUTH"]
     url = URL(ctx.obj["INSTANCE"])
-    superset_client = SupersetClient(url, superset_auth)
+    superset_client = SupersetClient(
+        url,
+        superset_auth,
+        cache=ctx.obj.get("CACHE"),
+        memoize=True,
+    )
 
     dbt_auth = TokenAuth(token)
     dbt_client = DBTClient(dbt_auth, access_url)
@@ -621,6 +647,7 @@ def dbt_cloud(  # pylint: disable=too-many-arguments, too-many-locals
             external_url_prefix,
             reload_columns=reload_columns,
             merge_metadata=merge_metadata,
+            workers=workers,
         )
 
     if exposures:
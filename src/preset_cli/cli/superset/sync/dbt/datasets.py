@@ -8,6 +8,10 @@ from __future__ import annotations
 import copy
 import json
 import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.engine.url import URL as SQLAlchemyURL
@@ -23,6 +27,8 @@ from preset_cli.lib import dict_merge, raise_cli_errors
 
 DEFAULT_CERTIFICATION = {"details": "This table is produced by dbt"}
 
+DatasetIndex = Dict[Tuple[Optional[str], str], List[Dict[str, Any]]]
+
 _logger = logging.getLogger(__name__)
 
 
@@ -122,32 +128,65 @@ def no_catalog_support(ex: SupersetError) -> bool:
     return False
 
 
+def build_dataset_index(client: SupersetClient, database: Any) -> DatasetIndex:
+    """
+    Return all the datasets in a database, indexed by schema and table name.
+    """
+    index: DatasetIndex = defaultdict(list)
+    for dataset in client.get_datasets(database=OneToMany(database["id"])):
+        index[(dataset["schema"], dataset["table_name"])].append(dataset)
+
+    return dict(index)
+
+
 def get_or_create_dataset(
     client: SupersetClient,
     model: ModelSchema,
     database: Any,
+    index: Optional[DatasetIndex] = None,
+    lock: Optional[threading.Lock] = None,
 ) -> Dict[str, Any]:
     """
     Returns the existing dataset or creates a new one.
+
+    If an index of the datasets in the database is passed it's used to find the
+    existing dataset, instead of querying the API, and datasets that are created are
+    added to it. When models are synced concurrently a lock should be passed, so that
+    models sharing a table don't create it more than once.
     """
-    filters = {
-        "database": OneToMany(database["id"]),
-        "schema": model["schema"],
-        "table_name": model.get("alias") or model["name"],
-    }
-    existing = client.get_datasets(**filters)
+    table_name = model.get("alias") or model["name"]
+    with lock or nullcontext():
+        if index is None:
+            filters = {
+                "database": OneToMany(database["id"]),
+                "schema": model["schema"],
+                "table_name": table_name,
+            }
+            existing = client.get_datasets(**filters)
+        else:
+            existing = index.get((model["schema"], table_name), [])
 
-    if len(existing) > 1:
-        raise CLIError("More than one dataset found", 1)
+        if len(existing) > 1:
+            raise CLIError("More than one dataset found", 1)
 
-    if existing:
-        dataset = existing[0]
-        _logger.info("Updating dataset %s", model["unique_id"])
+        created = not existing
+        if created:
+            _logger.info("Creating dataset %s", model["unique_id"])
+            try:
+                dataset = create_dataset(client, database, model)
+            except Exception as excinfo:
+                _logger.exception("Unable to create dataset")
+                raise CLIError("Unable to create dataset", 1) from excinfo
+            if index is not None:
+                index[(model["schema"], table_name)] = [dataset]
+        else:
+            dataset = existing[0]
+            _logger.info("Updating dataset %s", model["unique_id"])
+
+    if not created:
         return client.get_dataset(dataset["id"])
 
-    _logger.info("Creating dataset %s", model["unique_id"])
     try:
-        dataset = create_dataset(client, database, model)
         return client.get_dataset(dataset["id"])
     except Exception as excinfo:
         _logger.exception("Unable to create dataset")
@@ -353,6 +392,97 @@ def compute_dataset_metadata(  # pylint: disable=too-many-arguments
     return update
 
 
+def sync_dataset(  # pylint: disable=too-many-locals, too-many-arguments
+    client: SupersetClient,
+    model: ModelSchema,
+    metrics: List[SupersetMetricDefinition],
+    database: Any,
+    disallow_edits: bool,
+    base_url: Optional[URL],
+    certification: Optional[Dict[str, Any]] = None,
+    reload_columns: bool = True,
+    merge_metadata: bool = False,
+    index: Optional[DatasetIndex] = None,
+    lock: Optional[threading.Lock] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Import a single model as a dataset with metrics.
+
+    Returns the dataset, or ``None`` if the model failed to sync.
+    """
+    # get corresponding dataset
+    try:
+        dataset = get_or_create_dataset(client, model, database, index, lock)
+    except CLIError:
+        return None
+
+    default_configs = model["superset_meta"].pop("default_configs", {})
+
+    # compute metrics
+    final_dataset_metrics = compute_metrics(
+        dataset["metrics"],
+        metrics,
+        reload_columns,
+        merge_metadata,
+        metric_defaults=default_configs.get("metrics", {}),
+    )
+
+    # compute columns
+    final_dataset_columns = []
+    if not reload_columns:
+        try:
+            refreshed_columns_list = client.get_refreshed_dataset_columns(
+                dataset["id"],
+            )
+            final_dataset_columns = compute_columns(
+                dataset["columns"],
+                refreshed_columns_list,
+            )
+        except SupersetError:
+            return None
+
+    # get calculated columns from model
+    calculated_columns = model["superset_meta"].pop("calculated_columns", [])
+
+    # compute update payload
+    update = compute_dataset_metadata(
+        model,
+        certification,
+        disallow_edits,
+        final_dataset_metrics,
+        base_url,
+        final_dataset_columns,
+    )
+
+    try:
+        client.update_dataset(
+            dataset["id"],
+            override_columns=reload_columns,
+            **update,
+        )
+    except SupersetError:
+        return None
+
+    # update column metadata
+    dbt_columns = model.get("columns")
+    if dbt_columns or calculated_columns:
+        current_dataset_columns = client.get_dataset(dataset["id"])["columns"]
+        dataset_columns = compute_columns_metadata(
+            dbt_columns,
+            current_dataset_columns,
+            reload_columns,
+            merge_metadata,
+            default_configs.get("columns", {}),
+            calculated_columns,
+        )
+        try:
+            client.update_dataset(dataset["id"], columns=dataset_columns)
+        except SupersetError:
+            return None
+
+    return dataset
+
+
 def sync_datasets(  # pylint: disable=too-many-locals, too-many-arguments
     client: SupersetClient,
     models: List[ModelSchema],
@@ -363,89 +493,47 @@ def sync_datasets(  # pylint: disable=too-many-locals, too-many-arguments
     certification: Optional[Dict[str, Any]] = None,
     reload_columns: bool = True,
     merge_metadata: bool = False,
+    workers: int = 1,
 ) -> Tuple[List[Any], List[str]]:
     """
     Read the dbt manifest and import models as datasets with metrics.
+
+    Models are independent from each other, so with more than one worker they're
+    synced concurrently. Datasets are always returned in the order of the models.
     """
     base_url = URL(external_url_prefix) if external_url_prefix else None
     datasets = []
     failed_datasets = []
 
-    for model in models:
-        # get corresponding dataset
-        try:
-            dataset = get_or_create_dataset(client, model, database)
-        except CLIError:
-            failed_datasets.append(model["unique_id"])
-            continue
-
-        default_configs = model["superset_meta"].pop("default_configs", {})
+    # fetch all existing datasets once, instead of one query per model
+    index = build_dataset_index(client, database)
+    lock = threading.Lock() if workers > 1 else None
 
-        # compute metrics
-        final_dataset_metrics = compute_metrics(
-            dataset["metrics"],
+    def sync_model(model: ModelSchema) -> Optional[Dict[str, Any]]:
+        return sync_dataset(
+            client,
+            model,
             metrics.get(model["unique_id"], []),
+            database,
+            disallow_edits,
+            base_url,
+            certification,
             reload_columns,
             merge_metadata,
-            metric_defaults=default_configs.get("metrics", {}),
+            index,
+            lock,
         )
 
-        # compute columns
-        final_dataset_columns = []
-        if not reload_columns:
-            try:
-                refreshed_columns_list = client.get_refreshed_dataset_columns(
-                    dataset["id"],
-                )
-                final_dataset_columns = compute_columns(
-                    dataset["columns"],
-                    refreshed_columns_list,
-                )
-            except SupersetError:
-                failed_datasets.append(model["unique_id"])
-                continue
-
-        # get calculated columns from model
-        calculated_columns = model["superset_meta"].pop("calculated_columns", [])
-
-        # compute update payload
-        update = compute_dataset_metadata(
-            model,
-            certification,
-            disallow_edits,
-            final_dataset_metrics,
-            base_url,
-            final_dataset_columns,
-        )
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(sync_model, models))
+    else:
+        results = [sync_model(model) for model in models]
 
-        try:
-            client.update_dataset(
-                dataset["id"],
-                override_columns=reload_columns,
-                **update,
-            )
-        except SupersetError:
+    for model, dataset in zip(models, results):
+        if dataset is None:
             failed_datasets.append(model["unique_id"])
-            continue
-
-        # update column metadata
-        dbt_columns = model.get("columns")
-        if dbt_columns or calculated_columns:
-            current_dataset_columns = client.get_dataset(dataset["id"])["columns"]
-            dataset_columns = compute_columns_metadata(
-                dbt_columns,
-                current_dataset_columns,
-                reload_columns,
-                merge_metadata,
-                default_configs.get("columns", {}),
-                calculated_columns,
-            )
-            try:
-                client.update_dataset(dataset["id"], columns=dataset_columns)
-            except SupersetError:
-                failed_datasets.append(model["unique_id"])
-                continue
-
-        datasets.append(dataset)
+        else:
+            datasets.append(dataset)
 
     return datasets, failed_datasets
@@ -8,7 +8,7 @@ import logging
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
+from typing import IO, Any, Dict, List, Optional, Tuple, TypedDict, Union
 
 import yaml
 from jinja2 import Environment
@@ -19,8 +19,16 @@ from sqlalchemy.exc import NoSuchModuleError
 from preset_cli.cli.superset.sync.dbt.schemas import ModelSchema, OGMetricSchema
 from preset_cli.exceptions import CLIError
 
+try:
+    import ijson
+except ModuleNotFoundError:  # pragma: no cover
+    ijson = None  # pylint: disable=invalid-name
+
 _logger = logging.getLogger(__name__)
 
+# top-level keys of the manifest used by the sync
+MANIFEST_SECTIONS = ("nodes", "metrics", "child_map")
+
 
 def build_sqlalchemy_params(target: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -312,6 +320,81 @@ def load_profiles(
     return apply_templating(profiles)
 
 
+def load_manifest(path: Path, stream: bool = False) -> Dict[str, Any]:
+    """
+    Load the parts of a dbt manifest used by the sync.
+
+    Only models are kept from ``nodes``, together with ``metrics`` and
+    ``child_map``. When ``stream`` is true the file is parsed incrementally with
+    ``ijson``, so that other nodes and sections are never fully materialized.
+    """
+    with open(path, "rb") as input_:
+        if stream:
+            if ijson is None:
+                raise CLIError(
+                    "Streaming the manifest requires ``ijson``. Please run "
+                    "``pip install --upgrade preset-cli[streaming]``",
+                    1,
+                )
+            manifest = stream_manifest(input_)
+        else:
+            manifest = json.load(input_)
+
+    manifest = {key: manifest.get(key) or {} for key in MANIFEST_SECTIONS}
+    manifest["nodes"] = {
+        unique_id: config
+        for unique_id, config in manifest["nodes"].items()
+        if config["resource_type"] == "model"
+    }
+
+    return manifest
+
+
+def stream_manifest(input_: IO[bytes]) -> Dict[str, Any]:
+    """
+    Incrementally parse the sections of a manifest used by the sync.
+
+    Each item in ``MANIFEST_SECTIONS`` is built from the parser events and non-model
+    nodes are discarded as soon as they're complete.
+    """
+    manifest: Dict[str, Any] = {key: {} for key in MANIFEST_SECTIONS}
+    section = ""
+    key = ""
+    builder: Any = None
+    depth = 0
+
+    def add(value: Any) -> None:
+        if section != "nodes" or (
+            isinstance(value, dict) and value.get("resource_type") == "model"
+        ):
+            manifest[section][key] = value
+
+    for _, event, value in ijson.parse(input_, use_float=True):
+        if event in {"end_map", "end_array"}:
+            depth -= 1
+
+        if builder is not None:
+            builder.event(event, value)
+            if depth == 2:
+                add(builder.value)
+                builder = None
+        elif depth == 1 and event == "map_key":
+            section = value if value in MANIFEST_SECTIONS else ""
+        elif depth == 2 and event == "map_key":
+            key = value
+        elif depth == 2 and section:
+            if event in {"start_map", "start_array"}:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            else:
+                add(value)
+
+        if event in {"start_map", "start_array"}:
+            depth += 1
+
+    return manifest
+
+
 # pylint: disable=R0911, R0912
 def filter_models(models: List[ModelSchema], condition: str) -> List[ModelSchema]:
     """
@@ -83,7 +83,12 @@ def dj(  # pylint: disable=invalid-name,too-many-arguments
 
     superset_auth = ctx.obj["AUTH"]
     superset_url = URL(ctx.obj["INSTANCE"])
-    superset_client = SupersetClient(superset_url, superset_auth)
+    superset_client = SupersetClient(
+        superset_url,
+        superset_auth,
+        cache=ctx.obj.get("CACHE"),
+        memoize=True,
+    )
 
     dj_client = DJClient(dj_url)
     dj_client.basic_login(dj_username, dj_password)
@@ -12,9 +12,10 @@ import json
 import logging
 import os
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from enum import Enum
-from io import BytesIO
+from functools import partial
 from pathlib import Path
 from types import ModuleType
 from typing import (
@@ -45,6 +46,7 @@ from yarl import URL
 from preset_cli.api.clients.superset import SupersetClient
 from preset_cli.cli.superset.lib import (
     LogType,
+    append_log_to_file,
     clean_logs,
     get_logs,
     write_logs_to_file,
@@ -57,7 +59,7 @@ from preset_cli.cli.superset.sync.native.types import (
     UUIDLike,
 )
 from preset_cli.exceptions import SupersetError
-from preset_cli.lib import dict_merge
+from preset_cli.lib import DEFAULT_COMPRESSION_LEVEL, dict_merge, write_deflated_zip
 
 _logger = logging.getLogger(__name__)
 
@@ -198,6 +200,132 @@ def render_yaml(
     return cast(Dict[str, object], yaml.load(content, Loader=yaml.SafeLoader))
 
 
+def build_template_env(
+    root: Path,
+    option: Tuple[str, ...],
+    instance: URL,
+    load_env: bool = False,
+) -> Dict[str, object]:
+    """
+    Build the environment used to render templates.
+    """
+    env: Dict[str, object] = dict(
+        pair.split("=", 1) for pair in option if "=" in pair  # type: ignore
+    )
+    env["instance"] = instance
+    env["functions"] = load_user_modules(root / "functions")
+    env["raise"] = raise_helper
+    if load_env:
+        env["env"] = os.environ
+
+    return env
+
+
+def discover_configs(root: Path) -> List[Path]:
+    """
+    Find all the YAML asset configs in a directory.
+
+    Directories are walked in sorted order, so that configs are always returned in
+    the same order, regardless of the filesystem.
+    """
+    paths = []
+    queue = [root]
+    while queue:
+        path_name = queue.pop()
+        relative_path = path_name.relative_to(root)
+
+        if path_name.is_dir() and not path_name.stem.startswith("."):
+            queue.extend(sorted(path_name.glob("*"), reverse=True))
+        elif is_yaml_config(relative_path):
+            paths.append(path_name)
+
+    return paths
+
+
+def load_config(
+    path: Path,
+    env: Dict[str, object],
+    disable_jinja_templating: bool = False,
+) -> Dict[str, object]:
+    """
+    Load an asset config, merging its overrides file (if any).
+    """
+    try:
+        config = load_yaml(path) if disable_jinja_templating else render_yaml(path, env)
+
+        overrides_path = path.with_suffix(".overrides" + path.suffix)
+        if overrides_path.exists():
+            overrides = (
+                load_yaml(overrides_path)
+                if disable_jinja_templating
+                else render_yaml(overrides_path, env)
+            )
+            dict_merge(config, overrides)
+    except Exception as ex:  # pylint: disable=broad-except
+        raise click.ClickException(f"Unable to load {path}: {ex}") from ex
+
+    return config
+
+
+# state of each process rendering configs, set by ``_init_render_process``
+_render_state: Dict[str, object] = {}
+
+
+def _init_render_process(
+    root: Path,
+    option: Tuple[str, ...],
+    instance: URL,
+    load_env: bool,
+    disable_jinja_templating: bool,
+) -> None:
+    """
+    Initialize a process that renders configs.
+
+    The environment has user modules and functions, which can't be pickled, so each
+    process builds its own.
+    """
+    _render_state["env"] = build_template_env(root, option, instance, load_env)
+    _render_state["disable_jinja_templating"] = disable_jinja_templating
+
+
+def _load_config_in_process(path: Path) -> Dict[str, object]:
+    return load_config(
+        path,
+        cast(Dict[str, object], _render_state["env"]),
+        cast(bool, _render_state["disable_jinja_templating"]),
+    )
+
+
+def load_configs(  # pylint: disable=too-many-arguments
+    root: Path,
+    paths: List[Path],
+    option: Tuple[str, ...],
+    instance: URL,
+    load_env: bool = False,
+    disable_jinja_templating: bool = False,
+    processes: int = 1,
+) -> List[Dict[str, object]]:
+    """
+    Render and parse asset configs, returning them in the same order as ``paths``.
+
+    With more than one process the configs are rendered by a process pool, since
+    rendering and parsing is CPU bound.
+    """
+    if processes > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_render_process,
+            initargs=(root, option, instance, load_env, disable_jinja_templating),
+        ) as executor:
+            chunksize = max(1, len(paths) // (processes * 4))
+            return list(
+                executor.map(_load_config_in_process, paths, chunksize=chunksize),
+            )
+
+    env = build_template_env(root, option, instance, load_env)
+    return [load_config(path, env, disable_jinja_templating) for path in paths]
+
+
 def _is_bundle_root(path: Path) -> bool:
     return path.is_dir() and any((path / name).is_dir() for name in ASSET_DIRECTORIES)
 
@@ -327,6 +455,37 @@ def _resolve_input_root(path: Path) -> Tuple[Path, tempfile.TemporaryDirectory |
     multiple=True,
     help="Password for DB connections being imported (eg, uuid1=my_db_password)",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help=(
+        "Number of assets of the same type to import concurrently in split mode "
+        "(can't be used with --batch-size)"
+    ),
+)
+@click.option(
+    "--render-processes",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of processes used to render and parse the YAML files",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=1,
+    help=(
+        "Import assets of the same type in bundles of up to this size, retrying failed "
+        "bundles in smaller ones (imports assets in batches, one bundle at a time; "
+        "can't be used with --workers)"
+    ),
+)
+@click.option(
+    "--compression-level",
+    type=click.IntRange(min=0, max=9),
+    default=DEFAULT_COMPRESSION_LEVEL,
+    help="DEFLATE compression level of the uploaded bundles (0 disables compression)",
+)
 @click.pass_context
 def native(  # pylint: disable=too-many-locals, too-many-arguments, too-many-branches
     ctx: click.core.Context,
@@ -342,19 +501,27 @@ def native(  # pylint: disable=too-many-locals, too-many-arguments, too-many-bra
     continue_on_error: bool = False,
     cascade: bool = True,
     db_password: Tuple[str, ...] | None = None,
+    workers: int = 1,
+    batch_size: int = 1,
+    render_processes: int = 1,
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
 ) -> None:
     """
     Sync exported DBs/datasets/charts/dashboards to Superset.
     """
+    if workers > 1 and batch_size > 1:
+        raise click.UsageError("--workers can't be used with --batch-size")
+
     auth = ctx.obj["AUTH"]
     url = URL(ctx.obj["INSTANCE"])
-    client = SupersetClient(url, auth)
+    client = SupersetClient(url, auth, cache=ctx.obj.get("CACHE"), memoize=True)
     root, temp_dir = _resolve_input_root(Path(directory))
     base_url = URL(external_url_prefix) if external_url_prefix else None
 
     try:
-        # The ``--continue-on-error`` and ``--no-cascade`` flags force split mode.
-        split = split or continue_on_error or not cascade
+        # The ``--continue-on-error``, ``--no-cascade`` and ``--batch-size`` flags force
+        # split mode.
+        split = split or continue_on_error or not cascade or batch_size > 1
 
         # collecting existing database UUIDs so we know if we're creating or updating
         # newer versions expose the DB UUID in the API response,
@@ -368,56 +535,39 @@ def native(  # pylint: disable=too-many-locals, too-many-arguments, too-many-bra
                 str(uuid) for uuid in client.get_uuids("database").values()
             }
 
-        # env for Jinja2 templating
-        env = dict(pair.split("=", 1) for pair in option if "=" in pair)  # type: ignore
-        env["instance"] = url
-        env["functions"] = load_user_modules(root / "functions")  # type: ignore
-        env["raise"] = raise_helper  # type: ignore
-        if load_env:
-            env["env"] = os.environ  # type: ignore
-
         pwds = dict(kv.split("=", 1) for kv in db_password or [])
 
         # read all the YAML files
+        paths = discover_configs(root)
+        rendered = load_configs(
+            root,
+            paths,
+            option,
+            url,
+            load_env,
+            disable_jinja_templating,
+            render_processes,
+        )
+
         configs: Dict[Path, AssetConfig] = {}
-        queue = [root]
-        while queue:
-            path_name = queue.pop()
+        for path_name, config in zip(paths, rendered):
             relative_path = path_name.relative_to(root)
 
-            if path_name.is_dir() and not path_name.stem.startswith("."):
-                queue.extend(path_name.glob("*"))
-            elif is_yaml_config(relative_path):
-                config = (
-                    load_yaml(path_name)
-                    if disable_jinja_templating
-                    else render_yaml(path_name, env)
+            config["is_managed_externally"] = disallow_edits
+            if base_url:
+                config["external_url"] = str(
+                    base_url / str(relative_path),
                 )
+            if relative_path.parts[0] == "databases":
+                new_conn = config["uuid"] not in existing_databases
+                add_password_to_config(relative_path, config, pwds, new_conn)
+            if relative_path.parts[0] == "datasets" and isinstance(
+                config.get("params"),
+                str,
+            ):
+                config["params"] = json.loads(cast(str, config["params"]))
 
-                overrides_path = path_name.with_suffix(".overrides" + path_name.suffix)
-                if overrides_path.exists():
-                    overrides = (
-                        load_yaml(overrides_path)
-                        if disable_jinja_templating
-                        else render_yaml(overrides_path, env)
-                    )
-                    dict_merge(config, overrides)
-
-                config["is_managed_externally"] = disallow_edits
-                if base_url:
-                    config["external_url"] = str(
-                        base_url / str(relative_path),
-                    )
-                if relative_path.parts[0] == "databases":
-                    new_conn = config["uuid"] not in existing_databases
-                    add_password_to_config(relative_path, config, pwds, new_conn)
-                if relative_path.parts[0] == "datasets" and isinstance(
-                    config.get("params"),
-                    str,
-                ):
-                    config["params"] = json.loads(cast(str, config["params"]))
-
-                configs["bundle" / relative_path] = config
+            configs["bundle" / relative_path] = config
 
         if split:
             import_resources_individually(
@@ -428,10 +578,20 @@ def native(  # pylint: disable=too-many-locals, too-many-arguments, too-many-bra
                 continue_on_error,
                 cascade=cascade,
                 existing_databases=existing_databases,
+                workers=workers,
+                batch_size=batch_size,
+                compression_level=compression_level,
+                log_file_path=ctx.obj.get("LOG_FILE_PATH"),
             )
         else:
             contents = {str(k): yaml.dump(v) for k, v in configs.items()}
-            import_resources(contents, client, overwrite, asset_type)
+            import_resources(
+                contents,
+                client,
+                overwrite,
+                asset_type,
+                compression_level=compression_level,
+            )
     finally:
         if temp_dir:
             temp_dir.cleanup()
@@ -445,6 +605,10 @@ def import_resources_individually(  # pylint: disable=too-many-locals, too-many-
     continue_on_error: bool = False,
     cascade: bool = True,
     existing_databases: Set[str] | None = None,
+    workers: int = 1,
+    batch_size: int = 1,
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+    log_file_path: Optional[Path] = None,
 ) -> None:
     """
     Import contents individually.
@@ -456,6 +620,16 @@ def import_resources_individually(  # pylint: disable=too-many-locals, too-many-
     By default, the import logs all assets imported correctly to a checkpoint file so that
     if one fails, a future import continues from where it's left. If ``continue_on_error``
     is set to True, then only failures are logged to the file, and the import continues.
+    The checkpoint file is ``progress.log``, unless ``log_file_path`` is given.
+
+    With more than one worker the assets of a given type are imported concurrently. Each
+    type is still imported only after the previous one has finished, so dependencies
+    always exist, and the checkpoint file is only written from the main thread.
+
+    With a ``batch_size`` larger than one, assets of the same type are instead imported
+    in bundles of up to ``batch_size`` assets, one bundle at a time, and ``workers`` is
+    ignored. When a bundle fails it's retried in smaller bundles, down to a single
+    asset, so that failures are still pinpointed.
     """
     imports = [
         ("databases", lambda config: []),
@@ -482,7 +656,7 @@ def import_resources_individually(  # pylint: disable=too-many-locals, too-many-
     asset_configs: Dict[Path, AssetConfig]
     related_configs: Dict[str, Dict[Path, AssetConfig]] = {}
 
-    log_file_path, logs = get_logs(LogType.ASSETS)
+    log_file_path, logs = get_logs(LogType.ASSETS, log_file_path)
     assets_to_skip = {
         Path(path_value)
         for log in logs[LogType.ASSETS]
@@ -506,114 +680,281 @@ def import_resources_individually(  # pylint: disable=too-many-locals, too-many-
             )
         return existing_uuid_cache[cache_key]
 
+    def prepare_asset(
+        resource_name: str,
+        path: Path,
+        config: AssetConfig,
+        asset_configs: Dict[Path, AssetConfig],
+    ) -> bool:
+        """
+        Prepare a single asset for import, returning false if it should be skipped.
+        """
+        skip_database_import = (
+            resource_name == "databases"
+            and asset_type != ResourceType.DATABASE
+            and str(config["uuid"]) in existing_databases
+        )
+        is_primary = asset_type == ResourceType.ASSET or (
+            asset_type.resource_name in resource_name
+        )
+        if skip_database_import:
+            _logger.info(
+                "Skipping database import for existing database %s",
+                path.relative_to("bundle"),
+            )
+            return False
+
+        if not cascade and not is_primary:
+            resource_type = resource_type_map[resource_name].resource_name
+            if _resource_exists(resource_type, config):
+                _logger.info(
+                    "Skipping existing %s %s (cascade disabled)",
+                    resource_name[:-1],
+                    config.get("uuid"),
+                )
+                return False
+
+        if (
+            not cascade
+            and is_primary
+            # Keep DB config in primary dataset no-cascade imports.
+            # Pruning it can skip dataset updates.
+            and resource_name != "datasets"
+        ):
+            _prune_existing_dependency_configs(
+                asset_configs,
+                path,
+                resource_name,
+                dependency_resource_map,
+                _resource_exists,
+            )
+
+        _logger.info("Importing %s", path.relative_to("bundle"))
+
+        if _dispatch_no_cascade_primary_update(
+            resource_name=resource_name,
+            asset_type=asset_type,
+            cascade=cascade,
+            path=path,
+            config=config,
+            configs=configs,
+            client=client,
+            overwrite=overwrite,
+        ):
+            return False
+
+        return True
+
+    def import_bundle(
+        resource_name: str,
+        asset_configs: Dict[Path, AssetConfig],
+    ) -> None:
+        """
+        Import one or more assets of the same type, together with their dependencies.
+        """
+        is_primary = asset_type == ResourceType.ASSET or (
+            asset_type.resource_name in resource_name
+        )
+        contents = {str(k): yaml.dump(v) for k, v in asset_configs.items()}
+        effective_overwrite = overwrite if (cascade or is_primary) else False
+        if resource_name == "databases" and asset_type != ResourceType.DATABASE:
+            effective_overwrite = False
+        import_resources(
+            contents,
+            client,
+            effective_overwrite,
+            resource_type_map[resource_name],
+            compression_level=compression_level,
+        )
+
+    def import_asset(
+        resource_name: str,
+        path: Path,
+        config: AssetConfig,
+        asset_configs: Dict[Path, AssetConfig],
+    ) -> bool:
+        """
+        Import a single asset, returning false if it was skipped.
+        """
+        if not prepare_asset(resource_name, path, config, asset_configs):
+            return False
+
+        import_bundle(resource_name, asset_configs)
+        return True
+
     with open(log_file_path, "w", encoding="utf-8") as log_file:
+        # keep the previous entries, so that they can be appended to
+        write_logs_to_file(log_file, logs)
+
+        def checkpoint(path: Path, config: AssetConfig, status: str) -> None:
+            append_log_to_file(
+                log_file,
+                logs,
+                LogType.ASSETS,
+                {"uuid": config["uuid"], "path": str(path), "status": status},
+            )
+            assets_to_skip.add(path)
+
         for resource_name, get_related_uuids in imports:
+            pending: List[Tuple[Path, AssetConfig, Dict[Path, AssetConfig]]] = []
             for path, config in configs.items():
                 if path.parts[1] != resource_name:
                     continue
 
                 asset_configs = {path: config}
                 _logger.debug("Processing %s for import", path.relative_to("bundle"))
-                asset_log = {
-                    "uuid": config["uuid"],
-                    "path": str(path),
-                    "status": "SUCCESS",
-                }
                 try:
                     for uuid in get_related_uuids(config):
                         related_uuid = str(uuid)
                         if related_uuid in related_configs:
                             asset_configs.update(related_configs[related_uuid])
 
-                    config_uuid = str(config["uuid"])
-                    skip_database_import = (
-                        resource_name == "databases"
-                        and asset_type != ResourceType.DATABASE
-                        and config_uuid in existing_databases
-                    )
                     # Always keep database configs so dependent assets (datasets/charts)
                     # can include the database YAML even when the DB already exists.
-                    related_configs[config_uuid] = asset_configs
+                    related_configs[str(config["uuid"])] = asset_configs
+                except Exception:  # pylint: disable=broad-except
+                    if not continue_on_error:
+                        raise
+                    checkpoint(path, config, "FAILED")
+                    continue
 
-                    is_primary = asset_type == ResourceType.ASSET or (
-                        asset_type.resource_name in resource_name
-                    )
-                    if path in assets_to_skip:
-                        continue
-                    if skip_database_import:
-                        _logger.info(
-                            "Skipping database import for existing database %s",
-                            path.relative_to("bundle"),
-                        )
-                        continue
+                if path not in assets_to_skip:
+                    pending.append((path, config, asset_configs))
+
+            if batch_size > 1:
+                prepared = []
+                for path, config, asset_configs in pending:
+                    try:
+                        if prepare_asset(resource_name, path, config, asset_configs):
+                            prepared.append((path, config, asset_configs))
+                    except Exception:  # pylint: disable=broad-except
+                        if not continue_on_error:
+                            raise
+                        checkpoint(path, config, "FAILED")
+
+                _import_in_batches(
+                    prepared,
+                    partial(import_bundle, resource_name),
+                    checkpoint,
+                    continue_on_error,
+                    batch_size,
+                )
+                continue
 
-                    if not cascade and not is_primary:
-                        resource_type = resource_type_map[resource_name].resource_name
-                        if _resource_exists(resource_type, config):
-                            _logger.info(
-                                "Skipping existing %s %s (cascade disabled)",
-                                resource_name[:-1],
-                                config.get("uuid"),
-                            )
-                            continue
-
-                    if (
-                        not cascade
-                        and is_primary
-                        # Keep DB config in primary dataset no-cascade imports.
-                        # Pruning it can skip dataset updates.
-                        and resource_name != "datasets"
-                    ):
-                        _prune_existing_dependency_configs(
-                            asset_configs,
-                            path,
-                            resource_name,
-                            dependency_resource_map,
-                            _resource_exists,
-                        )
-
-                    _logger.info("Importing %s", path.relative_to("bundle"))
-
-                    if _dispatch_no_cascade_primary_update(
-                        resource_name=resource_name,
-                        asset_type=asset_type,
-                        cascade=cascade,
-                        path=path,
-                        config=config,
-                        configs=configs,
-                        client=client,
-                        overwrite=overwrite,
-                    ):
-                        continue
+            if workers > 1 and len(pending) > 1:
+                _import_concurrently(
+                    pending,
+                    partial(import_asset, resource_name),
+                    checkpoint,
+                    continue_on_error,
+                    workers,
+                )
+                continue
 
-                    contents = {str(k): yaml.dump(v) for k, v in asset_configs.items()}
-                    effective_overwrite = (
-                        overwrite if (cascade or is_primary) else False
-                    )
-                    if (
-                        resource_name == "databases"
-                        and asset_type != ResourceType.DATABASE
-                    ):
-                        effective_overwrite = False
-                    import_resources(
-                        contents,
-                        client,
-                        effective_overwrite,
-                        resource_type_map[resource_name],
-                    )
+            for path, config, asset_configs in pending:
+                try:
+                    if not import_asset(resource_name, path, config, asset_configs):
+                        continue
+                    status = "SUCCESS"
                 except Exception:  # pylint: disable=broad-except
                     if not continue_on_error:
                         raise
-                    asset_log["status"] = "FAILED"
-
-                logs[LogType.ASSETS].append(asset_log)
-                assets_to_skip.add(path)
-                write_logs_to_file(log_file, logs)
+                    status = "FAILED"
+                checkpoint(path, config, status)
 
     if not continue_on_error or not any(
         log["status"] == "FAILED" for log in logs[LogType.ASSETS]
     ):
-        clean_logs(LogType.ASSETS, logs)
+        clean_logs(LogType.ASSETS, logs, log_file_path)
+
+
+def _import_in_batches(
+    prepared: List[Tuple[Path, AssetConfig, Dict[Path, AssetConfig]]],
+    import_bundle: Callable[[Dict[Path, AssetConfig]], None],
+    checkpoint: Callable[[Path, AssetConfig, str], None],
+    continue_on_error: bool,
+    batch_size: int,
+) -> None:
+    """
+    Import assets of the same type in bundles.
+
+    When a bundle fails (eg, because it times out) the batch size is halved and the
+    assets in it are retried, until the failure is narrowed down to a single asset. The
+    batch size grows back after every successful bundle, up to ``batch_size``.
+    """
+    size = batch_size
+    start = 0
+    while start < len(prepared):
+        batch = prepared[start : start + size]
+        bundle: Dict[Path, AssetConfig] = {}
+        for _, _, asset_configs in batch:
+            bundle.update(asset_configs)
+
+        try:
+            import_bundle(bundle)
+        except Exception:  # pylint: disable=broad-except
+            if len(batch) > 1:
+                size = len(batch) // 2
+                _logger.warning(
+                    "Failed to import a bundle of %d assets, retrying in bundles of %d",
+                    len(batch),
+                    size,
+                )
+                continue
+
+            if not continue_on_error:
+                raise
+            path, config, _ = batch[0]
+            checkpoint(path, config, "FAILED")
+        else:
+            for path, config, _ in batch:
+                checkpoint(path, config, "SUCCESS")
+            size = min(size * 2, batch_size)
+
+        start += len(batch)
+
+
+def _import_concurrently(
+    pending: List[Tuple[Path, AssetConfig, Dict[Path, AssetConfig]]],
+    import_asset: Callable[[Path, AssetConfig, Dict[Path, AssetConfig]], bool],
+    checkpoint: Callable[[Path, AssetConfig, str], None],
+    continue_on_error: bool,
+    workers: int,
+) -> None:
+    """
+    Import assets of the same type concurrently.
+
+    Results are checkpointed as they complete. Unless ``continue_on_error`` is set the
+    first failure cancels the assets that haven't started yet, and is raised once the
+    ones already running have finished (and been checkpointed).
+    """
+    error: Exception | None = None
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(import_asset, path, config, asset_configs): (path, config)
+            for path, config, asset_configs in pending
+        }
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+
+            path, config = futures[future]
+            try:
+                if not future.result():
+                    continue
+                status = "SUCCESS"
+            except Exception as ex:  # pylint: disable=broad-except
+                if not continue_on_error:
+                    if error is None:
+                        error = ex
+                        for other in futures:
+                            other.cancel()
+                    continue
+                status = "FAILED"
+            checkpoint(path, config, status)
+
+    if error is not None:
+        raise error
 
 
 def _dispatch_no_cascade_primary_update(  # pylint: disable=too-many-arguments
@@ -779,7 +1120,7 @@ def _resolve_uuid_to_id(
 
     uuid_str = str(uuid_value)
     if resources is None:
-        resources = client.get_resources(resource_name)
+        resources = client.get_resources(resource_name, columns=["id", "uuid"])
     for resource in resources:
         if str(resource.get("uuid")) == uuid_str:
             resource_id = resource.get("id")
@@ -1062,9 +1403,13 @@ def import_resources(
     client: SupersetClient,
     overwrite: bool,
     asset_type: ResourceType,
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
 ) -> None:
     """
     Import a bundle of assets.
+
+    The bundle is compressed with DEFLATE into a temporary file, which is streamed to
+    the server.
     """
     contents["bundle/metadata.yaml"] = yaml.dump(
         dict(
@@ -1074,39 +1419,40 @@ def import_resources(
         ),
     )
 
-    buf = BytesIO()
-    with ZipFile(buf, "w") as bundle:
-        for file_path, file_content in contents.items():
-            with bundle.open(file_path, "w") as output:
-                output.write(file_content.encode())
-    buf.seek(0)
-    try:
-        client.import_zip(asset_type.resource_name, buf, overwrite=overwrite)
-    except SupersetError as ex:
-        click.echo(
-            click.style(
-                "\n".join(error["message"] for error in ex.errors),
-                fg="bright_red",
-            ),
+    with tempfile.TemporaryFile() as buf:
+        write_deflated_zip(
+            buf,
+            {file_path: content.encode() for file_path, content in contents.items()},
+            compression_level,
         )
+        buf.seek(0)
+        try:
+            client.import_zip(asset_type.resource_name, buf, overwrite=overwrite)
+        except SupersetError as ex:
+            click.echo(
+                click.style(
+                    "\n".join(error["message"] for error in ex.errors),
+                    fg="bright_red",
+                ),
+            )
 
-        # check if overwrite is needed:
-        existing = [
-            key
-            for error in ex.errors
-            for key, value in error.get("extra", {}).items()
-            if "overwrite=true" in value
-        ]
-        if not existing:
-            raise ex
-
-        existing_list = "\n".join("- " + name for name in existing)
-        click.echo(
-            click.style(
-                (
-                    "The following file(s) already exist. Pass ``--overwrite`` to "
-                    f"replace them.\n{existing_list}"
+            # check if overwrite is needed:
+            existing = [
+                key
+                for error in ex.errors
+                for key, value in error.get("extra", {}).items()
+                if "overwrite=true" in value
+            ]
+            if not existing:
+                raise ex
+
+            existing_list = "\n".join("- " + name for name in existing)
+            click.echo(
+                click.style(
+                    (
+                        "The following file(s) already exist. Pass ``--overwrite`` to "
+                        f"replace them.\n{existing_list}"
+                    ),
+                    fg="bright_red",
                 ),
-                fg="bright_red",
-            ),
-        )
+            )
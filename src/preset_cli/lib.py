@@ -5,14 +5,34 @@ Basic helper functions.
 import functools
 import json
 import logging
+import os
+import shutil
+import struct
 import sys
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, cast
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+from zipfile import ZIP_DEFLATED, BadZipFile, ZipFile, ZipInfo
 
 import click
 from requests import Response
 from rich.logging import RichHandler
 
+from preset_cli.api.stats import HTTPStats
 from preset_cli.exceptions import CLIError, ErrorLevel, ErrorPayload, SupersetError
 
 _logger = logging.getLogger(__name__)
@@ -26,6 +46,162 @@ def remove_root(file_path: str) -> str:
     return str(Path(*full_path.parts[1:]))
 
 
+# fields of the local file header, see ``zipfile.structFileHeader``
+_FH_SIGNATURE = 0
+_FH_FILENAME_LENGTH = 10
+_FH_EXTRA_FIELD_LENGTH = 11
+_DATA_DESCRIPTOR_FLAG = 0x08
+COPY_CHUNK_SIZE = 2**20
+DEFAULT_COMPRESSION_LEVEL = 6
+
+# Copying compressed data as is relies on undocumented ``zipfile`` internals: the
+# local header struct, and the ``fp``, ``start_dir``, ``filelist`` and
+# ``NameToInfo`` attributes of ``ZipFile``. They're only used in the CPython
+# versions where they're known to exist; elsewhere members are recompressed.
+_ZIP_INTERNALS = (
+    sys.implementation.name == "cpython"
+    and (3, 8) <= sys.version_info[:2] <= (3, 13)
+    and all(
+        hasattr(zipfile, name)
+        for name in ("structFileHeader", "sizeFileHeader", "stringFileHeader")
+    )
+)
+_ZIP_ATTRIBUTES = ("fp", "start_dir", "filelist", "NameToInfo")
+
+
+def _has_zip_internals(*zip_files: ZipFile) -> bool:
+    """
+    Check if compressed data can be copied as is to and from ZIP files.
+    """
+    return _ZIP_INTERNALS and all(
+        hasattr(zip_file, name) for zip_file in zip_files for name in _ZIP_ATTRIBUTES
+    )
+
+
+def copy_zip_member(source: ZipFile, info: ZipInfo, target: ZipFile) -> None:
+    """
+    Copy a member between ZIP files without decompressing and recompressing it.
+
+    The compressed data is copied as is, with a new local header built from the
+    sizes and CRC in the central directory of the source. The target must be open
+    for writing, with no member being written.
+
+    When the ``zipfile`` internals needed for that are not available the member is
+    decompressed and recompressed instead.
+    """
+    member = ZipInfo(info.filename, info.date_time)
+    member.compress_type = info.compress_type
+    member.create_system = info.create_system
+    member.external_attr = info.external_attr
+    member.comment = info.comment
+    member.file_size = info.file_size
+
+    if not _has_zip_internals(source, target):
+        with source.open(info) as input_, target.open(member, "w") as output:
+            shutil.copyfileobj(input_, output, COPY_CHUNK_SIZE)
+        return
+
+    source_fp = cast(Any, source.fp)
+    source_fp.seek(info.header_offset)
+    header = struct.unpack(
+        zipfile.structFileHeader,  # type: ignore[attr-defined]
+        source_fp.read(zipfile.sizeFileHeader),  # type: ignore[attr-defined]
+    )
+    if header[_FH_SIGNATURE] != zipfile.stringFileHeader:  # type: ignore[attr-defined]
+        raise BadZipFile(f"Bad magic number for file header: {info.filename}")
+    source_fp.seek(
+        header[_FH_FILENAME_LENGTH] + header[_FH_EXTRA_FIELD_LENGTH],
+        os.SEEK_CUR,
+    )
+
+    member.CRC = info.CRC
+    member.compress_size = info.compress_size
+    # the sizes are known, so there's no need for a data descriptor
+    member.flag_bits = info.flag_bits & ~_DATA_DESCRIPTOR_FLAG
+
+    def read_chunks() -> Iterator[bytes]:
+        remaining = info.compress_size
+        while remaining > 0:
+            data = source_fp.read(min(remaining, COPY_CHUNK_SIZE))
+            if not data:
+                raise BadZipFile(f"Truncated file: {info.filename}")
+            yield data
+            remaining -= len(data)
+
+    _write_raw_member(target, member, read_chunks())
+
+
+def _write_raw_member(
+    target: ZipFile,
+    member: ZipInfo,
+    chunks: Iterable[bytes],
+) -> None:
+    """
+    Write an already compressed member to a ZIP file open for writing.
+
+    The CRC and sizes of the member must be set, since they go in the local header.
+    """
+    target_fp = cast(Any, target.fp)
+    target_fp.seek(target.start_dir)
+    member.header_offset = target.start_dir
+    target_fp.write(member.FileHeader())
+    for chunk in chunks:
+        target_fp.write(chunk)
+
+    target.filelist.append(member)
+    target.NameToInfo[member.filename] = member
+    target.start_dir = target_fp.tell()
+
+
+def _deflate(data: bytes, compression_level: int) -> Tuple[bytes, int]:
+    """
+    Compress data as a raw DEFLATE stream, returning it with the CRC of the input.
+    """
+    compressor = zlib.compressobj(compression_level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(), zlib.crc32(data)
+
+
+def write_deflated_zip(
+    target: IO[bytes],
+    contents: Dict[str, bytes],
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+    max_workers: Optional[int] = None,
+) -> None:
+    """
+    Write a DEFLATE compressed ZIP file, compressing the members in parallel.
+
+    ``zlib`` releases the GIL while compressing, so members are compressed by a pool
+    of threads and then written in order. When the ``zipfile`` internals needed to
+    write compressed data are not available members are compressed serially.
+    """
+    date_time = time.localtime(time.time())[:6]
+    with ZipFile(target, "w") as bundle, ThreadPoolExecutor(max_workers) as executor:
+        if not _has_zip_internals(bundle):
+            for file_path, data in contents.items():
+                member = ZipInfo(file_path, date_time)
+                member.external_attr = 0o600 << 16
+                bundle.writestr(
+                    member,
+                    data,
+                    compress_type=ZIP_DEFLATED,
+                    compresslevel=compression_level,
+                )
+            return
+
+        compressed = executor.map(
+            lambda data: _deflate(data, compression_level),
+            contents.values(),
+        )
+        for (file_path, data), (payload, crc) in zip(contents.items(), compressed):
+            member = ZipInfo(file_path, date_time)
+            member.compress_type = ZIP_DEFLATED
+            member.external_attr = 0o600 << 16
+            member.CRC = crc
+            member.file_size = len(data)
+            member.compress_size = len(payload)
+            _write_raw_member(bundle, member, [payload])
+
+
 def setup_logging(loglevel: str) -> None:
     """
     Setup basic logging.
@@ -45,6 +221,33 @@ def setup_logging(loglevel: str) -> None:
     logging.captureWarnings(True)
 
 
+def setup_http_stats(
+    ctx: click.core.Context,
+    enabled: bool,
+    destination: Optional[str] = None,
+) -> None:
+    """
+    Collect statistics about HTTP requests, reporting them when the command exits.
+
+    The statistics are printed to stderr, or written as JSON to ``destination`` if
+    it's passed.
+    """
+    if not (enabled or destination) or "AUTH" not in ctx.obj or "HTTP_STATS" in ctx.obj:
+        return
+
+    stats = ctx.obj["HTTP_STATS"] = HTTPStats()
+    stats.install(ctx.obj["AUTH"].session)
+
+    def report() -> None:
+        if destination is None:
+            click.echo(stats.format(), err=True)
+        else:
+            with open(destination, "w", encoding="utf-8") as output:
+                json.dump(stats.to_dict(), output, indent=4)
+
+    ctx.call_on_close(report)
+
+
 def deserialize_error_level(errors: List[Dict[str, Any]]) -> List[ErrorPayload]:
     """
     Convert error level from string to enum.
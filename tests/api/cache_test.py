@@ -0,0 +1,211 @@
+"""
+Tests for ``preset_cli.api.cache``.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import requests
+from freezegun import freeze_time
+from requests_mock.mocker import Mocker
+
+from preset_cli.api.cache import HTTPCache, ResultCache, normalize_sql
+
+URL = "https://superset.example.org/api/v1/chart/1"
+
+
+def test_http_cache_ttl(requests_mock: Mocker, tmp_path: Path) -> None:
+    """
+    Test that responses without validators are reused until they expire.
+    """
+    requests_mock.get(
+        URL,
+        json={"result": {"id": 1}},
+        headers={"Content-Type": "application/json"},
+    )
+    cache = HTTPCache(tmp_path, ttl=60)
+    session = requests.Session()
+
+    with freeze_time("2024-01-01 00:00:00"):
+        assert cache.get(session, URL, "scope").json() == {"result": {"id": 1}}
+        response = cache.get(session, URL, "scope")
+    assert response.status_code == 200
+    assert response.json() == {"result": {"id": 1}}
+    assert response.headers["Content-Type"] == "application/json"
+    assert requests_mock.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # a different scope doesn't share responses
+    with freeze_time("2024-01-01 00:00:30"):
+        cache.get(session, URL, "other")
+    assert requests_mock.call_count == 2
+
+    with freeze_time("2024-01-01 00:01:01"):
+        cache.get(session, URL, "scope")
+    assert requests_mock.call_count == 3
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_http_cache_revalidation(requests_mock: Mocker, tmp_path: Path) -> None:
+    """
+    Test that responses with an ``ETag`` are revalidated.
+    """
+    requests_mock.get(
+        URL,
+        [
+            {"json": {"result": {"id": 1}}, "headers": {"ETag": '"v1"'}},
+            {"status_code": 304},
+            {"json": {"result": {"id": 2}}, "headers": {"ETag": '"v2"'}},
+        ],
+    )
+    session = requests.Session()
+
+    assert HTTPCache(tmp_path).get(session, URL, "scope").json()["result"]["id"] == 1
+    assert "If-None-Match" not in requests_mock.last_request.headers
+
+    # the cache persists between instances
+    cache = HTTPCache(tmp_path)
+    assert cache.get(session, URL, "scope").json()["result"]["id"] == 1
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+    assert cache.get(session, URL, "scope").json()["result"]["id"] == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_http_cache_errors_not_cached(requests_mock: Mocker, tmp_path: Path) -> None:
+    """
+    Test that only successful responses are stored.
+    """
+    requests_mock.get(URL, status_code=500)
+    cache = HTTPCache(tmp_path)
+    session = requests.Session()
+
+    assert cache.get(session, URL, "scope").status_code == 500
+    assert cache.get(session, URL, "scope").status_code == 500
+    assert requests_mock.call_count == 2
+    assert not list(tmp_path.iterdir())
+
+
+def test_http_cache_invalidate(requests_mock: Mocker, tmp_path: Path) -> None:
+    """
+    Test ``invalidate`` and ``clear``.
+    """
+    requests_mock.get(URL, json={})
+    requests_mock.get(f"{URL}0", json={})
+    cache = HTTPCache(tmp_path)
+    session = requests.Session()
+
+    cache.get(session, URL, "scope")
+    cache.get(session, f"{URL}0", "scope")
+    cache.invalidate(URL, "scope")
+    cache.invalidate(URL, "scope")
+    cache.get(session, URL, "scope")
+    cache.get(session, f"{URL}0", "scope")
+    assert requests_mock.call_count == 3
+
+    cache.clear()
+    assert not list(tmp_path.iterdir())
+
+
+def test_http_cache_eviction(requests_mock: Mocker, tmp_path: Path) -> None:
+    """
+    Test that the least recently used responses are evicted.
+    """
+    for i in range(3):
+        requests_mock.get(f"{URL}{i}", content=b"x" * 1000)
+    cache = HTTPCache(tmp_path, max_size=2500)
+    session = requests.Session()
+
+    with freeze_time("2024-01-01 00:00:00"):
+        cache.get(session, f"{URL}0", "scope")
+    with freeze_time("2024-01-01 00:00:01"):
+        cache.get(session, f"{URL}1", "scope")
+    with freeze_time("2024-01-01 00:00:02"):
+        # marks the first response as recently used
+        cache.get(session, f"{URL}0", "scope")
+    with freeze_time("2024-01-01 00:00:03"):
+        cache.get(session, f"{URL}2", "scope")
+
+    assert len(list(tmp_path.iterdir())) == 2
+    assert requests_mock.call_count == 3
+    with freeze_time("2024-01-01 00:00:04"):
+        cache.get(session, f"{URL}0", "scope")
+        assert requests_mock.call_count == 3
+        cache.get(session, f"{URL}1", "scope")
+        assert requests_mock.call_count == 4
+
+
+def test_normalize_sql() -> None:
+    """
+    Test ``normalize_sql``.
+    """
+    assert normalize_sql("  SELECT 1\n  AS a ;\n") == "SELECT 1 AS a"
+    assert (
+        normalize_sql("SELECT  'a  b',\t\"c  d\"  FROM `e  f`  WHERE x = 'it''s  ok';")
+        == "SELECT 'a  b', \"c  d\" FROM `e  f` WHERE x = 'it''s  ok'"
+    )
+
+    # line comments end at a newline, so they're removed before collapsing it
+    assert normalize_sql("SELECT a -- note\nFROM t") == "SELECT a FROM t"
+    assert normalize_sql("SELECT a -- note FROM t") == "SELECT a"
+    assert normalize_sql("SELECT 1; -- done\n") == "SELECT 1"
+    assert normalize_sql("SELECT '--  a' /*  b */  FROM t") == (
+        "SELECT '--  a' /*  b */ FROM t"
+    )
+
+
+def test_result_cache(tmp_path: Path) -> None:
+    """
+    Test that results are stored as Parquet, and reused until they expire.
+    """
+    cache = ResultCache(tmp_path, ttl=60)
+    key = ("https://superset.example.org/", "scope", 1, None, "SELECT 1", 1000)
+    dataframe = pd.DataFrame([{"a": 1, "b": "x"}, {"a": 2, "b": None}])
+
+    with freeze_time("2024-01-01 00:00:00"):
+        assert cache.get(key) is None
+        cache.set(key, dataframe)
+    assert [path.suffix for path in tmp_path.iterdir()] == [".parquet"]
+
+    with freeze_time("2024-01-01 00:00:30"):
+        pd.testing.assert_frame_equal(cache.get(key), dataframe)
+        assert cache.get(key[:-1] + (10,)) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    with freeze_time("2024-01-01 00:01:01"):
+        assert cache.get(key) is None
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    # corrupted entries are ignored
+    next(tmp_path.iterdir()).write_bytes(b"invalid")
+    assert cache.get(key) is None
+
+    # results that can't be converted to Arrow are not cached
+    cache.clear()
+    cache.set(key, pd.DataFrame([{"a": 1}, {"a": "x"}]))
+    assert not list(tmp_path.iterdir())
+
+
+def test_result_cache_eviction(tmp_path: Path) -> None:
+    """
+    Test that the least recently used results are evicted.
+    """
+    dataframe = pd.DataFrame({"a": range(100)})
+    cache = ResultCache(tmp_path)
+    cache.set(("size",), dataframe)
+    size = next(tmp_path.iterdir()).stat().st_size
+    cache.clear()
+
+    cache = ResultCache(tmp_path, max_size=2 * size)
+    with freeze_time("2024-01-01 00:00:00"):
+        cache.set(("first",), dataframe)
+    with freeze_time("2024-01-01 00:00:01"):
+        cache.set(("second",), dataframe)
+    with freeze_time("2024-01-01 00:00:02"):
+        assert cache.get(("first",)) is not None
+        cache.set(("third",), dataframe)
+
+    assert len(list(tmp_path.iterdir())) == 2
+    with freeze_time("2024-01-01 00:00:03"):
+        assert cache.get(("first",)) is not None
+        assert cache.get(("second",)) is None
+        assert cache.get(("third",)) is not None
@@ -0,0 +1,338 @@
+"""
+Tests for ``preset_cli.api.clients.superset_async``.
+"""
+
+# pylint: disable=unused-argument
+
+import asyncio
+import json
+from io import BytesIO
+from typing import Any, Awaitable, Callable, Dict, List
+from zipfile import ZipFile
+
+import prison
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from yarl import URL
+
+from preset_cli.api.clients.superset_async import AsyncSupersetClient
+from preset_cli.auth.main import Auth
+from preset_cli.exceptions import SupersetError
+
+
+class CountingAuth(Auth):
+    """
+    An auth that issues a new token every time it authenticates.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def get_headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer token{self.calls}"}
+
+    def auth(self) -> None:
+        self.calls += 1
+
+
+def run_with_server(
+    routes: List[web.RouteDef],
+    function: Callable[[URL], Awaitable[Any]],
+) -> Any:
+    """
+    Run a coroutine function against a test server with the given routes.
+    """
+
+    async def main() -> Any:
+        app = web.Application()
+        app.add_routes(routes)
+        async with TestServer(app) as server:
+            return await function(URL(str(server.make_url("/"))))
+
+    return asyncio.run(main())
+
+
+def test_get_resource() -> None:
+    """
+    Test the ``get_resource`` method.
+    """
+
+    async def handler(request: web.Request) -> web.Response:
+        assert request.headers["Authorization"] == "Bearer token0"
+        assert request.headers["Accept"] == "application/json"
+        return web.json_response({"result": {"id": int(request.match_info["id"])}})
+
+    async def function(url: URL) -> Any:
+        async with AsyncSupersetClient(url, CountingAuth()) as client:
+            return await asyncio.gather(
+                *(client.get_resource("chart", id_) for id_ in range(1, 4)),
+            )
+
+    assert run_with_server([web.get("/api/v1/chart/{id}", handler)], function) == [
+        {"id": 1},
+        {"id": 2},
+        {"id": 3},
+    ]
+
+
+def test_get_resources() -> None:
+    """
+    Test the ``get_resources`` method, with pages fetched concurrently.
+    """
+    pages: List[int] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        query = prison.loads(request.query["q"])
+        assert query["filters"] == [{"col": "slice_name", "opr": "eq", "value": "x"}]
+        page = query["page"]
+        pages.append(page)
+        result = [{"id": i} for i in range(page * 100, min((page + 1) * 100, 250))]
+        return web.json_response({"result": result, "count": 250})
+
+    async def function(url: URL) -> Any:
+        async with AsyncSupersetClient(url, CountingAuth()) as client:
+            return await client.get_resources("chart", slice_name="x")
+
+    resources = run_with_server([web.get("/api/v1/chart/", handler)], function)
+    assert resources == [{"id": i} for i in range(250)]
+    assert sorted(pages) == [0, 1, 2]
+
+
+def test_get_resources_no_count() -> None:
+    """
+    Test the ``get_resources`` method when the API doesn't return a count.
+    """
+
+    async def handler(request: web.Request) -> web.Response:
+        page = prison.loads(request.query["q"])["page"]
+        return web.json_response({"result": [{"id": page}] if page < 3 else []})
+
+    async def function(url: URL) -> Any:
+        async with AsyncSupersetClient(url, CountingAuth()) as client:
+            return await client.get_resources("chart")
+
+    resources = run_with_server([web.get("/api/v1/chart/", handler)], function)
+    assert resources == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
+def test_reauth() -> None:
+    """
+    Test that concurrent 401s re-authenticate only once.
+    """
+    auth = CountingAuth()
+
+    async def handler(request: web.Request) -> web.Response:
+        if request.headers["Authorization"] != "Bearer token1":
+            return web.json_response({"message": "Unauthorized"}, status=401)
+        return web.json_response({"result": {"id": 1}})
+
+    async def function(url: URL) -> Any:
+        async with AsyncSupersetClient(url, auth) as client:
+            return await asyncio.gather(
+                *(client.get_resource("chart", 1) for _ in range(10)),
+            )
+
+    results = run_with_server([web.get("/api/v1/chart/{id}", handler)], function)
+    assert results == [{"id": 1}] * 10
+    assert auth.calls == 1
+
+
+def test_reauth_not_implemented() -> None:
+    """
+    Test that a 401 is returned if the auth doesn't support re-authentication.
+    """
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(text="Unauthorized", status=401)
+
+    async def function(url: URL) -> Any:
+        async with AsyncSupersetClient(url, Auth()) as client:
+            return await client.get_resource("chart", 1)
+
+    with pytest.raises(SupersetError) as excinfo:
+        run_with_server([web.get("/api/v1/chart/{id}", handler)], function)
+    assert excinfo.value.errors[0]["message"] == "Unauthorized"
+
+
+def test_update_resource() -> None:
+    """
+    Test the ``update_resource`` method.
+    """
+
+    async def handler(request: web.Request) -> web.Response:
+        assert request.query["override_columns"] == "true"
+        return web.json_response({"id": 1, "result": await request.json()})
+
+    async def function(url: URL) -> Any:
+        async with AsyncSupersetClient(url, CountingAuth()) as client:
+            return await client.update_resource(
+                "dataset",
+                1,
+                query_args={"override_columns": "true"},
+                description="A dataset",
+            )
+
+    assert run_with_server([web.put("/api/v1/dataset/1", handler)], function) == {
+        "id": 1,
+        "result": {"description": "A dataset"},
+    }
+
+
+def make_bundle(files: Dict[str, str]) -> bytes:
+    """
+    Build a ZIP file.
+    """
+    buf = BytesIO()
+    with ZipFile(buf, "w") as bundle:
+        for name, content in files.items():
+            bundle.writestr(name, content)
+    return buf.getvalue()
+
+
+def test_export_zip(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test the ``export_zip`` method, with batches exported concurrently.
+    """
+    monkeypatch.setattr(
+        "preset_cli.api.clients.superset_async.MAX_IDS_IN_EXPORT",
+        2,
+    )
+
+    async def handler(request: web.Request) -> web.Response:
+        ids = prison.loads(request.query["q"])
+        return web.Response(
+            body=make_bundle({f"bundle/charts/{id_}.yaml": str(id_) for id_ in ids}),
+        )
+
+    async def function(url: URL) -> Any:
+        async with AsyncSupersetClient(url, CountingAuth()) as client:
+            return await client.export_zip("chart", [1, 2, 3])
+
+    buf = run_with_server([web.get("/api/v1/chart/export/", handler)], function)
+    with ZipFile(buf) as bundle:
+        assert {name: bundle.read(name).decode() for name in bundle.namelist()} == {
+            "bundle/charts/1.yaml": "1",
+            "bundle/charts/2.yaml": "2",
+            "bundle/charts/3.yaml": "3",
+        }
+
+
+def test_import_zip() -> None:
+    """
+    Test the ``import_zip`` method, including a retry after a 401.
+    """
+    auth = CountingAuth()
+    received: List[Dict[str, Any]] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        form = await request.post()
+        received.append(
+            {
+                "overwrite": form["overwrite"],
+                "bundle": form["bundle"].file.read(),  # type: ignore
+            },
+        )
+        if request.headers["Authorization"] == "Bearer token0":
+            return web.json_response({"message": "Unauthorized"}, status=401)
+        return web.json_response({"message": "OK"})
+
+    async def function(url: URL) -> Any:
+        async with AsyncSupersetClient(url, auth) as client:
+            return await client.import_zip("assets", BytesIO(b"data"), overwrite=True)
+
+    assert run_with_server([web.post("/api/v1/assets/import/", handler)], function)
+    assert received == [{"overwrite": "true", "bundle": b"data"}] * 2
+
+
+def test_run_query() -> None:
+    """
+    Test the ``run_query`` method.
+    """
+
+    async def handler(request: web.Request) -> web.Response:
+        payload = await request.json()
+        assert payload["sql"] == "SELECT 1 AS a"
+        assert payload["queryLimit"] == 10
+        return web.json_response({"data": [{"a": 1}]})
+
+    async def function(url: URL) -> Any:
+        async with AsyncSupersetClient(url, CountingAuth()) as client:
+            return await client.run_query(1, "SELECT 1 AS a", limit=10)
+
+    df = run_with_server([web.post("/api/v1/sqllab/execute/", handler)], function)
+    assert df.to_dict(orient="records") == [{"a": 1}]
+
+
+def test_run_query_legacy() -> None:
+    """
+    Test the ``run_query`` method on instances without the SQL Lab API.
+    """
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response({"data": [{"a": 1}]})
+
+    async def function(url: URL) -> Any:
+        async with AsyncSupersetClient(url, CountingAuth()) as client:
+            return await client.run_query(1, "SELECT 1 AS a")
+
+    df = run_with_server([web.post("/superset/sql_json/", handler)], function)
+    assert df.to_dict(orient="records") == [{"a": 1}]
+
+
+def test_get_data() -> None:
+    """
+    Test the ``get_data`` method.
+    """
+
+    async def get_dataset(request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "result": {
+                    "columns": [{"column_name": "ts", "is_dttm": True}],
+                    "metrics": [{"metric_name": "count"}],
+                },
+            },
+        )
+
+    async def get_data(request: web.Request) -> web.Response:
+        payload = await request.json()
+        assert payload["datasource"] == {"id": 1, "type": "table"}
+        assert payload["queries"][0]["metrics"] == ["count"]
+        return web.json_response({"result": [{"data": [{"count": 10}]}]})
+
+    async def function(url: URL) -> Any:
+        async with AsyncSupersetClient(url, CountingAuth()) as client:
+            return await client.get_data(1, ["count"], [])
+
+    df = run_with_server(
+        [
+            web.get("/api/v1/dataset/1", get_dataset),
+            web.post("/api/v1/chart/data", get_data),
+        ],
+        function,
+    )
+    assert df.to_dict(orient="records") == [{"count": 10}]
+
+
+def test_validate_error() -> None:
+    """
+    Test that errors are raised as ``SupersetError``.
+    """
+
+    async def handler(request: web.Request) -> web.Response:
+        # Superset doesn't send a charset, which aiohttp adds by default
+        return web.Response(
+            body=json.dumps({"errors": [{"message": "Not found", "level": "error"}]}),
+            status=404,
+            headers={"Content-Type": "application/json"},
+        )
+
+    async def function(url: URL) -> Any:
+        async with AsyncSupersetClient(url, CountingAuth()) as client:
+            return await client.get_resource("chart", 1)
+
+    with pytest.raises(SupersetError) as excinfo:
+        run_with_server([web.get("/api/v1/chart/{id}", handler)], function)
+    assert excinfo.value.errors[0]["message"] == "Not found"
@@ -5,24 +5,32 @@ Tests for ``preset_cli.api.clients.superset``.
 # pylint: disable=too-many-lines, trailing-whitespace, line-too-long, use-implicit-booleaness-not-comparison
 
 import json
+import tempfile
+from datetime import datetime
 from io import BytesIO
+from pathlib import Path
+from typing import IO, List
 from unittest import mock
 from urllib.parse import unquote_plus
 from uuid import UUID
-from zipfile import ZipFile, is_zipfile
+from zipfile import ZIP_DEFLATED, ZipFile, is_zipfile
 
+import pyarrow as pa
 import pytest
 import yaml
 from pytest_mock import MockerFixture
 from requests_mock.mocker import Mocker
 from yarl import URL
 
+from preset_cli.api.cache import HTTPCache, ResultCache
 from preset_cli.api.clients.superset import (
     RoleType,
     RuleType,
     SupersetClient,
+    build_time_windows,
     convert_to_adhoc_column,
     convert_to_adhoc_metric,
+    convert_to_arrow_table,
     parse_html_array,
 )
 from preset_cli.api.operators import OneToMany
@@ -261,6 +269,492 @@ def test_run_query_error(requests_mock: Mocker) -> None:
     ]
 
 
+def test_run_query_async(mocker: MockerFixture, requests_mock: Mocker) -> None:
+    """
+    Test the ``run_query_async`` method.
+    """
+    mocker.patch("preset_cli.api.clients.superset.shortid", return_value="IrwwY8Ky14")
+    sleep = mocker.patch("preset_cli.api.clients.superset.time.sleep")
+
+    requests_mock.post(
+        "https://superset.example.org/api/v1/sqllab/execute/",
+        json={"query": {"id": "IrwwY8Ky14", "queryId": 2, "state": "pending"}},
+        status_code=202,
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/query/2",
+        [
+            {"json": {"result": {"status": "pending"}}},
+            {"json": {"result": {"status": "running"}}},
+            {"json": {"result": {"status": "success"}}},
+        ],
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/sqllab/export/IrwwY8Ky14/",
+        text="value,name\n1,a\n2,b\n3,c\n",
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    chunks = client.run_query_async(
+        database_id=1,
+        sql="SELECT value, name FROM t",
+        chunk_size=2,
+    )
+    assert [chunk.to_dict(orient="records") for chunk in chunks] == [
+        [{"value": 1, "name": "a"}, {"value": 2, "name": "b"}],
+        [{"value": 3, "name": "c"}],
+    ]
+    assert requests_mock.request_history[0].json()["runAsync"] is True
+    assert requests_mock.request_history[0].json()["queryLimit"] is None
+    sleep.assert_has_calls([mock.call(0.5), mock.call(1.0)])
+
+
+def test_run_query_async_legacy_endpoint(
+    mocker: MockerFixture,
+    requests_mock: Mocker,
+) -> None:
+    """
+    Test the ``run_query_async`` method for legacy Superset instances.
+    """
+    mocker.patch("preset_cli.api.clients.superset.shortid", return_value="IrwwY8Ky14")
+
+    requests_mock.post(
+        "https://superset.example.org/api/v1/sqllab/execute/",
+        status_code=404,
+    )
+    requests_mock.post(
+        "https://superset.example.org/superset/sql_json/",
+        json={"query": {"id": "IrwwY8Ky14", "queryId": 2, "state": "pending"}},
+        status_code=202,
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/query/2",
+        json={"result": {"status": "success"}},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/sqllab/export/IrwwY8Ky14/",
+        status_code=404,
+    )
+    requests_mock.get(
+        "https://superset.example.org/superset/csv/IrwwY8Ky14",
+        text="value\n1\n",
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    chunks = list(client.run_query_async(database_id=1, sql="SELECT 1 AS value"))
+    assert len(chunks) == 1
+    assert chunks[0].to_dict() == {"value": {0: 1}}
+
+
+def test_run_query_async_sync_fallback(requests_mock: Mocker) -> None:
+    """
+    Test ``run_query_async`` when the database runs the query synchronously.
+    """
+    requests_mock.post(
+        "https://superset.example.org/api/v1/sqllab/execute/",
+        json={"data": [{"value": 1}, {"value": 2}, {"value": 3}]},
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    chunks = client.run_query_async(database_id=1, sql="SELECT 1", chunk_size=2)
+    assert [chunk["value"].tolist() for chunk in chunks] == [[1, 2], [3]]
+
+    requests_mock.post(
+        "https://superset.example.org/api/v1/sqllab/execute/",
+        json={"data": []},
+    )
+    chunks = client.run_query_async(database_id=1, sql="SELECT 1", chunk_size=2)
+    assert [len(chunk) for chunk in chunks] == [0]
+
+
+def test_run_query_async_failed(requests_mock: Mocker) -> None:
+    """
+    Test ``run_query_async`` when the query fails.
+    """
+    requests_mock.post(
+        "https://superset.example.org/api/v1/sqllab/execute/",
+        json={"query": {"id": "IrwwY8Ky14", "queryId": 2, "state": "pending"}},
+        status_code=202,
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/query/2",
+        json={"result": {"status": "failed", "error_message": "Table not found"}},
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    with pytest.raises(SupersetError) as excinfo:
+        client.run_query_async(database_id=1, sql="SELECT * FROM t")
+    assert excinfo.value.errors == [
+        {
+            "message": "Table not found",
+            "error_type": "GENERIC_DB_ENGINE_ERROR",
+            "level": ErrorLevel.ERROR,
+        },
+    ]
+
+    requests_mock.get(
+        "https://superset.example.org/api/v1/query/2",
+        json={"result": {"status": "stopped"}},
+    )
+    with pytest.raises(SupersetError) as excinfo:
+        client.run_query_async(database_id=1, sql="SELECT * FROM t")
+    assert excinfo.value.errors[0]["message"] == "Query finished with status stopped"
+
+
+def test_run_query_async_timeout(mocker: MockerFixture, requests_mock: Mocker) -> None:
+    """
+    Test ``run_query_async`` when the query doesn't finish in time.
+    """
+    time = mocker.patch("preset_cli.api.clients.superset.time")
+    time.monotonic.return_value = 0
+    time.sleep.side_effect = lambda delay: setattr(
+        time.monotonic,
+        "return_value",
+        time.monotonic.return_value + delay,
+    )
+
+    requests_mock.post(
+        "https://superset.example.org/api/v1/sqllab/execute/",
+        json={"query": {"id": "IrwwY8Ky14", "queryId": 2, "state": "pending"}},
+        status_code=202,
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/query/2",
+        json={"result": {"status": "running"}},
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    with pytest.raises(SupersetError) as excinfo:
+        client.run_query_async(database_id=1, sql="SELECT 1", timeout=30)
+    assert excinfo.value.errors == [
+        {
+            "message": "Query 2 is still running",
+            "error_type": "SQLLAB_TIMEOUT_ERROR",
+            "level": ErrorLevel.ERROR,
+        },
+    ]
+    # 0.5 + 1 + 2 + 4 + 8 + 10 seconds
+    assert time.monotonic.return_value == 25.5
+
+
+def test_convert_to_arrow_table() -> None:
+    """
+    Test ``convert_to_arrow_table``.
+    """
+    table = convert_to_arrow_table(
+        [
+            {"id": 1, "price": 1, "ts": "2022-03-25T15:37:00", "mixed": 1, "ds": "x"},
+            {"id": 2, "price": 2.5, "ts": None, "mixed": "a", "ds": "2022-03-25"},
+        ],
+        [
+            {"name": "id", "type": "INT", "is_dttm": False},
+            {"name": "price", "type": "FLOAT", "is_dttm": False},
+            {"name": "ts", "type": "TIMESTAMP", "is_dttm": True},
+            {"name": "mixed", "type": None, "is_dttm": False},
+            {"name": "ds", "type": "STRING", "is_date": True},
+            {"name": "empty", "type": None, "is_dttm": False},
+        ],
+    )
+    assert table.schema == pa.schema(
+        [
+            ("id", pa.int64()),
+            ("price", pa.float64()),
+            ("ts", pa.timestamp("us")),
+            ("mixed", pa.string()),
+            ("ds", pa.string()),
+            ("empty", pa.null()),
+        ],
+    )
+    assert table.column("mixed").to_pylist() == ["1", "a"]
+    assert table.column("ts").to_pylist()[1] is None
+
+
+def test_run_query_arrow(requests_mock: Mocker) -> None:
+    """
+    Test the ``run_query_arrow`` method.
+    """
+    requests_mock.post(
+        "https://superset.example.org/api/v1/sqllab/execute/",
+        json={
+            "data": [{"value": 1, "ts": "2022-01-01T00:00:00"}],
+            "columns": [
+                {"name": "value", "type": "INT", "is_dttm": False},
+                {"name": "ts", "type": "TIMESTAMP", "is_dttm": True},
+            ],
+        },
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    reader = client.run_query_arrow(database_id=1, sql="SELECT 1 AS value")
+    table = reader.read_all()
+    assert table.schema.field("ts").type == pa.timestamp("us")
+    assert table.column("value").to_pylist() == [1]
+    assert requests_mock.last_request.json()["runAsync"] is False
+
+
+def test_run_query_arrow_async(mocker: MockerFixture, requests_mock: Mocker) -> None:
+    """
+    Test the ``run_query_arrow`` method with an async query.
+    """
+    mocker.patch("preset_cli.api.clients.superset.shortid", return_value="IrwwY8Ky14")
+
+    requests_mock.post(
+        "https://superset.example.org/api/v1/sqllab/execute/",
+        json={"query": {"id": "IrwwY8Ky14", "queryId": 2, "state": "pending"}},
+        status_code=202,
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/query/2",
+        json={"result": {"status": "success"}},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/sqllab/export/IrwwY8Ky14/",
+        text="value,name\n1,a\n2,b\n",
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    reader = client.run_query_arrow(
+        database_id=1,
+        sql="SELECT value, name FROM t",
+        limit=None,
+        run_async=True,
+    )
+    assert reader.schema == pa.schema([("value", pa.int64()), ("name", pa.string())])
+    assert reader.read_all().to_pylist() == [
+        {"value": 1, "name": "a"},
+        {"value": 2, "name": "b"},
+    ]
+
+
+def test_get_data_batch(mocker: MockerFixture, requests_mock: Mocker) -> None:
+    """
+    Test the ``get_data_batch`` method.
+    """
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+    get_dataset = mocker.patch.object(
+        client,
+        "get_dataset",
+        return_value={
+            "columns": [
+                {"column_name": "ts", "is_dttm": True},
+                {"column_name": "name", "is_dttm": False},
+            ],
+            "metrics": [{"metric_name": "cnt"}],
+        },
+    )
+    requests_mock.post(
+        "https://superset.example.org/api/v1/chart/data",
+        json={
+            "result": [
+                {"data": [{"name": "Alice", "cnt": 3}]},
+                {"data": [{"ts": 1640995200000, "cnt": 5}]},
+            ],
+        },
+    )
+
+    results = client.get_data_batch(
+        27,
+        [
+            {"metrics": ["cnt"], "columns": ["name"], "row_limit": 1},
+            {
+                "metrics": ["cnt"],
+                "columns": [],
+                "is_timeseries": True,
+                "granularity": "P1D",
+            },
+        ],
+        force=True,
+    )
+    assert [result.to_dict(orient="records") for result in results] == [
+        [{"name": "Alice", "cnt": 3}],
+        [{"ts": 1640995200000, "cnt": 5}],
+    ]
+    get_dataset.assert_called_once_with(27)
+
+    payload = requests_mock.last_request.json()
+    assert requests_mock.call_count == 1
+    assert payload["force"] is True
+    assert [query["columns"] for query in payload["queries"]] == [["name"], []]
+    assert payload["queries"][0]["row_limit"] == 1
+    assert "granularity" not in payload["queries"][0]
+    assert payload["queries"][1]["granularity"] == "ts"
+    assert payload["queries"][1]["extras"]["time_grain_sqla"] == "P1D"
+
+    assert client.get_data_batch(27, []) == []
+    assert requests_mock.call_count == 1
+
+
+def test_build_time_windows() -> None:
+    """
+    Test ``build_time_windows``.
+    """
+    assert build_time_windows(
+        datetime(2021, 11, 15, 12),
+        datetime(2022, 4, 1),
+        "P1M",
+        2,
+    ) == [
+        (datetime(2021, 11, 15, 12), datetime(2022, 1, 1)),
+        (datetime(2022, 1, 1), datetime(2022, 3, 1)),
+        (datetime(2022, 3, 1), datetime(2022, 4, 1)),
+    ]
+    assert build_time_windows(
+        datetime(2022, 1, 1, 10, 30),
+        datetime(2022, 1, 1, 13),
+        "PT1H",
+        1,
+    ) == [
+        (datetime(2022, 1, 1, 10, 30), datetime(2022, 1, 1, 11)),
+        (datetime(2022, 1, 1, 11), datetime(2022, 1, 1, 12)),
+        (datetime(2022, 1, 1, 12), datetime(2022, 1, 1, 13)),
+    ]
+    # weeks start on Monday
+    assert build_time_windows(
+        datetime(2022, 1, 5),
+        datetime(2022, 1, 20),
+        "P1W",
+        1,
+    ) == [
+        (datetime(2022, 1, 5), datetime(2022, 1, 10)),
+        (datetime(2022, 1, 10), datetime(2022, 1, 17)),
+        (datetime(2022, 1, 17), datetime(2022, 1, 20)),
+    ]
+    assert (
+        build_time_windows(datetime(2022, 1, 2), datetime(2022, 1, 1), "P1D", 1) == []
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        build_time_windows(datetime(2022, 1, 1), datetime(2023, 1, 1), "P2D", 1)
+    assert str(excinfo.value) == "Unable to split time range with granularity P2D"
+
+    with pytest.raises(ValueError) as excinfo:
+        build_time_windows(datetime(2022, 1, 1), datetime(2023, 1, 1), "P1D", 0)
+    assert str(excinfo.value) == "Windows should have at least one time grain"
+
+
+def test_get_data_windowed(mocker: MockerFixture, requests_mock: Mocker) -> None:
+    """
+    Test the ``get_data`` method splitting the time range in windows.
+    """
+    _logger = mocker.patch("preset_cli.api.clients.superset._logger")
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+    mocker.patch.object(
+        client,
+        "get_dataset",
+        return_value={
+            "columns": [{"column_name": "ts", "is_dttm": True}],
+            "metrics": [{"metric_name": "cnt"}],
+        },
+    )
+    results = {
+        "2022-01-01 00:00:00 : 2022-03-01 00:00:00": [
+            {"ts": "2022-01-01", "cnt": 1},
+            {"ts": "2022-02-01", "cnt": 2},
+        ],
+        "2022-03-01 00:00:00 : 2022-04-15 00:00:00": [
+            {"ts": "2022-03-01", "cnt": 3},
+        ],
+    }
+    requests_mock.post(
+        "https://superset.example.org/api/v1/chart/data",
+        json=lambda request, context: {
+            "result": [{"data": results[request.json()["queries"][0]["time_range"]]}],
+        },
+    )
+
+    dataframe = client.get_data(
+        27,
+        ["cnt"],
+        [],
+        is_timeseries=True,
+        start=datetime(2022, 1, 1),
+        end=datetime(2022, 4, 15),
+        granularity="P1M",
+        row_limit=2,
+        window=2,
+    )
+    assert dataframe.to_dict(orient="records") == [
+        {"ts": "2022-01-01", "cnt": 1},
+        {"ts": "2022-02-01", "cnt": 2},
+        {"ts": "2022-03-01", "cnt": 3},
+    ]
+    assert requests_mock.call_count == 2
+    assert dataframe.attrs["truncated_windows"] == [
+        (datetime(2022, 1, 1), datetime(2022, 3, 1)),
+    ]
+    _logger.warning.assert_called_with(
+        "Results from %s to %s were truncated at %d rows",
+        datetime(2022, 1, 1),
+        datetime(2022, 3, 1),
+        2,
+    )
+
+    # an empty time range is sent as is
+    results["2022-03-01 00:00:00 : 2022-03-01 00:00:00"] = []
+    dataframe = client.get_data(
+        27,
+        ["cnt"],
+        [],
+        start=datetime(2022, 3, 1),
+        end=datetime(2022, 3, 1),
+        granularity="P1M",
+        window=2,
+    )
+    assert dataframe.empty
+    assert requests_mock.call_count == 3
+
+    with pytest.raises(ValueError) as excinfo:
+        client.get_data(27, ["cnt"], [], start=datetime(2022, 1, 1), window=2)
+    assert str(excinfo.value) == (
+        "Splitting a query in time windows requires `start`, `end`, and `granularity`"
+    )
+
+
+def test_get_data_arrow(mocker: MockerFixture, requests_mock: Mocker) -> None:
+    """
+    Test the ``get_data_arrow`` method.
+    """
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+    mocker.patch.object(
+        client,
+        "get_dataset",
+        return_value={
+            "columns": [{"column_name": "ts", "is_dttm": True}],
+            "metrics": [{"metric_name": "count"}],
+        },
+    )
+    requests_mock.post(
+        "https://superset.example.org/api/v1/chart/data",
+        text="ts,count\n2022-01-01,10\n2022-01-02,20\n",
+        headers={"Content-Type": "text/csv"},
+    )
+
+    reader = client.get_data_arrow(27, ["count"], ["ts"], row_limit=10)
+    table = reader.read_all()
+    assert table.column("count").to_pylist() == [10, 20]
+
+    payload = requests_mock.last_request.json()
+    assert payload["result_format"] == "csv"
+    assert payload["queries"][0]["row_limit"] == 10
+
+
 def test_convert_to_adhoc_metric(mocker: MockerFixture) -> None:
     """
     Test ``convert_to_adhoc_metric``.
@@ -816,6 +1310,238 @@ def test_get_resource(requests_mock: Mocker) -> None:
     )
 
 
+def test_get_resource_cache(
+    mocker: MockerFixture,
+    requests_mock: Mocker,
+    tmp_path: Path,
+) -> None:
+    """
+    Test that ``get_resource`` uses the HTTP cache, and that writes invalidate it.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/database/1",
+        json={"result": {"Hello": "world"}},
+    )
+    requests_mock.put(
+        "https://superset.example.org/api/v1/database/1",
+        json={"result": {}},
+    )
+    requests_mock.post(
+        "https://superset.example.org/api/v1/assets/import/",
+        json={"message": "OK"},
+    )
+
+    auth = Auth()
+    cache = HTTPCache(tmp_path)
+    client = SupersetClient(
+        "https://superset.example.org/",
+        auth,
+        cache=cache,
+        memoize=False,
+    )
+
+    # auths without a scope are not cached
+    client.get_resource("database", 1)
+    client.get_resource("database", 1)
+    assert requests_mock.call_count == 2
+
+    mocker.patch.object(auth, "get_scope", return_value="scope")
+    client.get_resource("database", 1)
+    client.get_resource("database", 1)
+    assert requests_mock.call_count == 3
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    client.update_resource("database", 1, database_name="db")
+    client.get_resource("database", 1)
+    assert requests_mock.call_count == 5
+
+    client.import_zip("assets", BytesIO(b"data"))
+    client.get_resource("database", 1)
+    assert requests_mock.call_count == 7
+
+
+def test_run_query_result_cache(
+    mocker: MockerFixture,
+    requests_mock: Mocker,
+    tmp_path: Path,
+) -> None:
+    """
+    Test that query results are cached when the client has a result cache.
+    """
+    requests_mock.post(
+        "https://superset.example.org/api/v1/sqllab/execute/",
+        json={"data": [{"value": 1}]},
+    )
+
+    auth = Auth()
+    cache = ResultCache(tmp_path)
+    client = SupersetClient("https://superset.example.org/", auth, result_cache=cache)
+
+    # auths without a scope are not cached
+    client.run_query(1, "SELECT 1 AS value")
+    client.run_query(1, "SELECT 1 AS value")
+    assert requests_mock.call_count == 2
+
+    mocker.patch.object(auth, "get_scope", return_value="scope")
+    client.run_query(1, "SELECT 1 AS value")
+    results = client.run_query(1, "SELECT 1\n  AS value;")
+    assert results.to_dict(orient="records") == [{"value": 1}]
+    assert requests_mock.call_count == 3
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # the schema and the limit are part of the key
+    client.run_query(1, "SELECT 1 AS value", "public")
+    client.run_query(1, "SELECT 1 AS value", limit=10)
+    assert requests_mock.call_count == 5
+
+    client.run_query(1, "SELECT 1 AS value", refresh=True)
+    assert requests_mock.call_count == 6
+    client.run_query(1, "SELECT 1 AS value")
+    assert requests_mock.call_count == 6
+
+
+def test_get_resource_memoized(requests_mock: Mocker) -> None:
+    """
+    Test that reads are memoized, and that writes invalidate the resource.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/dataset/1",
+        json={"result": {"id": 1}},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/1",
+        json={"result": {"id": 1}},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/dataset/_info?q=(keys:!(edit_columns))",
+        json={"edit_columns": []},
+    )
+    requests_mock.put(
+        "https://superset.example.org/api/v1/dataset/1",
+        json={"result": {}},
+    )
+    requests_mock.post(
+        "https://superset.example.org/api/v1/assets/import/",
+        json={"message": "OK"},
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth, memoize=True)
+
+    dataset = client.get_dataset(1)
+    dataset["id"] = 2
+    assert client.get_dataset(1) == {"id": 1}
+    client.get_chart(1)
+    client.get_resource_endpoint_info("dataset", keys=["edit_columns"])
+    client.get_resource_endpoint_info("dataset", keys=["edit_columns"])
+    assert requests_mock.call_count == 3
+    assert (client.memo.hits, client.memo.misses) == (2, 3)  # type: ignore
+
+    # updating a dataset invalidates datasets, but not charts
+    client.update_dataset(1, description="A dataset")
+    client.get_dataset(1)
+    client.get_chart(1)
+    client.get_resource_endpoint_info("dataset", keys=["edit_columns"])
+    assert requests_mock.call_count == 6
+
+    # imports invalidate everything
+    client.import_zip("assets", BytesIO(b"data"))
+    client.get_dataset(1)
+    client.get_chart(1)
+    assert requests_mock.call_count == 9
+
+
+def test_get_resources_memoized(requests_mock: Mocker) -> None:
+    """
+    Test that listings are memoized by filter, and invalidated by creates/deletes.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!((col:slice_name,opr:eq,value:x)),"
+        "order_column:changed_on_delta_humanized,"
+        "order_direction:desc,page:0,page_size:100)",
+        json={"result": []},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!((col:slice_name,opr:eq,value:y)),"
+        "order_column:changed_on_delta_humanized,"
+        "order_direction:desc,page:0,page_size:100)",
+        json={"result": []},
+    )
+    requests_mock.post("https://superset.example.org/api/v1/chart/", json={})
+    requests_mock.delete("https://superset.example.org/api/v1/chart/1", json={})
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth, memoize=True)
+
+    client.get_charts(slice_name="x")
+    client.get_charts(slice_name="x")
+    client.get_charts(slice_name="y")
+    assert requests_mock.call_count == 2
+
+    client.create_resource("chart", slice_name="x")
+    client.get_charts(slice_name="x")
+    assert requests_mock.call_count == 4
+
+    client.delete_chart(1)
+    client.get_charts(slice_name="x")
+    assert requests_mock.call_count == 6
+
+
+def test_get_resource_not_memoized(requests_mock: Mocker) -> None:
+    """
+    Test that reads are not memoized by default.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/dataset/1",
+        json={"result": {"id": 1}},
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    client.get_dataset(1)
+    client.get_dataset(1)
+    assert requests_mock.call_count == 2
+    assert client.memo is None
+
+
+def test_get_rls_memoized_role_updates(requests_mock: Mocker) -> None:
+    """
+    Test that role and RLS updates invalidate memoized reads.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/rowlevelsecurity/?q="
+        "(filters:!((col:name,opr:eq,value:rule)),"
+        "order_column:changed_on_delta_humanized,"
+        "order_direction:desc,page:0,page_size:100)",
+        [
+            {"json": {"count": 1, "result": [{"id": 1, "roles": [{"id": 1}]}]}},
+            {"json": {"count": 1, "result": [{"id": 1, "roles": [{"id": 2}]}]}},
+        ],
+    )
+    requests_mock.get(
+        "https://superset.example.org/roles/edit/1",
+        text="""
+<input name="name" value="Role" />
+<select id="user"></select>
+<select id="permissions"></select>
+        """,
+    )
+    requests_mock.post("https://superset.example.org/roles/edit/1")
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth, memoize=True)
+
+    assert client.get_rls(name="rule") == [{"id": 1, "roles": [{"id": 1}]}]
+    assert client.get_rls(name="rule") == [{"id": 1, "roles": [{"id": 1}]}]
+
+    # the role was changed, so the rule is read again
+    client.update_role(1, name="New Role")
+    assert client.get_rls(name="rule") == [{"id": 1, "roles": [{"id": 2}]}]
+
+
 def test_get_resources(requests_mock: Mocker) -> None:
     """
     Test the generic ``get_resources`` method.
@@ -841,7 +1567,11 @@ def test_get_resources(requests_mock: Mocker) -> None:
     )
 
     auth = Auth()
-    client = SupersetClient("https://superset.example.org/", auth)
+    client = SupersetClient(
+        "https://superset.example.org/",
+        auth,
+        keyset_pagination=False,
+    )
 
     response = client.get_resources("database")
     assert response == [1, 2]
@@ -850,6 +1580,34 @@ def test_get_resources(requests_mock: Mocker) -> None:
     )
 
 
+def test_get_resources_columns(requests_mock: Mocker) -> None:
+    """
+    Test that ``get_resources`` can request only some columns.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(columns:!(id,uuid),filters:!(),order_column:changed_on_delta_humanized,"
+        "order_direction:desc,page:0,page_size:100)",
+        json={"count": 1, "result": [{"id": 1, "uuid": "uuid1"}]},
+    )
+
+    auth = Auth()
+    client = SupersetClient(
+        "https://superset.example.org/",
+        auth,
+        memoize=True,
+        keyset_pagination=False,
+    )
+
+    assert client.get_resources("chart", columns=["id", "uuid"]) == [
+        {"id": 1, "uuid": "uuid1"},
+    ]
+    assert client.get_resources("chart", columns=["id", "uuid"]) == [
+        {"id": 1, "uuid": "uuid1"},
+    ]
+    assert requests_mock.call_count == 1
+
+
 def test_get_resources_filtered_equal(requests_mock: Mocker) -> None:
     """
     Test the generic ``get_resources`` method with an equal filter.
@@ -910,6 +1668,190 @@ def test_get_resources_filtered_one_to_many(requests_mock: Mocker) -> None:
     )
 
 
+def test_get_resources_concurrent(requests_mock: Mocker) -> None:
+    """
+    Test that ``get_resources`` fetches pages concurrently when a count is returned.
+    """
+    for page in range(3):
+        requests_mock.get(
+            "https://superset.example.org/api/v1/chart/?q="
+            "(filters:!(),order_column:changed_on_delta_humanized,"
+            f"order_direction:desc,page:{page},page_size:100)",
+            json={
+                "count": 250,
+                "result": list(range(page * 100, min(250, (page + 1) * 100))),
+            },
+        )
+
+    auth = Auth()
+    client = SupersetClient(
+        "https://superset.example.org/",
+        auth,
+        keyset_pagination=False,
+    )
+
+    assert client.get_resources("chart") == list(range(250))
+    # no request for the empty page
+    assert requests_mock.call_count == 3
+
+
+def test_get_resources_concurrent_count_changed(requests_mock: Mocker) -> None:
+    """
+    Test that ``get_resources`` continues serially if resources were added.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!(),order_column:changed_on_delta_humanized,"
+        "order_direction:desc,page:0,page_size:100)",
+        json={"count": 150, "result": list(range(100))},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!(),order_column:changed_on_delta_humanized,"
+        "order_direction:desc,page:1,page_size:100)",
+        json={"count": 250, "result": list(range(100, 200))},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!(),order_column:changed_on_delta_humanized,"
+        "order_direction:desc,page:2,page_size:100)",
+        json={"count": 250, "result": list(range(200, 250))},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!(),order_column:changed_on_delta_humanized,"
+        "order_direction:desc,page:3,page_size:100)",
+        json={"count": 250, "result": []},
+    )
+
+    auth = Auth()
+    client = SupersetClient(
+        "https://superset.example.org/",
+        auth,
+        keyset_pagination=False,
+    )
+
+    assert client.get_resources("chart") == list(range(250))
+
+
+def test_get_resources_serial(requests_mock: Mocker) -> None:
+    """
+    Test that ``get_resources`` paginates serially with a single worker.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!(),order_column:changed_on_delta_humanized,"
+        "order_direction:desc,page:0,page_size:100)",
+        json={"count": 1, "result": [1]},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!(),order_column:changed_on_delta_humanized,"
+        "order_direction:desc,page:1,page_size:100)",
+        json={"count": 1, "result": []},
+    )
+
+    auth = Auth()
+    client = SupersetClient(
+        "https://superset.example.org/",
+        auth,
+        max_workers=1,
+        keyset_pagination=False,
+    )
+
+    assert client.get_resources("chart") == [1]
+    assert requests_mock.call_count == 2
+
+
+def test_get_resources_keyset(requests_mock: Mocker) -> None:
+    """
+    Test that full scans paginate by ID.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(columns:!(uuid,id),filters:!(),order_column:id,"
+        "order_direction:asc,page:0,page_size:100)",
+        json={"ids": [1, 3], "result": [{"uuid": "a"}, {"uuid": "b"}]},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(columns:!(uuid,id),filters:!((col:id,opr:gt,value:3)),order_column:id,"
+        "order_direction:asc,page:0,page_size:100)",
+        json={"ids": [4], "result": [{"uuid": "c"}]},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(columns:!(uuid,id),filters:!((col:id,opr:gt,value:4)),order_column:id,"
+        "order_direction:asc,page:0,page_size:100)",
+        json={"ids": [], "result": []},
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    assert client.get_resources("chart", columns=["uuid"]) == [
+        {"uuid": "a"},
+        {"uuid": "b"},
+        {"uuid": "c"},
+    ]
+    assert requests_mock.call_count == 3
+
+
+def test_get_resources_keyset_unsupported(requests_mock: Mocker) -> None:
+    """
+    Test that ``get_resources`` falls back to offset pagination.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!(),order_column:id,order_direction:asc,page:0,page_size:100)",
+        status_code=400,
+        json={"message": {"order_column": ["Not a valid choice."]}},
+        headers={"content-type": "application/json"},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!(),order_column:changed_on_delta_humanized,"
+        "order_direction:desc,page:0,page_size:100)",
+        json={"count": 1, "result": [{"id": 1}]},
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth, memoize=False)
+
+    assert client.get_resources("chart") == [{"id": 1}]
+    assert client.get_resources("chart") == [{"id": 1}]
+    # keyset pagination is only attempted once
+    assert requests_mock.call_count == 3
+
+
+def test_get_resources_keyset_filter_ignored(requests_mock: Mocker) -> None:
+    """
+    Test that ``get_resources`` falls back if the ID filter is ignored.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!(),order_column:id,order_direction:asc,page:0,page_size:100)",
+        json={"result": [{"id": 1}, {"id": 2}]},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!((col:id,opr:gt,value:2)),order_column:id,"
+        "order_direction:asc,page:0,page_size:100)",
+        json={"result": [{"id": 1}, {"id": 2}]},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(filters:!(),order_column:changed_on_delta_humanized,"
+        "order_direction:desc,page:0,page_size:100)",
+        json={"count": 2, "result": [{"id": 2}, {"id": 1}]},
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    assert client.get_resources("chart") == [{"id": 2}, {"id": 1}]
+
+
 def test_create_resource(requests_mock: Mocker) -> None:
     """
     Test the generic ``create_resource`` method.
@@ -1816,6 +2758,76 @@ def test_export_zip_pagination(mocker: MockerFixture, requests_mock: Mocker) ->
     )
 
 
+def test_export_zip_raw_copy(mocker: MockerFixture, requests_mock: Mocker) -> None:
+    """
+    Test that ``export_zip`` copies compressed members without recompressing them.
+    """
+    for page, ids in enumerate(["%21%281%2C2%29", "%21%283%29"]):
+        buf = BytesIO()
+        with ZipFile(buf, "w", compression=ZIP_DEFLATED) as bundle:
+            bundle.writestr(f"export/databases/db{page}.yaml", "database_name: db\n")
+        requests_mock.get(
+            f"https://superset.example.org/api/v1/database/export/?q={ids}",
+            content=buf.getvalue(),
+        )
+
+    mocker.patch("preset_cli.api.clients.superset.MAX_IDS_IN_EXPORT", new=2)
+    mocker.patch("preset_cli.api.clients.superset.EXPORT_CHUNK_SIZE", new=8)
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    with client.export_zip("database", [1, 2, 3]) as output:
+        assert not isinstance(output, BytesIO)
+        with ZipFile(output) as bundle:
+            assert [
+                (info.filename, info.compress_type) for info in bundle.infolist()
+            ] == [
+                ("export/databases/db0.yaml", ZIP_DEFLATED),
+                ("export/databases/db1.yaml", ZIP_DEFLATED),
+            ]
+            assert bundle.read("export/databases/db1.yaml") == b"database_name: db\n"
+
+
+def test_export_zip_shared_dependencies(
+    mocker: MockerFixture,
+    requests_mock: Mocker,
+) -> None:
+    """
+    Test that chunks are merged in order, writing shared dependencies once.
+    """
+    for id_ in range(1, 4):
+        buf = BytesIO()
+        with ZipFile(buf, "w") as bundle:
+            root = f"dashboard_export_2024010112000{id_}"
+            bundle.writestr(f"{root}/metadata.yaml", "type: Dashboard\n")
+            bundle.writestr(f"{root}/dashboards/dashboard{id_}.yaml", f"id: {id_}\n")
+            bundle.writestr(f"{root}/databases/db.yaml", f"chunk: {id_}\n")
+        requests_mock.get(
+            f"https://superset.example.org/api/v1/dashboard/export/?q=%21%28{id_}%29",
+            content=buf.getvalue(),
+        )
+
+    mocker.patch("preset_cli.api.clients.superset.MAX_IDS_IN_EXPORT", new=1)
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth, max_workers=3)
+
+    with ZipFile(client.export_zip("dashboard", [1, 2, 3])) as bundle:
+        assert bundle.namelist() == [
+            "dashboard_export_20240101120001/metadata.yaml",
+            "dashboard_export_20240101120001/dashboards/dashboard1.yaml",
+            "dashboard_export_20240101120001/databases/db.yaml",
+            "dashboard_export_20240101120002/dashboards/dashboard2.yaml",
+            "dashboard_export_20240101120003/dashboards/dashboard3.yaml",
+        ]
+        assert (
+            bundle.read("dashboard_export_20240101120001/databases/db.yaml")
+            == b"chunk: 1\n"
+        )
+    assert requests_mock.call_count == 3
+
+
 def test_export_zip_error(requests_mock: Mocker) -> None:
     """
     Test the ``export_zip`` method when an error occurs.
@@ -1838,6 +2850,53 @@ def test_export_zip_error(requests_mock: Mocker) -> None:
     )
 
 
+def test_export_zip_chunk_error(
+    mocker: MockerFixture,
+    requests_mock: Mocker,
+) -> None:
+    """
+    Test that chunks already downloaded are closed when another chunk fails.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/database/export/?q=%21%281%29",
+        json={"errors": [{"message": "An error occurred"}]},
+        headers={"Content-Type": "application/json"},
+        status_code=500,
+    )
+    for id_ in range(2, 4):
+        buf = BytesIO()
+        with ZipFile(buf, "w") as bundle:
+            bundle.writestr(f"export/databases/db{id_}.yaml", "database_name: db\n")
+        requests_mock.get(
+            f"https://superset.example.org/api/v1/database/export/?q=%21%28{id_}%29",
+            content=buf.getvalue(),
+        )
+
+    temporary_files: List[IO[bytes]] = []
+    make_temporary_file = tempfile.TemporaryFile
+
+    def temporary_file() -> IO[bytes]:
+        file_ = make_temporary_file()  # pylint: disable=consider-using-with
+        temporary_files.append(file_)
+        return file_
+
+    mocker.patch(
+        "preset_cli.api.clients.superset.tempfile.TemporaryFile",
+        side_effect=temporary_file,
+    )
+    mocker.patch("preset_cli.api.clients.superset.MAX_IDS_IN_EXPORT", new=1)
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth, max_workers=3)
+
+    with pytest.raises(SupersetError):
+        client.export_zip("database", [1, 2, 3])
+
+    # the bundle and the 3 chunks
+    assert len(temporary_files) == 4
+    assert all(file_.closed for file_ in temporary_files)
+
+
 def test_import_zip(requests_mock: Mocker) -> None:
     """
     Test the ``import_zip`` method.
@@ -1864,11 +2923,17 @@ def test_import_zip(requests_mock: Mocker) -> None:
         .split("=")[1]
         .strip()
     )
-    assert requests_mock.last_request.text == (
+    expected = (
         f'--{boundary}\r\nContent-Disposition: form-data; name="overwrite"\r\n\r\n'
         f'true\r\n--{boundary}\r\nContent-Disposition: form-data; name="formData"; '
         f'filename="formData"\r\n\r\nI\'m a ZIP\r\n--{boundary}--\r\n'
     )
+    assert requests_mock.last_request.headers["Content-Length"] == str(len(expected))
+
+    # the bundle is streamed instead of being encoded in memory
+    body = requests_mock.last_request.body
+    body.seek(0)
+    assert body.read().decode() == expected
 
 
 def test_import_zip_error(requests_mock: Mocker) -> None:
@@ -2721,7 +3786,7 @@ def test_export_ownership(mocker: MockerFixture) -> None:
             1: UUID("e0d20af0-cef9-4bdb-80b4-745827f441bf"),
         },
     )
-    mocker.patch.object(
+    get_resources = mocker.patch.object(
         SupersetClient,
         "get_resources",
         return_value=[
@@ -2745,6 +3810,16 @@ def test_export_ownership(mocker: MockerFixture) -> None:
             "uuid": UUID("e0d20af0-cef9-4bdb-80b4-745827f441bf"),
         },
     ]
+    get_resources.assert_called_with(
+        "chart",
+        columns=[
+            "id",
+            "slice_name",
+            "owners.id",
+            "owners.first_name",
+            "owners.last_name",
+        ],
+    )
 
 
 def test_export_ownership_user_not_found_raises_exception(
@@ -2838,14 +3913,14 @@ def test_get_uuids(requests_mock: Mocker) -> None:
     """
     requests_mock.get(
         "https://superset.example.org/api/v1/chart/?q="
-        "(filters:!(),order_column:changed_on_delta_humanized,"
-        "order_direction:desc,page:0,page_size:100)",
+        "(columns:!(id,slice_name),filters:!(),order_column:id,"
+        "order_direction:asc,page:0,page_size:100)",
         json={"result": [{"id": 1}, {"id": 2}, {"id": 3}]},
     )
     requests_mock.get(
         "https://superset.example.org/api/v1/chart/?q="
-        "(filters:!(),order_column:changed_on_delta_humanized,"
-        "order_direction:desc,page:1,page_size:100)",
+        "(columns:!(id,slice_name),filters:!((col:id,opr:gt,value:3)),"
+        "order_column:id,order_direction:asc,page:0,page_size:100)",
         json={"result": []},
     )
 
@@ -2880,6 +3955,123 @@ def test_get_uuids(requests_mock: Mocker) -> None:
     }
 
 
+def test_get_uuids_batch(requests_mock: Mocker) -> None:
+    """
+    Test that ``get_uuids`` resolves UUIDs from a single batched export.
+
+    Charts with the same name are disambiguated by the ID in the file name, and
+    dependencies in the bundle are ignored.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(columns:!(id,slice_name),filters:!((col:id,opr:gt,value:3)),"
+        "order_column:id,order_direction:asc,page:0,page_size:100)",
+        json={"count": 0, "result": []},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/?q="
+        "(columns:!(id,slice_name),filters:!(),order_column:id,"
+        "order_direction:asc,page:0,page_size:100)",
+        json={
+            "count": 3,
+            "result": [
+                {"id": 1, "slice_name": "Sales"},
+                {"id": 2, "slice_name": "Sales"},
+                {"id": 3, "slice_name": "Users"},
+            ],
+        },
+    )
+
+    buf = BytesIO()
+    with ZipFile(buf, "w") as bundle:
+        bundle.writestr("chart_export/metadata.yaml", "Hello!")
+        bundle.writestr(
+            "chart_export/databases/db.yaml",
+            yaml.dump({"uuid": "4e1ddc44-c1c5-4a7b-a3c4-d7b2d3a9b0c1"}),
+        )
+        for id_, name, uuid in [
+            (1, "Sales", "c9d100b8-4fa5-4b7a-8a71-9803b5343674"),
+            (2, "Sales", "2826c33b-7d13-4830-865e-d62630b20dee"),
+            (3, "Users", "0ac7464e-14e7-4c54-ab22-7cbd4536fccc"),
+        ]:
+            bundle.writestr(
+                f"chart_export/charts/{name}_{id_}.yaml",
+                yaml.dump({"slice_name": name, "uuid": uuid}),
+            )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/chart/export/?q=%21%281%2C2%2C3%29",
+        content=buf.getvalue(),
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    assert client.get_uuids("chart") == {
+        1: UUID("c9d100b8-4fa5-4b7a-8a71-9803b5343674"),
+        2: UUID("2826c33b-7d13-4830-865e-d62630b20dee"),
+        3: UUID("0ac7464e-14e7-4c54-ab22-7cbd4536fccc"),
+    }
+    assert requests_mock.call_count == 3
+
+
+def test_get_uuids_batch_ambiguous(requests_mock: Mocker) -> None:
+    """
+    Test that ``get_uuids`` exports ambiguous resources individually.
+    """
+    requests_mock.get(
+        "https://superset.example.org/api/v1/dataset/?q="
+        "(columns:!(id,schema,table_name),filters:!((col:id,opr:gt,value:2)),"
+        "order_column:id,order_direction:asc,page:0,page_size:100)",
+        json={"count": 0, "result": []},
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/dataset/?q="
+        "(columns:!(id,schema,table_name),filters:!(),"
+        "order_column:id,order_direction:asc,page:0,page_size:100)",
+        json={
+            "count": 2,
+            "result": [
+                {"id": 1, "schema": "public", "table_name": "t"},
+                {"id": 2, "schema": "public", "table_name": "t"},
+            ],
+        },
+    )
+
+    def make_bundle(*uuids: str) -> bytes:
+        buf = BytesIO()
+        with ZipFile(buf, "w") as bundle:
+            for i, uuid in enumerate(uuids):
+                bundle.writestr(
+                    f"dataset_export/datasets/db{i}/t.yaml",
+                    yaml.dump({"schema": "public", "table_name": "t", "uuid": uuid}),
+                )
+        return buf.getvalue()
+
+    requests_mock.get(
+        "https://superset.example.org/api/v1/dataset/export/?q=%21%281%2C2%29",
+        content=make_bundle(
+            "c9d100b8-4fa5-4b7a-8a71-9803b5343674",
+            "2826c33b-7d13-4830-865e-d62630b20dee",
+        ),
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/dataset/export/?q=%21%281%29",
+        content=make_bundle("c9d100b8-4fa5-4b7a-8a71-9803b5343674"),
+    )
+    requests_mock.get(
+        "https://superset.example.org/api/v1/dataset/export/?q=%21%282%29",
+        content=make_bundle("2826c33b-7d13-4830-865e-d62630b20dee"),
+    )
+
+    auth = Auth()
+    client = SupersetClient("https://superset.example.org/", auth)
+
+    assert client.get_uuids("dataset") == {
+        1: UUID("c9d100b8-4fa5-4b7a-8a71-9803b5343674"),
+        2: UUID("2826c33b-7d13-4830-865e-d62630b20dee"),
+    }
+
+
 def test_parse_html_array() -> None:
     """
     Test ``parse_html_array``.
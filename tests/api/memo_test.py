@@ -0,0 +1,94 @@
+"""
+Tests for ``preset_cli.api.memo``.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from preset_cli.api.memo import Memo
+
+
+def test_memo() -> None:
+    """
+    Test that results are reused and copied.
+    """
+    memo = Memo()
+    calls: List[int] = []
+
+    def function() -> List[int]:
+        calls.append(1)
+        return [1, 2]
+
+    result = memo.get("chart", 1, function)
+    result.append(3)
+    assert memo.get("chart", 1, function) == [1, 2]
+    memo.get("chart", 2, function)
+    memo.get("dataset", 1, function)
+    assert len(calls) == 3
+    assert (memo.hits, memo.misses) == (1, 3)
+
+
+def test_memo_invalidate() -> None:
+    """
+    Test invalidating a resource, or all resources.
+    """
+    memo = Memo()
+    calls: List[str] = []
+
+    memo.get("chart", 1, lambda: calls.append("chart"))
+    memo.get("dataset", 1, lambda: calls.append("dataset"))
+    memo.invalidate("chart")
+    memo.invalidate("dashboard")
+    memo.get("chart", 1, lambda: calls.append("chart"))
+    memo.get("dataset", 1, lambda: calls.append("dataset"))
+    assert calls == ["chart", "dataset", "chart"]
+
+    memo.invalidate()
+    memo.get("dataset", 1, lambda: calls.append("dataset"))
+    assert calls == ["chart", "dataset", "chart", "dataset"]
+
+
+def test_memo_error() -> None:
+    """
+    Test that errors are not memoized.
+    """
+    memo = Memo()
+
+    def function() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        memo.get("chart", 1, function)
+    assert memo.get("chart", 1, lambda: 42) == 42
+
+
+def test_memo_in_flight() -> None:
+    """
+    Test that concurrent identical requests are sent only once.
+    """
+    memo = Memo()
+    calls: List[int] = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def function() -> int:
+        calls.append(1)
+        started.set()
+        release.wait()
+        return 42
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(memo.get, "chart", 1, function)
+        started.wait()
+        others = [executor.submit(memo.get, "chart", 1, function) for _ in range(3)]
+        while memo.hits < 3:
+            time.sleep(0.001)
+        release.set()
+
+        assert first.result() == 42
+        assert [future.result() for future in others] == [42, 42, 42]
+    assert len(calls) == 1
@@ -0,0 +1,62 @@
+"""
+Tests for ``preset_cli.api.multipart``.
+"""
+
+import os
+from io import BytesIO
+
+from requests import PreparedRequest
+
+from preset_cli.api.multipart import MultipartBody
+
+
+def test_multipart_body() -> None:
+    """
+    Test that the body is encoded like ``requests`` does it.
+    """
+    request = PreparedRequest()
+    request.prepare(
+        method="POST",
+        url="https://superset.example.org/api/v1/assets/import/",
+        data={"overwrite": "true"},
+        files={"bundle": BytesIO(b"I'm a ZIP")},
+    )
+    boundary = request.headers["Content-Type"].split("boundary=")[1]
+
+    body = MultipartBody({"overwrite": "true"}, {"bundle": BytesIO(b"I'm a ZIP")})
+    assert body.content_type.startswith("multipart/form-data; boundary=")
+
+    body = MultipartBody(
+        {"overwrite": "true"},
+        {"bundle": BytesIO(b"I'm a ZIP")},
+        boundary=boundary,
+    )
+    assert body.content_type == request.headers["Content-Type"]
+    assert len(body) == int(request.headers["Content-Length"])
+    assert body.read() == request.body
+
+
+def test_multipart_body_streamed() -> None:
+    """
+    Test reading the body in chunks, and seeking it.
+    """
+    file = BytesIO(b"ignored, I'm a ZIP")
+    file.seek(9)
+    body = MultipartBody({}, {"formData": file}, boundary="b")
+    expected = (
+        b'--b\r\nContent-Disposition: form-data; name="formData"; '
+        b'filename="formData"\r\n\r\nI\'m a ZIP\r\n--b--\r\n'
+    )
+    assert len(body) == len(expected)
+
+    chunks = []
+    while chunk := body.read(7):
+        chunks.append(chunk)
+    assert b"".join(chunks) == expected
+    assert max(len(chunk) for chunk in chunks) == 7
+    assert body.tell() == len(expected)
+
+    assert body.seek(-8, os.SEEK_END) == len(expected) - 8
+    assert body.read() == b"\n--b--\r\n"
+    assert body.seek(-100, os.SEEK_CUR) == 0
+    assert body.read() == expected
@@ -0,0 +1,125 @@
+"""
+Tests for ``preset_cli.api.stats``.
+"""
+
+from io import BytesIO
+
+from requests_mock.mocker import Mocker
+
+from preset_cli.api.multipart import MultipartBody
+from preset_cli.api.stats import HTTPStats, get_endpoint_template, percentile
+from preset_cli.auth.main import Auth
+
+
+def test_get_endpoint_template() -> None:
+    """
+    Test that IDs and UUIDs are collapsed.
+    """
+    assert (
+        get_endpoint_template("https://example.org/api/v1/chart/42?q=()")
+        == "/api/v1/chart/{id}"
+    )
+    assert (
+        get_endpoint_template(
+            "https://example.org/api/v1/dataset/1f7c3a5e-8d1b-4c2a-9e6f-0a1b2c3d4e5f/",
+        )
+        == "/api/v1/dataset/{id}/"
+    )
+    assert get_endpoint_template("https://example.org/api/v1/chart/") == (
+        "/api/v1/chart/"
+    )
+
+
+def test_percentile() -> None:
+    """
+    Test ``percentile``.
+    """
+    assert percentile([4, 1, 3, 2], 50) == 2
+    assert percentile([4, 1, 3, 2], 95) == 4
+    assert percentile([7], 0) == 7
+
+
+def test_http_stats(requests_mock: Mocker) -> None:
+    """
+    Test collecting statistics from a session.
+    """
+    requests_mock.get("https://example.org/api/v1/chart/1", text="abcd")
+    requests_mock.get("https://example.org/api/v1/chart/2", text="ab")
+    requests_mock.post("https://example.org/api/v1/dataset/", text="{}")
+
+    auth = Auth()
+    stats = HTTPStats()
+    stats.install(auth.session)
+    stats.install(auth.session)
+    assert auth.session.hooks["response"] == [stats.record, auth.reauth]
+
+    auth.session.get("https://example.org/api/v1/chart/1")
+    auth.session.get("https://example.org/api/v1/chart/2")
+    auth.session.post("https://example.org/api/v1/dataset/", data="hello")
+
+    report = stats.to_dict()
+    assert list(report) == ["GET /api/v1/chart/{id}", "POST /api/v1/dataset/"]
+    assert report["GET /api/v1/chart/{id}"]["count"] == 2
+    assert report["GET /api/v1/chart/{id}"]["bytes_in"] == 6
+    assert report["GET /api/v1/chart/{id}"]["bytes_out"] == 0
+    assert report["POST /api/v1/dataset/"]["bytes_in"] == 2
+    assert report["POST /api/v1/dataset/"]["bytes_out"] == 5
+    assert report["POST /api/v1/dataset/"]["reauths"] == 0
+
+    lines = stats.format().split("\n")
+    assert lines[0].startswith("Endpoint")
+    assert lines[1].startswith("GET /api/v1/chart/{id}")
+    assert len(stats.format(limit=1).split("\n")) == 2
+
+
+def test_http_stats_streamed_body(requests_mock: Mocker) -> None:
+    """
+    Test that the size of streamed request bodies is counted.
+    """
+    requests_mock.post("https://example.org/api/v1/assets/import/", text="{}")
+    requests_mock.post("https://example.org/api/v1/dataset/", text="{}")
+
+    auth = Auth()
+    stats = HTTPStats()
+    stats.install(auth.session)
+
+    body = MultipartBody({"overwrite": "true"}, {"bundle": BytesIO(b"data")})
+    auth.session.post(
+        "https://example.org/api/v1/assets/import/",
+        data=body,
+        headers={"Content-Type": body.content_type},
+    )
+    auth.session.post(
+        "https://example.org/api/v1/dataset/",
+        data=iter([b"chunked"]),
+    )
+
+    report = stats.to_dict()
+    assert report["POST /api/v1/assets/import/"]["bytes_out"] == len(body)
+    assert report["POST /api/v1/dataset/"]["bytes_out"] == 0
+
+
+def test_http_stats_reauth(requests_mock: Mocker) -> None:
+    """
+    Test that 401 responses are counted as re-auths.
+    """
+    requests_mock.get("https://example.org/api/v1/chart/", status_code=401)
+
+    auth = Auth()
+    stats = HTTPStats()
+    stats.install(auth.session)
+    auth.session.get("https://example.org/api/v1/chart/")
+
+    assert stats.to_dict()["GET /api/v1/chart/"]["reauths"] == 1
+
+
+def test_http_stats_copy() -> None:
+    """
+    Test that copies of an auth keep collecting statistics.
+    """
+    auth = Auth()
+    stats = HTTPStats()
+    stats.install(auth.session)
+
+    clone = auth.copy()
+    assert clone.session.hooks["response"] == [stats.record, clone.reauth]
@@ -0,0 +1,193 @@
+"""
+Tests for ``preset_cli.api.throttle``.
+"""
+
+from typing import Dict, Optional
+
+from pytest_mock import MockerFixture
+from requests import PreparedRequest, Response
+
+from preset_cli.api.throttle import (
+    DEFAULT_THROTTLE,
+    ConcurrencyController,
+    Throttle,
+    ThrottledAdapter,
+    TokenBucket,
+    is_overloaded,
+    parse_retry_after,
+)
+from preset_cli.auth.main import Auth
+
+
+def make_response(
+    status_code: int,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Build a response.
+    """
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+def test_parse_retry_after(mocker: MockerFixture) -> None:
+    """
+    Test ``parse_retry_after``.
+    """
+    mocker.patch("preset_cli.api.throttle.time.time", return_value=784111767.0)
+
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("-1") == 0
+    assert parse_retry_after("86400") == 300
+    assert parse_retry_after("Sun, 06 Nov 1994 08:49:37 GMT") == 10.0
+    assert parse_retry_after("invalid") is None
+
+
+def test_is_overloaded(mocker: MockerFixture) -> None:
+    """
+    Test ``is_overloaded``.
+    """
+    assert not is_overloaded(make_response(200))
+    assert not is_overloaded(make_response(404))
+    assert is_overloaded(make_response(429))
+    assert is_overloaded(make_response(503))
+
+    # a request that succeeded after urllib3 retried a 503
+    response = make_response(200)
+    response.raw = mocker.MagicMock()
+    response.raw.retries.history = [mocker.MagicMock(status=503)]
+    assert is_overloaded(response)
+
+
+def test_token_bucket(mocker: MockerFixture) -> None:
+    """
+    Test the token bucket rate limiter.
+    """
+    time = mocker.patch("preset_cli.api.throttle.time")
+    time.monotonic.return_value = 0
+    time.sleep.side_effect = lambda delay: setattr(
+        time.monotonic,
+        "return_value",
+        time.monotonic.return_value + delay,
+    )
+
+    bucket = TokenBucket(rate=2)
+    for _ in range(4):
+        bucket.acquire()
+    assert time.monotonic.return_value == 1
+
+    bucket.pause(10)
+    bucket.acquire()
+    assert time.monotonic.return_value == 11
+
+
+def test_token_bucket_unlimited(mocker: MockerFixture) -> None:
+    """
+    Test that a bucket without a rate only blocks while paused.
+    """
+    time = mocker.patch("preset_cli.api.throttle.time")
+    time.monotonic.return_value = 0
+
+    bucket = TokenBucket()
+    for _ in range(100):
+        bucket.acquire()
+    time.sleep.assert_not_called()
+
+    bucket.pause(5)
+    time.sleep.side_effect = lambda delay: setattr(time.monotonic, "return_value", 5)
+    bucket.acquire()
+    time.sleep.assert_called_once_with(5)
+
+
+def test_concurrency_controller(mocker: MockerFixture) -> None:
+    """
+    Test the AIMD concurrency controller.
+    """
+    time = mocker.patch("preset_cli.api.throttle.time")
+    time.monotonic.return_value = 100
+
+    controller = ConcurrencyController(max_limit=8)
+    controller.acquire()
+    assert controller.in_flight == 1
+
+    controller.release(True)
+    assert controller.limit == 4
+    assert controller.in_flight == 0
+
+    # decreases within the cooldown are ignored
+    controller.acquire()
+    controller.release(True)
+    assert controller.limit == 4
+
+    time.monotonic.return_value = 102
+    for _ in range(3):
+        controller.acquire()
+        controller.release(True)
+        time.monotonic.return_value += 2
+    assert controller.limit == 1
+
+    for _ in range(2):
+        controller.acquire()
+        controller.release(False)
+    assert controller.limit == 2.5
+
+    controller.acquire()
+    controller.release(None)
+    assert controller.limit == 2.5
+
+
+def test_throttle() -> None:
+    """
+    Test that hosts have their own state, and that ``configure`` resets it.
+    """
+    throttle = Throttle(rate=5, max_concurrency=4)
+    bucket, controller = throttle.get("example.org")
+    assert throttle.get("example.org") == (bucket, controller)
+    assert throttle.get("example.com")[0] is not bucket
+    assert bucket.rate == 5
+    assert controller.max_limit == 4
+
+    throttle.configure(rate=10)
+    bucket, controller = throttle.get("example.org")
+    assert bucket.rate == 10
+    assert controller.max_limit == 4
+
+
+def test_throttled_adapter(mocker: MockerFixture) -> None:
+    """
+    Test that the adapter sends requests through the throttle.
+    """
+    send = mocker.patch(
+        "preset_cli.api.throttle.HTTPAdapter.send",
+        return_value=make_response(429, {"Retry-After": "3"}),
+    )
+    throttle = Throttle()
+    bucket, controller = throttle.get("example.org")
+    bucket.pause = mocker.MagicMock()
+
+    request = PreparedRequest()
+    request.prepare(method="GET", url="https://example.org/api/v1/chart/")
+
+    adapter = ThrottledAdapter(throttle)
+    response = adapter.send(request, timeout=10)
+    assert response.status_code == 429
+    send.assert_called_once_with(request, timeout=10)
+    bucket.pause.assert_called_once_with(3.0)
+    assert controller.limit == 16
+    assert controller.in_flight == 0
+
+
+def test_auth_throttle() -> None:
+    """
+    Test that auths share the default throttle.
+    """
+    auth = Auth()
+    assert auth.throttle is DEFAULT_THROTTLE
+    for prefix in ("https://", "http://"):
+        adapter = auth.session.get_adapter(f"{prefix}example.org/")
+        assert isinstance(adapter, ThrottledAdapter)
+        assert adapter.throttle is DEFAULT_THROTTLE
+    assert auth.copy().throttle is DEFAULT_THROTTLE
@@ -2,6 +2,9 @@
 Test authentication mechanisms.
 """
 
+from io import BytesIO
+from typing import Any
+
 from pytest_mock import MockerFixture
 from requests_mock.mocker import Mocker
 
@@ -17,6 +20,7 @@ def test_auth(mocker: MockerFixture) -> None:
 
     auth = Auth()
     assert auth.session == Session()
+    assert auth.get_scope() is None
 
 
 def test_reauth(requests_mock: Mocker) -> None:
@@ -29,3 +33,40 @@ def test_reauth(requests_mock: Mocker) -> None:
     auth = Auth()
     response = auth.session.get("http://example.org/")
     assert response.status_code == 401
+
+
+def test_reauth_streamed_body(mocker: MockerFixture, requests_mock: Mocker) -> None:
+    """
+    Test that streamed bodies are rewound when the request is resent.
+    """
+    bodies = []
+
+    def callback(request: Any, context: Any) -> str:
+        bodies.append(request.body.read())
+        context.status_code = 401 if len(bodies) == 1 else 200
+        return "{}"
+
+    requests_mock.post("http://example.org/", text=callback)
+
+    auth = Auth()
+    auth.auth = mocker.MagicMock()  # type: ignore
+    response = auth.session.post("http://example.org/", data=BytesIO(b"payload"))
+    assert response.status_code == 200
+    assert bodies == [b"payload", b"payload"]
+
+
+def test_copy() -> None:
+    """
+    Test that ``copy`` returns an auth with its own session.
+    """
+    auth = Auth()
+    auth.session.headers["X-Custom"] = "value"
+    auth.session.cookies.set("session", "secret")
+
+    clone = auth.copy()
+    assert clone.session is not auth.session
+    assert clone.session.headers["X-Custom"] == "value"
+    assert clone.session.cookies["session"] == "secret"
+
+    clone.session.headers["Referer"] = "https://example.org/"
+    assert "Referer" not in auth.session.headers
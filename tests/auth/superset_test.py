@@ -33,6 +33,7 @@ def test_username_password_auth(requests_mock: Mocker) -> None:
         requests_mock.last_request.text
         == "username=admin&password=password123&csrf_token=CSFR_TOKEN"
     )
+    assert auth.get_scope() == "https://superset.example.org/:admin"
 
 
 def test_username_password_auth_no_csrf(requests_mock: Mocker) -> None:
@@ -428,6 +428,24 @@ def test_workspaces(mocker: MockerFixture) -> None:
     assert obj["WORKSPACES"] == ["https://ws1", "https://ws2"]
 
 
+def test_http_stats(mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that ``--http-stats`` is a flag, and doesn't consume the next argument.
+    """
+    monkeypatch.setenv("PRESET_WORKSPACES", "https://ws1")
+    mocker.patch("preset_cli.cli.main.PresetClient")
+    setup_http_stats = mocker.patch("preset_cli.cli.main.setup_http_stats")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        preset_cli,
+        ["--jwt-token", "JWT_TOKEN", "--http-stats", "superset", "--help"],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    setup_http_stats.assert_called_with(mocker.ANY, True, None)
+
+
 def test_workspaces_from_env(
     mocker: MockerFixture,
     monkeypatch: pytest.MonkeyPatch,
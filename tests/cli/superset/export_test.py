@@ -201,7 +201,7 @@ def test_export_resource(
     with open(root / "databases/gsheets.yaml", encoding="utf-8") as input_:
         assert input_.read() == "database_name: GSheets\nsqlalchemy_uri: gsheets://\n"
 
-    client.get_resources.assert_called_once_with("database")
+    client.get_resources.assert_called_once_with("database", columns=["id"])
 
     # check that Jinja2 was escaped
     export_resource(
@@ -14,6 +14,7 @@ from click.testing import CliRunner
 from pyfakefs.fake_filesystem import FakeFilesystem
 from pytest_mock import MockerFixture
 
+from preset_cli.cli.superset.lib import read_logs
 from preset_cli.cli.superset.main import superset_cli
 
 
@@ -267,7 +268,7 @@ def test_import_ownership_failure(mocker: MockerFixture, fs: FakeFilesystem) ->
 
     assert Path("progress.log").exists()
     with open("progress.log", encoding="utf-8") as log:
-        content = yaml.load(log, Loader=yaml.SafeLoader)
+        content = read_logs(log)
 
     assert content == {
         "assets": [],
@@ -329,7 +330,7 @@ def test_import_ownership_failure_continue(
 
     assert Path("progress.log").exists()
     with open("progress.log", encoding="utf-8") as log:
-        content = yaml.load(log, Loader=yaml.SafeLoader)
+        content = read_logs(log)
 
     assert content == {
         "assets": [],
@@ -16,18 +16,34 @@ from preset_cli.api.operators import Contains
 from preset_cli.cli.superset.lib import (
     DASHBOARD_FILTER_KEYS,
     LogType,
+    append_log_to_file,
     clean_logs,
     coerce_bool_option,
     fetch_with_filter_fallback,
     filter_resources_locally,
+    get_log_file_path,
     get_logs,
     is_filter_not_allowed_error,
     parse_filters,
+    read_logs,
     write_logs_to_file,
 )
 from preset_cli.exceptions import SupersetError
 
 
+def test_get_log_file_path(mocker: MockerFixture) -> None:
+    """
+    Test the ``get_log_file_path`` helper.
+    """
+    mocker.patch("preset_cli.cli.superset.lib.LOG_FILE_PATH", Path("progress.log"))
+    assert get_log_file_path("https://superset.example.org/") == Path(
+        "progress-https_superset.example.org.log",
+    )
+    assert get_log_file_path("https://superset.example.org/") != get_log_file_path(
+        "https://other.example.org/",
+    )
+
+
 def test_get_logs_new_file(mocker: MockerFixture, fs: FakeFilesystem) -> None:
     """
     Test the ``get_logs`` helper when the log file does not exist.
@@ -141,11 +157,79 @@ def test_write_logs_to_file(mocker: MockerFixture, fs: FakeFilesystem) -> None:
         write_logs_to_file(file, new_logs)
 
     with open(root / "progress.log", encoding="utf-8") as file:
-        content = yaml.load(file, Loader=yaml.SafeLoader)
+        content = read_logs(file)
 
     assert content == new_logs
 
 
+def test_read_logs(fs: FakeFilesystem) -> None:
+    """
+    Test the ``read_logs`` helper.
+
+    Entries that were partially written are ignored.
+    """
+    fs.create_file(
+        "progress.log",
+        contents=(
+            '{"assets": {"uuid": "uuid1", "path": "first_path", "status": "SUCCESS"}}\n'
+            '{"ownership": {"uuid": "uuid2", "status": "SUCCESS"}}\n'
+            '{"assets": {"uuid": "uuid3", "path": "third_path", "status": "FAILED"}}\n'
+            '{"assets": {"uuid": "uuid4", "pa'
+        ),
+    )
+
+    with open("progress.log", encoding="utf-8") as file:
+        assert read_logs(file) == {
+            "assets": [
+                {"uuid": "uuid1", "path": "first_path", "status": "SUCCESS"},
+                {"uuid": "uuid3", "path": "third_path", "status": "FAILED"},
+            ],
+            "ownership": [{"uuid": "uuid2", "status": "SUCCESS"}],
+        }
+
+
+def test_append_log_to_file(mocker: MockerFixture, fs: FakeFilesystem) -> None:
+    """
+    Test the ``append_log_to_file`` helper.
+    """
+    mocker.patch("preset_cli.cli.superset.lib.LOG_COMPACTION_INTERVAL", 3)
+    logs: dict[LogType, list[dict[str, object]]] = {
+        LogType.ASSETS: [],
+        LogType.OWNERSHIP: [{"uuid": "uuid0", "status": "SUCCESS"}],
+    }
+
+    with open("progress.log", "w", encoding="utf-8") as file:
+        write_logs_to_file(file, logs)
+        for i in range(1, 3):
+            append_log_to_file(
+                file,
+                logs,
+                LogType.ASSETS,
+                {"uuid": f"uuid{i}", "status": "SUCCESS"},
+            )
+        # simulate a partial write before the file is compacted
+        file.write('{"assets": {"uu\n')
+        append_log_to_file(
+            file,
+            logs,
+            LogType.ASSETS,
+            {"uuid": "uuid3", "status": "SUCCESS"},
+        )
+
+    with open("progress.log", encoding="utf-8") as file:
+        lines = file.read().splitlines()
+
+    assert lines == [
+        '{"assets": {"uuid": "uuid1", "status": "SUCCESS"}}',
+        '{"assets": {"uuid": "uuid2", "status": "SUCCESS"}}',
+        '{"assets": {"uuid": "uuid3", "status": "SUCCESS"}}',
+        '{"ownership": {"uuid": "uuid0", "status": "SUCCESS"}}',
+    ]
+    assert logs[LogType.ASSETS] == [
+        {"uuid": f"uuid{i}", "status": "SUCCESS"} for i in range(1, 4)
+    ]
+
+
 def test_clean_logs_delete_file(mocker: MockerFixture, fs: FakeFilesystem) -> None:
     """
     Test the ``clean_logs`` helper when the log file should be deleted.
@@ -232,9 +316,12 @@ def test_clean_logs_keep_file(mocker: MockerFixture, fs: FakeFilesystem) -> None
     clean_logs(LogType.ASSETS, current_logs)
 
     with open(logs_path, encoding="utf-8") as log:
-        content = yaml.load(log, Loader=yaml.SafeLoader)
+        content = read_logs(log)
 
-    assert content == {"ownership": [{"status": "SUCCESS", "uuid": "uuid2"}]}
+    assert content == {
+        "assets": [],
+        "ownership": [{"status": "SUCCESS", "uuid": "uuid2"}],
+    }
 
 
 def test_clean_logs_missing_file_no_error(
@@ -2,11 +2,19 @@
 Tests for the Superset dispatcher.
 """
 
+import json
+import sys
+from pathlib import Path
+from unittest import mock
+
 import click
+import yaml
 from click.testing import CliRunner
+from pyfakefs.fake_filesystem import FakeFilesystem
 from pytest_mock import MockerFixture
 from yarl import URL
 
+from preset_cli.api.cache import HTTPCache
 from preset_cli.cli.superset.main import mutate_commands, superset, superset_cli
 
 
@@ -96,6 +104,199 @@ Goodbye, Alice!
     )
 
 
+def test_mutate_commands_parallel() -> None:
+    """
+    Test ``mutate_commands`` running workspaces concurrently.
+    """
+
+    @click.group()
+    def source_group() -> None:
+        """
+        A simple group of commands.
+        """
+
+    @click.command()
+    @click.argument("name")
+    @click.pass_context
+    def source_command(ctx: click.core.Context, name: str) -> None:
+        """
+        Say hello, failing in one of the instances.
+        """
+        click.echo(f"Hello, {name} from {ctx.obj['INSTANCE']}!")
+        if ctx.obj["INSTANCE"] == "instance2":
+            raise Exception("Something went wrong")
+
+    source_group.add_command(source_command)
+
+    @click.group()
+    @click.pass_context
+    def target_group(ctx: click.core.Context) -> None:
+        """
+        The target group to which commands will be added to.
+        """
+        ctx.ensure_object(dict)
+        ctx.obj["WORKSPACES"] = ["instance1", "instance2", "instance3"]
+        ctx.obj["PARALLEL"] = 2
+
+    mutate_commands(source_group, target_group)
+
+    runner = CliRunner()
+
+    result = runner.invoke(
+        target_group,
+        ["source-command", "Alice"],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 1
+    assert (
+        result.output
+        == """
+instance1
+Hello, Alice from instance1!
+
+instance2
+Hello, Alice from instance2!
+Something went wrong
+
+instance3
+Hello, Alice from instance3!
+
+Summary: 2 succeeded, 1 failed
+✅ instance1
+❌ instance2
+✅ instance3
+"""
+    )
+
+
+def test_mutate_commands_parallel_exit() -> None:
+    """
+    Test ``mutate_commands`` running workspaces concurrently that exit early.
+    """
+
+    @click.group()
+    def source_group() -> None:
+        """
+        A simple group of commands.
+        """
+
+    @click.command()
+    @click.pass_context
+    def source_command(ctx: click.core.Context) -> None:
+        """
+        Exit with a code that depends on the instance.
+        """
+        codes = {"instance1": 0, "instance2": 2, "instance3": None}
+        if ctx.obj["INSTANCE"] == "instance3":
+            sys.exit(codes[ctx.obj["INSTANCE"]])
+        ctx.exit(codes[ctx.obj["INSTANCE"]])
+
+    source_group.add_command(source_command)
+
+    @click.group()
+    @click.pass_context
+    def target_group(ctx: click.core.Context) -> None:
+        """
+        The target group to which commands will be added to.
+        """
+        ctx.ensure_object(dict)
+        ctx.obj["WORKSPACES"] = ["instance1", "instance2", "instance3"]
+        ctx.obj["PARALLEL"] = 2
+
+    mutate_commands(source_group, target_group)
+
+    runner = CliRunner()
+
+    result = runner.invoke(target_group, ["source-command"], catch_exceptions=False)
+    assert result.exit_code == 1
+    assert (
+        result.output
+        == """
+instance1
+
+instance2
+exited with code 2
+
+instance3
+
+Summary: 2 succeeded, 1 failed
+✅ instance1
+❌ instance2
+✅ instance3
+"""
+    )
+
+
+def test_mutate_commands_parallel_progress_logs(
+    mocker: MockerFixture,
+    fs: FakeFilesystem,
+) -> None:
+    """
+    Test that workspaces running concurrently resume from their own progress log.
+    """
+    mocker.patch("preset_cli.cli.superset.lib.LOG_FILE_PATH", Path("progress.log"))
+    clients = {}
+
+    def get_client(baseurl: URL, **_kwargs: object) -> mock.MagicMock:
+        client = mock.MagicMock()
+        client.export_users.return_value = [{"id": 1, "email": "admin@example.com"}]
+        client.get_uuids.return_value = {1: "uuid1", 2: "uuid2"}
+        clients[str(baseurl)] = client
+        return client
+
+    mocker.patch(
+        "preset_cli.cli.superset.import_.SupersetClient",
+        side_effect=get_client,
+    )
+    ownership = {
+        "dataset": [
+            {"name": "table1", "owners": ["admin@example.com"], "uuid": "uuid1"},
+            {"name": "table2", "owners": ["admin@example.com"], "uuid": "uuid2"},
+        ],
+    }
+    fs.create_file("ownership.yaml", contents=yaml.dump(ownership))
+    fs.create_file("progress.log", contents="")
+
+    # each workspace has already imported a different asset
+    workspaces = {
+        "https://superset1.example.org/": "uuid1",
+        "https://superset2.example.org/": "uuid2",
+    }
+    for instance, uuid in workspaces.items():
+        slug = instance.replace("://", "_").rstrip("/")
+        fs.create_file(
+            f"progress-{slug}.log",
+            contents=json.dumps({"ownership": {"uuid": uuid, "status": "SUCCESS"}}),
+        )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        superset,
+        ["--parallel", "2", "import-ownership", "ownership.yaml"],
+        obj={"WORKSPACES": list(workspaces), "AUTH": mock.MagicMock()},
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+
+    assert [
+        call.args[1]["uuid"]
+        for call in clients[
+            "https://superset1.example.org/"
+        ].import_ownership.mock_calls
+    ] == ["uuid2"]
+    assert [
+        call.args[1]["uuid"]
+        for call in clients[
+            "https://superset2.example.org/"
+        ].import_ownership.mock_calls
+    ] == ["uuid1"]
+
+    # the per-workspace logs are removed, and the shared one is left untouched
+    assert not Path("progress-https_superset1.example.org.log").exists()
+    assert not Path("progress-https_superset2.example.org.log").exists()
+    assert Path("progress.log").exists()
+
+
 def test_superset() -> None:
     """
     Test the ``superset`` command.
@@ -111,7 +312,11 @@ def test_superset() -> None:
   Send commands to one or more Superset instances.
 
 Options:
-  --help  Show this message and exit.
+  --parallel INTEGER RANGE  Number of workspaces to run concurrently  [x>=1]
+  --cache-dir TEXT          Directory for caching read-only API responses
+                            between runs
+  --no-cache                Disable the HTTP cache
+  --help                    Show this message and exit.
 
 Commands:
   delete-assets
@@ -163,3 +368,81 @@ def test_superset_jwt_auth(mocker: MockerFixture) -> None:
     )
 
     SupersetJWTAuth.assert_called_with("SECRET", URL("http://localhost:8088/"))
+
+
+def test_superset_cache(mocker: MockerFixture, tmp_path: Path) -> None:
+    """
+    Test the ``--cache-dir`` and ``--no-cache`` options.
+    """
+    SupersetClient = mocker.patch(  # pylint: disable=invalid-name
+        "preset_cli.cli.superset.sql.SupersetClient",
+    )
+    SupersetClient().get_databases.return_value = []
+    mocker.patch("preset_cli.cli.superset.main.UsernamePasswordAuth")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        superset_cli,
+        ["--cache-dir", str(tmp_path / "cache"), "http://localhost:8088/", "sql"],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    cache = SupersetClient.call_args.kwargs["cache"]
+    assert isinstance(cache, HTTPCache)
+    assert cache.directory == tmp_path / "cache"
+
+    result = runner.invoke(
+        superset_cli,
+        ["--no-cache", "http://localhost:8088/", "sql"],
+        catch_exceptions=False,
+        env={"PRESET_CLI_CACHE_DIR": str(tmp_path / "cache")},
+    )
+    assert result.exit_code == 0
+    assert SupersetClient.call_args.kwargs["cache"] is None
+
+
+def test_superset_http_stats(mocker: MockerFixture, tmp_path: Path) -> None:
+    """
+    Test the ``--http-stats`` and ``--http-stats-file`` options.
+
+    The flag doesn't take a value, so it can be followed by the instance.
+    """
+    mocker.patch("preset_cli.cli.superset.main.UsernamePasswordAuth")
+    SupersetClient = mocker.patch(  # pylint: disable=invalid-name
+        "preset_cli.cli.superset.export.SupersetClient",
+    )
+    SupersetClient().export_users.return_value = []
+    setup_http_stats = mocker.patch("preset_cli.cli.superset.main.setup_http_stats")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        superset_cli,
+        [
+            "--http-stats",
+            "https://superset.example.org/",
+            "export-users",
+            str(tmp_path / "users.yaml"),
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    assert (tmp_path / "users.yaml").exists()
+    setup_http_stats.assert_called_with(mocker.ANY, True, None)
+
+    result = runner.invoke(
+        superset_cli,
+        [
+            "--http-stats-file",
+            str(tmp_path / "stats.json"),
+            "https://superset.example.org/",
+            "export-users",
+            str(tmp_path / "users.yaml"),
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    setup_http_stats.assert_called_with(
+        mocker.ANY,
+        False,
+        str(tmp_path / "stats.json"),
+    )
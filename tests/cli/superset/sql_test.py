@@ -8,13 +8,22 @@ from io import StringIO
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
 from click.testing import CliRunner
 from pyfakefs.fake_filesystem import FakeFilesystem
 from pytest_mock import MockerFixture
 from yarl import URL
 
+from preset_cli.api.cache import ResultCache
 from preset_cli.cli.superset.main import superset_cli
-from preset_cli.cli.superset.sql import run_query, run_session
+from preset_cli.cli.superset.sql import (
+    export_query,
+    run_query,
+    run_query_async,
+    run_session,
+)
 from preset_cli.exceptions import ErrorLevel, SupersetError
 
 
@@ -27,7 +36,7 @@ def test_run_query(mocker: MockerFixture) -> None:
     click = mocker.patch("preset_cli.cli.superset.sql.click")
 
     run_query(client=client, database_id=1, schema=None, query="SELECT 42 AS answer")
-    client.run_query.assert_called_with(1, "SELECT 42 AS answer", None)
+    client.run_query.assert_called_with(1, "SELECT 42 AS answer", None, refresh=False)
     click.echo.assert_called_with("  answer\n--------\n      42")
 
 
@@ -74,6 +83,112 @@ def test_run_query_exception(mocker: MockerFixture) -> None:
     traceback.print_exc.assert_called_with()
 
 
+def test_run_query_async(mocker: MockerFixture) -> None:
+    """
+    Test ``run_query_async``.
+    """
+    client = mocker.MagicMock()
+    client.run_query_async.return_value = iter(
+        [pd.DataFrame([{"answer": 42}]), pd.DataFrame([{"answer": 43}])],
+    )
+    click = mocker.patch("preset_cli.cli.superset.sql.click")
+
+    run_query_async(client=client, database_id=1, schema=None, query="SELECT 42")
+    client.run_query_async.assert_called_with(1, "SELECT 42", None)
+    click.echo.assert_has_calls(
+        [
+            mocker.call("answer\n42\n", nl=False),
+            mocker.call("43\n", nl=False),
+        ],
+    )
+
+
+def test_run_query_async_superset_error(mocker: MockerFixture) -> None:
+    """
+    Test ``run_query_async`` when a ``SupersetError`` happens.
+    """
+    client = mocker.MagicMock()
+    client.run_query_async.side_effect = SupersetError(
+        [
+            {
+                "message": "Query finished with status stopped",
+                "error_type": "GENERIC_DB_ENGINE_ERROR",
+                "level": ErrorLevel.ERROR,
+            },
+        ],
+    )
+    click = mocker.patch("preset_cli.cli.superset.sql.click")
+
+    run_query_async(client=client, database_id=1, schema=None, query="SELECT 1")
+    click.style.assert_called_with(
+        "Query finished with status stopped",
+        fg="bright_red",
+    )
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".csv", ".arrow"])
+def test_export_query(mocker: MockerFixture, tmp_path: Path, suffix: str) -> None:
+    """
+    Test ``export_query``.
+    """
+    table = pa.table({"answer": [42, 43]})
+    client = mocker.MagicMock()
+    client.run_query_arrow.return_value = pa.RecordBatchReader.from_batches(
+        table.schema,
+        table.to_batches(max_chunksize=1),
+    )
+
+    output = tmp_path / f"results{suffix}"
+    export_query(
+        client=client,
+        database_id=1,
+        schema=None,
+        query="SELECT 42 AS answer",
+        output=output,
+        run_async=True,
+    )
+    client.run_query_arrow.assert_called_with(
+        1,
+        "SELECT 42 AS answer",
+        None,
+        limit=None,
+        run_async=True,
+    )
+
+    if suffix == ".parquet":
+        assert pq.read_table(output) == table
+    elif suffix == ".csv":
+        assert output.read_text() == '"answer"\n42\n43\n'
+    else:
+        with pa.ipc.open_file(output) as reader:
+            assert reader.read_all() == table
+
+
+def test_export_query_superset_error(mocker: MockerFixture, tmp_path: Path) -> None:
+    """
+    Test ``export_query`` when a ``SupersetError`` happens.
+    """
+    client = mocker.MagicMock()
+    client.run_query_arrow.side_effect = SupersetError(
+        [
+            {
+                "message": "Query finished with status failed",
+                "error_type": "GENERIC_DB_ENGINE_ERROR",
+                "level": ErrorLevel.ERROR,
+            },
+        ],
+    )
+    click = mocker.patch("preset_cli.cli.superset.sql.click")
+
+    output = tmp_path / "results.parquet"
+    export_query(client, 1, None, "SELECT 1", output)
+    click.style.assert_called_with(
+        "Query finished with status failed",
+        fg="bright_red",
+    )
+    assert not output.exists()
+
+
 def test_run_session(mocker: MockerFixture, fs: FakeFilesystem) -> None:
     """
     Test ``run_session``.
@@ -289,7 +404,104 @@ def test_sql_run_query(mocker: MockerFixture) -> None:
         catch_exceptions=False,
     )
     assert result.exit_code == 0
-    run_query.assert_called_with(client, 1, None, "SELECT 1")
+    run_query.assert_called_with(client, 1, None, "SELECT 1", False)
+
+
+def test_sql_run_query_async(mocker: MockerFixture) -> None:
+    """
+    Test the ``sql`` command running a single query asynchronously.
+    """
+    SupersetClient = mocker.patch("preset_cli.cli.superset.sql.SupersetClient")
+    client = SupersetClient()
+    client.get_databases.return_value = [{"id": 1, "database_name": "GSheets"}]
+    mocker.patch("preset_cli.cli.superset.main.UsernamePasswordAuth")
+    run_query_async = mocker.patch("preset_cli.cli.superset.sql.run_query_async")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        superset_cli,
+        [
+            "https://superset.example.org/",
+            "sql",
+            "-e",
+            "SELECT 1",
+            "--database-id",
+            "1",
+            "--async",
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    run_query_async.assert_called_with(client, 1, None, "SELECT 1")
+
+
+def test_sql_output(mocker: MockerFixture) -> None:
+    """
+    Test the ``sql`` command writing the results to a file.
+    """
+    SupersetClient = mocker.patch("preset_cli.cli.superset.sql.SupersetClient")
+    client = SupersetClient()
+    client.get_databases.return_value = [{"id": 1, "database_name": "GSheets"}]
+    mocker.patch("preset_cli.cli.superset.main.UsernamePasswordAuth")
+    export_query = mocker.patch("preset_cli.cli.superset.sql.export_query")
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            superset_cli,
+            [
+                "https://superset.example.org/",
+                "sql",
+                "-e",
+                "SELECT 1",
+                "--database-id",
+                "1",
+                "--output",
+                "results.parquet",
+            ],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        export_query.assert_called_with(
+            client,
+            1,
+            None,
+            "SELECT 1",
+            Path("results.parquet").resolve(),
+            False,
+        )
+
+
+def test_sql_output_invalid(mocker: MockerFixture) -> None:
+    """
+    Test the ``sql`` command with an invalid ``--output``.
+    """
+    mocker.patch("preset_cli.cli.superset.sql.SupersetClient")
+    mocker.patch("preset_cli.cli.superset.main.UsernamePasswordAuth")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        superset_cli,
+        [
+            "https://superset.example.org/",
+            "sql",
+            "-e",
+            "SELECT 1",
+            "--output",
+            "results.xlsx",
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 1
+    assert "one of the extensions: .arrow, .csv, .parquet" in result.output
+
+    result = runner.invoke(
+        superset_cli,
+        ["https://superset.example.org/", "sql", "--output", "results.csv"],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 1
+    assert "``--output`` requires a query passed with ``-e``" in result.output
 
 
 def test_sql_run_session(mocker: MockerFixture) -> None:
@@ -320,7 +532,66 @@ def test_sql_run_session(mocker: MockerFixture) -> None:
         "GSheets",
         None,
         URL("https://superset.example.org/"),
+        False,
+    )
+
+
+def test_sql_result_cache(mocker: MockerFixture, tmp_path: Path) -> None:
+    """
+    Test the ``sql`` command with a result cache.
+    """
+    SupersetClient = mocker.patch("preset_cli.cli.superset.sql.SupersetClient")
+    client = SupersetClient()
+    client.get_databases.return_value = [{"id": 1, "database_name": "GSheets"}]
+    mocker.patch("preset_cli.cli.superset.main.UsernamePasswordAuth")
+    run_query = mocker.patch("preset_cli.cli.superset.sql.run_query")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        superset_cli,
+        [
+            "https://superset.example.org/",
+            "sql",
+            "-e",
+            "SELECT 1",
+            "--result-cache-dir",
+            str(tmp_path),
+            "--result-cache-ttl",
+            "60",
+            "--refresh",
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    run_query.assert_called_with(client, 1, None, "SELECT 1", True)
+    result_cache = SupersetClient.call_args.kwargs["result_cache"]
+    assert isinstance(result_cache, ResultCache)
+    assert result_cache.directory == tmp_path
+    assert result_cache.ttl == 60
+
+
+def test_sql_result_cache_no_pyarrow(mocker: MockerFixture, tmp_path: Path) -> None:
+    """
+    Test the ``sql`` command with a result cache when ``pyarrow`` is not installed.
+    """
+    mocker.patch("preset_cli.cli.superset.sql.pa", None)
+    mocker.patch("preset_cli.cli.superset.main.UsernamePasswordAuth")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        superset_cli,
+        [
+            "https://superset.example.org/",
+            "sql",
+            "-e",
+            "SELECT 1",
+            "--result-cache-dir",
+            str(tmp_path),
+        ],
+        catch_exceptions=False,
     )
+    assert result.exit_code == 1
+    assert "Caching query results requires ``pyarrow``" in result.output
 
 
 def test_sql_run_query_no_databases(mocker: MockerFixture) -> None:
@@ -376,7 +647,7 @@ def test_sql_choose_database(mocker: MockerFixture) -> None:
         catch_exceptions=False,
     )
     assert result.exit_code == 0
-    run_query.assert_called_with(client, 1, None, "SELECT 1")
+    run_query.assert_called_with(client, 1, None, "SELECT 1", False)
 
 
 def test_sql_single_database(mocker: MockerFixture) -> None:
@@ -403,4 +674,4 @@ def test_sql_single_database(mocker: MockerFixture) -> None:
         catch_exceptions=False,
     )
     assert result.exit_code == 0
-    run_query.assert_called_with(client, 1, None, "SELECT 1")
+    run_query.assert_called_with(client, 1, None, "SELECT 1", False)
@@ -1444,6 +1444,7 @@ def test_dbt_core(mocker: MockerFixture, fs: FakeFilesystem) -> None:
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
     sync_exposures.assert_called_with(
         client,
@@ -1453,6 +1454,62 @@ def test_dbt_core(mocker: MockerFixture, fs: FakeFilesystem) -> None:
     )
 
 
+def test_dbt_core_stream_manifest(mocker: MockerFixture, fs: FakeFilesystem) -> None:
+    """
+    Test the ``dbt-core`` command parsing the manifest incrementally.
+    """
+    root = Path("/path/to/root")
+    fs.create_dir(root)
+    manifest = root / "default/target/manifest.json"
+    fs.create_file(manifest, contents=manifest_contents)
+    profiles = root / ".dbt/profiles.yml"
+    fs.create_file(profiles, contents=profiles_contents)
+
+    SupersetClient = mocker.patch(
+        "preset_cli.cli.superset.sync.dbt.command.SupersetClient",
+    )
+    client = SupersetClient()
+    mocker.patch("preset_cli.cli.superset.main.UsernamePasswordAuth")
+    sync_database = mocker.patch(
+        "preset_cli.cli.superset.sync.dbt.command.sync_database",
+    )
+    sync_datasets = mocker.patch(
+        "preset_cli.cli.superset.sync.dbt.command.sync_datasets",
+        return_value=([], []),
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        superset_cli,
+        [
+            "https://superset.example.org/",
+            "sync",
+            "dbt-core",
+            str(manifest),
+            "--profiles",
+            str(profiles),
+            "--project",
+            "default",
+            "--target",
+            "dev",
+            "--stream-manifest",
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    sync_datasets.assert_called_with(
+        client,
+        model_schema.load(dbt_core_models, many=True),
+        superset_metrics,
+        sync_database(),
+        False,
+        "",
+        reload_columns=True,
+        merge_metadata=False,
+        workers=1,
+    )
+
+
 def test_dbt_core_metricflow(mocker: MockerFixture, fs: FakeFilesystem) -> None:
     """
     Test the ``dbt-core`` command with Metricflow metrics.
@@ -1809,6 +1866,7 @@ def test_dbt_core_preserve_metadata(
         "",
         reload_columns=False,
         merge_metadata=False,
+        workers=1,
     )
     sync_exposures.assert_called_with(
         client,
@@ -1891,6 +1949,7 @@ def test_dbt_core_merge_metadata(
         "",
         reload_columns=False,
         merge_metadata=True,
+        workers=1,
     )
     sync_exposures.assert_called_with(
         client,
@@ -2057,6 +2116,7 @@ def test_dbt_core_raise_failures_flag_no_failures(
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
     list_failed_models.assert_not_called()
 
@@ -2139,6 +2199,7 @@ def test_dbt_core_raise_failures_flag_deprecation_warning(
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
     list_failed_models.assert_not_called()
 
@@ -2222,6 +2283,7 @@ def test_dbt_core_raise_failures_flag_with_failures(
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
 
 
@@ -2293,6 +2355,7 @@ def test_dbt_core_raise_failures_flag_with_failures_and_deprecation(
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
 
 
@@ -2571,6 +2634,7 @@ def test_dbt(mocker: MockerFixture, fs: FakeFilesystem) -> None:
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
     sync_exposures.assert_called_with(
         client,
@@ -2957,6 +3021,7 @@ def test_dbt_core_metrics_with_syntax_defined(
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
 
 
@@ -3038,6 +3103,7 @@ def test_dbt_cloud(mocker: MockerFixture) -> None:
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
 
 
@@ -3094,6 +3160,7 @@ def test_dbt_cloud_preserve_metadata(mocker: MockerFixture) -> None:
         "",
         reload_columns=False,
         merge_metadata=False,
+        workers=1,
     )
 
 
@@ -3150,6 +3217,7 @@ def test_dbt_cloud_merge_metadata(mocker: MockerFixture) -> None:
         "",
         reload_columns=False,
         merge_metadata=True,
+        workers=1,
     )
 
 
@@ -3209,6 +3277,7 @@ def test_dbt_cloud_raise_failures_flag_no_failures(mocker: MockerFixture) -> Non
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
     list_failed_models.assert_not_called()
 
@@ -3271,6 +3340,7 @@ def test_dbt_cloud_raise_failures_flag_with_failures(mocker: MockerFixture) -> N
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
 
 
@@ -3380,6 +3450,7 @@ def test_dbt_cloud_no_job_id(mocker: MockerFixture) -> None:
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
 
 
@@ -3682,6 +3753,7 @@ def test_dbt_cloud_specific_db_id(mocker: MockerFixture) -> None:
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
 
     superset_client.get_databases.assert_not_called()
@@ -3742,6 +3814,7 @@ def test_dbt_cloud_specific_db_name(mocker: MockerFixture) -> None:
         "",
         reload_columns=True,
         merge_metadata=False,
+        workers=1,
     )
 
     superset_client.get_databases.assert_called_once_with(
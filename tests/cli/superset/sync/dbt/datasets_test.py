@@ -2,9 +2,11 @@
 Tests for ``preset_cli.cli.superset.sync.dbt.datasets``.
 """
 
-# pylint: disable=invalid-name, too-many-lines, redefined-outer-name
+# pylint: disable=invalid-name, too-many-lines, redefined-outer-name, unused-argument
 
+import copy
 import json
+import time
 from typing import Any, Dict, List, cast
 from unittest import mock
 
@@ -16,6 +18,8 @@ from yarl import URL
 from preset_cli.api.clients.superset import SupersetMetricDefinition
 from preset_cli.cli.superset.sync.dbt.datasets import (
     DEFAULT_CERTIFICATION,
+    DatasetIndex,
+    build_dataset_index,
     clean_metadata,
     compute_columns,
     compute_columns_metadata,
@@ -177,6 +181,59 @@ def test_sync_datasets_new(mocker: MockerFixture) -> None:
     )
 
 
+def test_sync_datasets_workers(mocker: MockerFixture) -> None:
+    """
+    Test ``sync_datasets`` with multiple workers.
+
+    Datasets and failures should be returned in the order of the models.
+    """
+    client = mocker.MagicMock()
+    workers_models = []
+    for i in range(10):
+        model = copy.deepcopy(models[0])
+        model["name"] = f"model_{i}"
+        model["unique_id"] = f"model.superset_examples.model_{i}"
+        workers_models.append(model)
+
+    def get_or_create_dataset(
+        client: Any,
+        model: ModelSchema,
+        database: Any,
+        index: Any,
+        lock: Any,
+    ) -> Any:
+        assert lock is not None
+        i = int(model["name"].split("_")[1])
+        if i % 3 == 0:
+            raise CLIError("Unable to create dataset", 1)
+        return {"id": i, "metrics": [], "columns": []}
+
+    mocker.patch(
+        "preset_cli.cli.superset.sync.dbt.datasets.get_or_create_dataset",
+        side_effect=get_or_create_dataset,
+    )
+    client.get_dataset.return_value = {"columns": []}
+
+    datasets, failed = sync_datasets(
+        client=client,
+        models=workers_models,
+        metrics=metrics,
+        database={"id": 1},
+        disallow_edits=False,
+        external_url_prefix="",
+        workers=4,
+    )
+
+    assert [dataset["id"] for dataset in datasets] == [1, 2, 4, 5, 7, 8]
+    assert failed == [
+        "model.superset_examples.model_0",
+        "model.superset_examples.model_3",
+        "model.superset_examples.model_6",
+        "model.superset_examples.model_9",
+    ]
+    assert client.update_dataset.call_count == 12
+
+
 def test_sync_datasets_first_update_fails(mocker: MockerFixture) -> None:
     """
     Test ``sync_datasets`` with ``update_dataset`` failing in the first execution.
@@ -318,6 +375,10 @@ def test_sync_datasets_with_alias(mocker: MockerFixture) -> None:
             },
         ),
     ]
+    client.get_datasets.return_value = [
+        {"id": 1, "schema": "public", "table_name": "messages_channels"},
+        {"id": 2, "schema": "public", "table_name": "model_alias"},
+    ]
     sync_datasets(
         client=client,
         models=models_with_alias,
@@ -326,13 +387,9 @@ def test_sync_datasets_with_alias(mocker: MockerFixture) -> None:
         disallow_edits=False,
         external_url_prefix="",
     )
-    client.get_datasets.assert_called_with(
-        database=mock.ANY,
-        schema="public",
-        table_name="model_alias",
-    )
-    client.get_datasets.return_value = [{"id": 1}]
-    client.get_dataset.return_value = {"id": 1}
+    client.get_datasets.assert_called_once_with(database=mock.ANY)
+    client.get_dataset.assert_any_call(2)
+    client.create_dataset.assert_not_called()
 
 
 def test_sync_datasets_custom_certification(mocker: MockerFixture) -> None:
@@ -368,7 +425,13 @@ def test_sync_datasets_custom_certification(mocker: MockerFixture) -> None:
         certification={"details": "This dataset is synced from dbt Cloud"},
     )
 
-    get_or_create_dataset_mock.assert_called_with(client, models[0], {"id": 1})
+    get_or_create_dataset_mock.assert_called_with(
+        client,
+        models[0],
+        {"id": 1},
+        {},
+        None,
+    )
     compute_metrics_mock.assert_called_with(
         get_or_create_dataset_mock()["metrics"],
         metrics[model_id],
@@ -457,6 +520,9 @@ def test_sync_datasets_existing(mocker: MockerFixture) -> None:
     mocker.patch(
         "preset_cli.cli.superset.sync.dbt.datasets.compute_columns_metadata",
     )
+    client.get_datasets.return_value = [
+        {"id": 1, "schema": "public", "table_name": "messages_channels"},
+    ]
 
     sync_datasets(
         client=client,
@@ -474,7 +540,10 @@ def test_sync_datasets_multiple_existing(mocker: MockerFixture) -> None:
     Test ``sync_datasets`` when multiple datasets are found to exist.
     """
     client = mocker.MagicMock()
-    client.get_datasets.return_value = [{"id": 1}, {"id": 2}]
+    client.get_datasets.return_value = [
+        {"id": 1, "schema": "public", "table_name": "messages_channels"},
+        {"id": 2, "schema": "public", "table_name": "messages_channels"},
+    ]
 
     working, failed = sync_datasets(
         client=client,
@@ -520,7 +589,13 @@ def test_sync_datasets_external_url_disallow_edits(mocker: MockerFixture) -> Non
         external_url_prefix="https://dbt.example.org/",
     )
 
-    get_or_create_dataset_mock.assert_called_with(client, models[0], {"id": 1})
+    get_or_create_dataset_mock.assert_called_with(
+        client,
+        models[0],
+        {"id": 1},
+        {},
+        None,
+    )
     compute_metrics_mock.assert_called_with(
         get_or_create_dataset_mock()["metrics"],
         metrics[model_id],
@@ -593,7 +668,13 @@ def test_sync_datasets_preserve_metadata(mocker: MockerFixture) -> None:
         merge_metadata=False,
     )
 
-    get_or_create_dataset_mock.assert_called_with(client, models[0], {"id": 1})
+    get_or_create_dataset_mock.assert_called_with(
+        client,
+        models[0],
+        {"id": 1},
+        {},
+        None,
+    )
     compute_metrics_mock.assert_called_with(
         get_or_create_dataset_mock()["metrics"],
         metrics[model_id],
@@ -671,7 +752,13 @@ def test_sync_datasets_merge_metadata(mocker: MockerFixture) -> None:
         merge_metadata=True,
     )
 
-    get_or_create_dataset_mock.assert_called_with(client, models[0], {"id": 1})
+    get_or_create_dataset_mock.assert_called_with(
+        client,
+        models[0],
+        {"id": 1},
+        {},
+        None,
+    )
     compute_metrics_mock.assert_called_with(
         get_or_create_dataset_mock()["metrics"],
         metrics[model_id],
@@ -750,7 +837,13 @@ def test_sync_datasets_no_columns(mocker: MockerFixture) -> None:
         external_url_prefix="",
     )
 
-    get_or_create_dataset_mock.assert_called_with(client, modified_models[0], {"id": 1})
+    get_or_create_dataset_mock.assert_called_with(
+        client,
+        modified_models[0],
+        {"id": 1},
+        {},
+        None,
+    )
     compute_metrics_mock.assert_called_with(
         get_or_create_dataset_mock()["metrics"],
         metrics[model_id],
@@ -915,6 +1008,109 @@ def test_get_or_create_dataset_existing_dataset(mocker: MockerFixture) -> None:
     client.create_dataset.assert_not_called()
 
 
+def test_get_or_create_dataset_index(mocker: MockerFixture) -> None:
+    """
+    Test the ``get_or_create_dataset`` helper with a prefetched index.
+    """
+    client = mocker.MagicMock()
+    client.get_dataset.return_value = {"id": 2}
+    database = {"id": 1}
+    index = {
+        ("public", "messages_channels"): [{"id": 2}],
+        ("other", "messages_channels"): [{"id": 3}],
+    }
+    result = get_or_create_dataset(client, models[0], database, index)
+    assert result == {"id": 2}
+    client.get_datasets.assert_not_called()
+    client.get_dataset.assert_called_with(2)
+    client.create_dataset.assert_not_called()
+
+
+def test_get_or_create_dataset_index_shared_table(mocker: MockerFixture) -> None:
+    """
+    Test that datasets created with an index are found by later models.
+    """
+    create_dataset = mocker.patch(
+        "preset_cli.cli.superset.sync.dbt.datasets.create_dataset",
+        return_value={"id": 2},
+    )
+    client = mocker.MagicMock()
+    client.get_dataset.return_value = {"id": 2}
+    database = {"id": 1}
+    index: DatasetIndex = {}
+
+    other_model = dict(models[0], unique_id="model.superset_examples.other")
+    assert get_or_create_dataset(client, models[0], database, index) == {"id": 2}
+    assert get_or_create_dataset(client, other_model, database, index) == {"id": 2}
+
+    create_dataset.assert_called_once_with(client, database, models[0])
+    assert index == {("public", "messages_channels"): [{"id": 2}]}
+
+
+def test_sync_datasets_workers_shared_table(mocker: MockerFixture) -> None:
+    """
+    Test that models sharing a table create it only once when synced concurrently.
+    """
+    created: List[Dict[str, Any]] = []
+
+    def create_dataset(client: Any, database: Any, model: ModelSchema) -> Any:
+        time.sleep(0.01)
+        created.append(model)
+        return {"id": len(created)}
+
+    mocker.patch(
+        "preset_cli.cli.superset.sync.dbt.datasets.create_dataset",
+        side_effect=create_dataset,
+    )
+    mocker.patch(
+        "preset_cli.cli.superset.sync.dbt.datasets.build_dataset_index",
+        return_value={},
+    )
+    client = mocker.MagicMock()
+    client.get_dataset.return_value = {"id": 1, "metrics": [], "columns": []}
+    shared_models = [
+        dict(models[0], unique_id=f"model.superset_examples.model_{i}")
+        for i in range(4)
+    ]
+
+    datasets, failed = sync_datasets(
+        client=client,
+        models=shared_models,  # type: ignore
+        metrics={},
+        database={"id": 1, "sqlalchemy_uri": "postgresql://user@host/examples_dev"},
+        disallow_edits=False,
+        external_url_prefix="",
+        workers=4,
+    )
+
+    assert len(created) == 1
+    assert len(datasets) == 4
+    assert failed == []
+
+
+def test_build_dataset_index(mocker: MockerFixture) -> None:
+    """
+    Test the ``build_dataset_index`` helper.
+    """
+    client = mocker.MagicMock()
+    client.get_datasets.return_value = [
+        {"id": 1, "schema": "public", "table_name": "a"},
+        {"id": 2, "schema": "public", "table_name": "b"},
+        {"id": 3, "schema": "public", "table_name": "a"},
+        {"id": 4, "schema": None, "table_name": "a"},
+    ]
+    assert build_dataset_index(client, {"id": 1}) == {
+        ("public", "a"): [
+            {"id": 1, "schema": "public", "table_name": "a"},
+            {"id": 3, "schema": "public", "table_name": "a"},
+        ],
+        ("public", "b"): [{"id": 2, "schema": "public", "table_name": "b"}],
+        (None, "a"): [{"id": 4, "schema": None, "table_name": "a"}],
+    }
+    client.get_datasets.assert_called_once_with(database=mock.ANY)
+    assert client.get_datasets.call_args.kwargs["database"].value == 1
+
+
 def test_get_or_create_dataset_multiple_datasets(mocker: MockerFixture) -> None:
     """
     Test the ``get_or_create_dataset`` helper when it finds many datasets.
@@ -23,6 +23,7 @@ from preset_cli.cli.superset.sync.dbt.lib import (
     filter_models,
     get_og_metric_from_config,
     list_failed_models,
+    load_manifest,
     load_profiles,
 )
 from preset_cli.cli.superset.sync.dbt.schemas import ModelSchema, parse_meta_properties
@@ -1210,3 +1211,41 @@ def test_parse_meta_properties() -> None:
             "meta": {"airflow": "other_id"},
         },
     }
+
+
+@pytest.mark.parametrize("name", ["manifest.json", "manifest-metricflow.json"])
+def test_load_manifest(name: str) -> None:
+    """
+    Test ``load_manifest`` with and without streaming.
+    """
+    path = Path(__file__).parent / name
+    with open(path, encoding="utf-8") as input_:
+        contents = json.load(input_)
+
+    manifest = load_manifest(path)
+    assert manifest == load_manifest(path, stream=True)
+    assert set(manifest) == {"nodes", "metrics", "child_map"}
+    assert manifest["nodes"] == {
+        unique_id: config
+        for unique_id, config in contents["nodes"].items()
+        if config["resource_type"] == "model"
+    }
+    assert manifest["metrics"] == contents["metrics"]
+    assert manifest["child_map"] == contents["child_map"]
+
+
+def test_load_manifest_no_ijson(mocker: MockerFixture, fs: FakeFilesystem) -> None:
+    """
+    Test ``load_manifest`` with streaming when ``ijson`` is not installed.
+    """
+    mocker.patch("preset_cli.cli.superset.sync.dbt.lib.ijson", None)
+    fs.create_file("/path/to/manifest.json", contents="{}")
+
+    assert load_manifest(Path("/path/to/manifest.json")) == {
+        "nodes": {},
+        "metrics": {},
+        "child_map": {},
+    }
+    with pytest.raises(CLIError) as excinfo:
+        load_manifest(Path("/path/to/manifest.json"), stream=True)
+    assert "pip install --upgrade preset-cli[streaming]" in str(excinfo.value)
@@ -47,6 +47,8 @@ def test_dj_command(mocker: MockerFixture) -> None:
     SupersetClient.assert_called_once_with(
         URL("https://superset.example.org/"),
         UsernamePasswordAuth(),
+        cache=None,
+        memoize=True,
     )
     DJClient.assert_called_once_with("http://localhost:8000")
     DJClient().basic_login.assert_called_once_with("dj", "dj")
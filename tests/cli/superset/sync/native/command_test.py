@@ -2,17 +2,21 @@
 Tests for the native import command.
 """
 
-# pylint: disable=redefined-outer-name, invalid-name, too-many-lines, too-many-locals
+# pylint: disable=redefined-outer-name, invalid-name, too-many-lines, too-many-locals, unused-argument
 
 import json
+import threading
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, List, Tuple, cast
 from unittest import mock
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZipFile
 
+import click
 import pytest
 import requests
 import yaml
+import yarl
 from click.testing import CliRunner
 from freezegun import freeze_time
 from jinja2 import Template
@@ -20,6 +24,7 @@ from pyfakefs.fake_filesystem import FakeFilesystem
 from pytest_mock import MockerFixture
 from sqlalchemy.engine.url import URL
 
+from preset_cli.cli.superset.lib import read_logs
 from preset_cli.cli.superset.main import superset_cli
 from preset_cli.cli.superset.sync.native.command import (
     ResourceType,
@@ -41,10 +46,12 @@ from preset_cli.cli.superset.sync.native.command import (
     _update_chart_no_cascade,
     _update_dashboard_no_cascade,
     add_password_to_config,
+    discover_configs,
     get_charts_uuids,
     get_dataset_filter_uuids,
     import_resources,
     import_resources_individually,
+    load_configs,
     load_user_modules,
     raise_helper,
     verify_db_connectivity,
@@ -139,11 +146,25 @@ def test_add_password_to_config_existing_connection(mocker: MockerFixture) -> No
     mock_verify_conn.assert_called_once_with(config)
 
 
+def capture_bundles(client: mock.MagicMock) -> List[BytesIO]:
+    """
+    Store copies of the bundles passed to ``import_zip``.
+
+    The bundles are temporary files, closed after they're imported.
+    """
+    bundles: List[BytesIO] = []
+    client.import_zip.side_effect = lambda resource_name, form_data, overwrite: (
+        bundles.append(BytesIO(form_data.read()))
+    )
+    return bundles
+
+
 def test_import_resources(mocker: MockerFixture) -> None:
     """
     Test ``import_resources``.
     """
     client = mocker.MagicMock()
+    bundles = capture_bundles(client)
 
     contents = {"bundle/databases/gsheets.yaml": "GSheets"}
     with freeze_time("2022-01-01T00:00:00Z"):
@@ -151,14 +172,14 @@ def test_import_resources(mocker: MockerFixture) -> None:
 
     call = client.import_zip.mock_calls[0]
     assert call.kwargs == {"overwrite": False}
+    assert call.args[0] == "assets"
 
-    resource, buf = call.args
-    assert resource == "assets"
-    with ZipFile(buf) as bundle:
+    with ZipFile(bundles[0]) as bundle:
         assert bundle.namelist() == [
             "bundle/databases/gsheets.yaml",
             "bundle/metadata.yaml",
         ]
+        assert all(info.compress_type == ZIP_DEFLATED for info in bundle.infolist())
         assert (
             bundle.read("bundle/metadata.yaml").decode()
             == "timestamp: '2022-01-01T00:00:00+00:00'\ntype: assets\nversion: 1.0.0\n"
@@ -175,6 +196,7 @@ def test_import_resources_asset_types(
     Test ``import_resources`` when a resource_type value is specified.
     """
     client = mocker.MagicMock()
+    bundles = capture_bundles(client)
 
     contents = {"bundle/databases/gsheets.yaml": "GSheets"}
     with freeze_time("2022-01-01T00:00:00Z"):
@@ -182,10 +204,9 @@ def test_import_resources_asset_types(
 
     call = client.import_zip.mock_calls[0]
     assert call.kwargs == {"overwrite": False}
+    assert call.args[0] == resource_type.resource_name
 
-    resource, buf = call.args
-    assert resource == resource_type.resource_name
-    with ZipFile(buf) as bundle:
+    with ZipFile(bundles[0]) as bundle:
         assert bundle.namelist() == [
             "bundle/databases/gsheets.yaml",
             "bundle/metadata.yaml",
@@ -197,6 +218,31 @@ def test_import_resources_asset_types(
         assert bundle.read("bundle/databases/gsheets.yaml").decode() == "GSheets"
 
 
+def test_import_resources_compression_level(mocker: MockerFixture) -> None:
+    """
+    Test ``import_resources`` with a custom compression level.
+    """
+    client = mocker.MagicMock()
+    bundles = capture_bundles(client)
+
+    contents = {"bundle/databases/gsheets.yaml": "GSheets\n" * 1000}
+    sizes = []
+    for compression_level in (0, 9):
+        import_resources(
+            contents,
+            client,
+            False,
+            ResourceType.ASSET,
+            compression_level=compression_level,
+        )
+        with ZipFile(bundles[-1]) as bundle:
+            info = bundle.getinfo("bundle/databases/gsheets.yaml")
+            assert bundle.read(info).decode() == "GSheets\n" * 1000
+            sizes.append(info.compress_size)
+
+    assert sizes[1] < sizes[0]
+
+
 def test_import_resources_overwrite_needed(mocker: MockerFixture) -> None:
     """
     Test ``import_resources`` when an overwrite error is raised.
@@ -416,6 +462,7 @@ def test_native(mocker: MockerFixture, fs: FakeFilesystem) -> None:
         client,
         False,
         ResourceType.ASSET,
+        compression_level=6,
     )
     client.get_uuids.assert_not_called()
 
@@ -542,6 +589,7 @@ def test_native_params_as_str(mocker: MockerFixture, fs: FakeFilesystem) -> None
         client,
         False,
         ResourceType.ASSET,
+        compression_level=6,
     )
     client.get_uuids.assert_not_called()
 
@@ -669,6 +717,7 @@ def test_native_load_env(
         client,
         False,
         ResourceType.ASSET,
+        compression_level=6,
     )
     client.get_uuids.assert_not_called()
 
@@ -738,6 +787,7 @@ def test_native_external_url(mocker: MockerFixture, fs: FakeFilesystem) -> None:
         client,
         False,
         ResourceType.ASSET,
+        compression_level=6,
     )
     client.get_uuids.assert_not_called()
 
@@ -837,6 +887,110 @@ def test_raise_helper() -> None:
     assert str(excinfo.value) == "Invalid number: -1"
 
 
+def test_discover_configs(fs: FakeFilesystem) -> None:
+    """
+    Test ``discover_configs``.
+    """
+    root = Path("/path/to/root")
+    fs.create_file(root / "databases/gsheets.yaml")
+    fs.create_file(root / "databases/gsheets.overrides.yaml")
+    fs.create_file(root / "datasets/gsheets/sheet.yaml")
+    fs.create_file(root / "datasets/.hidden/sheet.yaml")
+    fs.create_file(root / "functions/helpers.py")
+    fs.create_file(root / "metadata.yaml")
+
+    assert sorted(discover_configs(root)) == [
+        root / "databases/gsheets.yaml",
+        root / "datasets/gsheets/sheet.yaml",
+    ]
+
+
+def test_discover_configs_sorted(fs: FakeFilesystem) -> None:
+    """
+    Test that ``discover_configs`` returns configs in a deterministic order.
+    """
+    root = Path("/path/to/root")
+    fs.create_file(root / "datasets/b/sheet.yaml")
+    fs.create_file(root / "charts/z.yaml")
+    fs.create_file(root / "datasets/a/sheet.yaml")
+    fs.create_file(root / "charts/a.yaml")
+    fs.create_file(root / "databases/gsheets.yaml")
+
+    assert discover_configs(root) == [
+        root / "charts/a.yaml",
+        root / "charts/z.yaml",
+        root / "databases/gsheets.yaml",
+        root / "datasets/a/sheet.yaml",
+        root / "datasets/b/sheet.yaml",
+    ]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_load_configs(tmp_path: Path, processes: int) -> None:
+    """
+    Test ``load_configs``, serially and with a process pool.
+    """
+    (tmp_path / "functions").mkdir()
+    (tmp_path / "functions/demo.py").write_text(
+        "def hello(name):\n    return f'Hello, {name}'\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "charts").mkdir()
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"charts/chart_{i}.yaml"
+        path.write_text(
+            f"slice_name: '{{{{ functions.demo.hello(country) }}}} {i}'\n"
+            f"uuid: '{i}'\n",
+            encoding="utf-8",
+        )
+        paths.append(path)
+    (tmp_path / "charts/chart_2.overrides.yaml").write_text(
+        "viz_type: table\n",
+        encoding="utf-8",
+    )
+
+    configs = load_configs(
+        tmp_path,
+        paths,
+        ("country=BR",),
+        yarl.URL("https://superset.example.org/"),
+        processes=processes,
+    )
+
+    assert [config["slice_name"] for config in configs] == [
+        f"Hello, BR {i}" for i in range(5)
+    ]
+    assert [config.get("viz_type") for config in configs] == [
+        None,
+        None,
+        "table",
+        None,
+        None,
+    ]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_load_configs_error(tmp_path: Path, processes: int) -> None:
+    """
+    Test that ``load_configs`` reports the path of configs that fail to render.
+    """
+    (tmp_path / "charts").mkdir()
+    paths = [tmp_path / "charts/valid.yaml", tmp_path / "charts/invalid.yaml"]
+    paths[0].write_text("slice_name: valid\n", encoding="utf-8")
+    paths[1].write_text("slice_name: '{{ raise(\"Oops\") }}'\n", encoding="utf-8")
+
+    with pytest.raises(click.ClickException) as excinfo:
+        load_configs(
+            tmp_path,
+            paths,
+            (),
+            yarl.URL("https://superset.example.org/"),
+            processes=processes,
+        )
+    assert excinfo.value.message == f"Unable to load {paths[1]}: Oops"
+
+
 def test_template_in_environment(mocker: MockerFixture, fs: FakeFilesystem) -> None:
     """
     Test that the underlying template is passed to the Jinja renderer.
@@ -887,6 +1041,7 @@ def test_template_in_environment(mocker: MockerFixture, fs: FakeFilesystem) -> N
         client,
         False,
         ResourceType.ASSET,
+        compression_level=6,
     )
     client.get_uuids.assert_not_called()
 
@@ -1158,6 +1313,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.DATABASE,
+                compression_level=6,
             ),
             mock.call(
                 {
@@ -1169,6 +1325,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.DATASET,
+                compression_level=6,
             ),
             mock.call(
                 {
@@ -1178,6 +1335,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.DATASET,
+                compression_level=6,
             ),
             mock.call(
                 {
@@ -1188,6 +1346,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.CHART,
+                compression_level=6,
             ),
             mock.call(
                 {
@@ -1198,6 +1357,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.DASHBOARD,
+                compression_level=6,
             ),
             mock.call(
                 {
@@ -1208,6 +1368,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.DASHBOARD,
+                compression_level=6,
             ),
             mock.call(
                 {
@@ -1223,6 +1384,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.DASHBOARD,
+                compression_level=6,
             ),
             mock.call(
                 {
@@ -1234,6 +1396,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.DASHBOARD,
+                compression_level=6,
             ),
             mock.call(
                 {
@@ -1248,6 +1411,7 @@ def test_native_split(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.DASHBOARD,
+                compression_level=6,
             ),
         ],
         any_order=True,
@@ -1402,6 +1566,7 @@ def test_native_split_continue(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.DATABASE,
+                compression_level=6,
             ),
             mock.call(
                 {
@@ -1411,6 +1576,7 @@ def test_native_split_continue(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.DATASET,
+                compression_level=6,
             ),
             mock.call(
                 {
@@ -1421,6 +1587,7 @@ def test_native_split_continue(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.CHART,
+                compression_level=6,
             ),
             mock.call(
                 {
@@ -1431,6 +1598,7 @@ def test_native_split_continue(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.DASHBOARD,
+                compression_level=6,
             ),
             mock.call(
                 {
@@ -1442,13 +1610,14 @@ def test_native_split_continue(  # pylint: disable=too-many-locals
                 client,
                 False,
                 ResourceType.DASHBOARD,
+                compression_level=6,
             ),
         ],
         any_order=True,
     )
 
     with open("progress.log", encoding="utf-8") as log:
-        content = yaml.load(log, Loader=yaml.SafeLoader)
+        content = read_logs(log)
 
     assert content["ownership"] == []
     assert content["assets"] == [
@@ -1467,6 +1636,11 @@ def test_native_split_continue(  # pylint: disable=too-many-locals
             "uuid": "3",
             "status": "SUCCESS",
         },
+        {
+            "path": "bundle/dashboards/dashboard.yaml",
+            "uuid": "4",
+            "status": "SUCCESS",
+        },
         {
             "path": "bundle/dashboards/dashboard_deleted_chart.yaml",
             "uuid": "6",
@@ -1477,11 +1651,6 @@ def test_native_split_continue(  # pylint: disable=too-many-locals
             "uuid": "5",
             "status": "SUCCESS",
         },
-        {
-            "path": "bundle/dashboards/dashboard.yaml",
-            "uuid": "4",
-            "status": "SUCCESS",
-        },
     ]
 
 
@@ -1669,6 +1838,7 @@ def test_import_resources_individually_checkpoint(
                 client,
                 False,
                 ResourceType.DATABASE,
+                compression_level=6,
             ),
             mocker.call(
                 {
@@ -1679,12 +1849,13 @@ def test_import_resources_individually_checkpoint(
                 client,
                 False,
                 ResourceType.DATABASE,
+                compression_level=6,
             ),
         ],
     )
 
     with open("progress.log", encoding="utf-8") as log:
-        content = yaml.load(log, Loader=yaml.SafeLoader)
+        content = read_logs(log)
 
     assert content == {
         "assets": [
@@ -1709,6 +1880,7 @@ def test_import_resources_individually_checkpoint(
         client,
         False,
         ResourceType.DATABASE,
+        compression_level=6,
     )
 
     assert not Path("progress.log").exists()
@@ -1752,7 +1924,7 @@ def test_import_resources_individually_continue(
     )
 
     with open("progress.log", encoding="utf-8") as log:
-        content = yaml.load(log, Loader=yaml.SafeLoader)
+        content = read_logs(log)
 
     assert content == {
         "assets": [
@@ -1794,6 +1966,7 @@ def test_import_resources_individually_continue(
                 client,
                 False,
                 ResourceType.DATABASE,
+                compression_level=6,
             ),
             mocker.call(
                 {
@@ -1804,6 +1977,7 @@ def test_import_resources_individually_continue(
                 client,
                 False,
                 ResourceType.DATABASE,
+                compression_level=6,
             ),
             mocker.call(
                 {
@@ -1814,6 +1988,7 @@ def test_import_resources_individually_continue(
                 client,
                 False,
                 ResourceType.DATABASE,
+                compression_level=6,
             ),
             mocker.call(
                 {
@@ -1824,12 +1999,195 @@ def test_import_resources_individually_continue(
                 client,
                 False,
                 ResourceType.DATABASE,
+                compression_level=6,
             ),
         ],
     )
     assert not Path("progress.log").exists()
 
 
+def test_import_resources_individually_workers(
+    mocker: MockerFixture,
+    fs: FakeFilesystem,  # pylint: disable=unused-argument
+) -> None:
+    """
+    Test ``import_resources_individually`` with multiple workers.
+
+    Assets of the same type are imported concurrently, but types are still imported
+    in order, and results are checkpointed as they complete.
+    """
+    client = mocker.MagicMock()
+    mocker.patch("preset_cli.cli.superset.lib.LOG_FILE_PATH", Path("progress.log"))
+    configs: Dict[Path, AssetConfig] = {
+        Path("bundle/databases/gsheets.yaml"): {"name": "gsheets", "uuid": "db1"},
+        Path("bundle/databases/psql.yaml"): {"name": "psql", "uuid": "db2"},
+        Path("bundle/datasets/a.yaml"): {"uuid": "ds1", "database_uuid": "db1"},
+        Path("bundle/datasets/b.yaml"): {"uuid": "ds2", "database_uuid": "db2"},
+        Path("bundle/datasets/c.yaml"): {"uuid": "ds3", "database_uuid": "db2"},
+    }
+    imported: List[ResourceType] = []
+
+    def import_resources(contents, client, overwrite, resource_type, **kwargs):
+        if "bundle/datasets/b.yaml" in contents:
+            raise Exception("An error occurred!")
+        imported.append(resource_type)
+
+    mocker.patch(
+        "preset_cli.cli.superset.sync.native.command.import_resources",
+        side_effect=import_resources,
+    )
+
+    import_resources_individually(
+        configs,
+        client,
+        True,
+        ResourceType.ASSET,
+        continue_on_error=True,
+        workers=4,
+    )
+
+    assert imported == [ResourceType.DATABASE] * 2 + [ResourceType.DATASET] * 2
+
+    with open("progress.log", encoding="utf-8") as log:
+        content = read_logs(log)
+
+    assert sorted(content["assets"], key=lambda log: log["path"]) == [
+        {"path": "bundle/databases/gsheets.yaml", "uuid": "db1", "status": "SUCCESS"},
+        {"path": "bundle/databases/psql.yaml", "uuid": "db2", "status": "SUCCESS"},
+        {"path": "bundle/datasets/a.yaml", "uuid": "ds1", "status": "SUCCESS"},
+        {"path": "bundle/datasets/b.yaml", "uuid": "ds2", "status": "FAILED"},
+        {"path": "bundle/datasets/c.yaml", "uuid": "ds3", "status": "SUCCESS"},
+    ]
+
+
+def test_import_resources_individually_workers_error(
+    mocker: MockerFixture,
+    fs: FakeFilesystem,  # pylint: disable=unused-argument
+) -> None:
+    """
+    Test that a failure with multiple workers stops the import.
+
+    Assets that were already running are still checkpointed, so that a retry continues
+    from where the import stopped.
+    """
+    client = mocker.MagicMock()
+    mocker.patch("preset_cli.cli.superset.lib.LOG_FILE_PATH", Path("progress.log"))
+    configs: Dict[Path, AssetConfig] = {
+        Path("bundle/databases/gsheets.yaml"): {"name": "gsheets", "uuid": "db1"},
+        Path("bundle/databases/psql.yaml"): {"name": "psql", "uuid": "db2"},
+        Path("bundle/datasets/a.yaml"): {"uuid": "ds1", "database_uuid": "db1"},
+    }
+    barrier = threading.Barrier(2)
+
+    def import_resources(contents, client, overwrite, resource_type, **kwargs):
+        barrier.wait(timeout=5)
+        if "bundle/databases/psql.yaml" in contents:
+            raise Exception("An error occurred!")
+
+    import_resources_mock = mocker.patch(
+        "preset_cli.cli.superset.sync.native.command.import_resources",
+        side_effect=import_resources,
+    )
+
+    with pytest.raises(Exception) as excinfo:
+        import_resources_individually(
+            configs,
+            client,
+            True,
+            ResourceType.ASSET,
+            workers=2,
+        )
+    assert str(excinfo.value) == "An error occurred!"
+    assert import_resources_mock.call_count == 2
+
+    with open("progress.log", encoding="utf-8") as log:
+        content = read_logs(log)
+
+    assert content["assets"] == [
+        {"path": "bundle/databases/gsheets.yaml", "uuid": "db1", "status": "SUCCESS"},
+    ]
+
+
+def test_import_resources_individually_batch_size(
+    mocker: MockerFixture,
+    fs: FakeFilesystem,  # pylint: disable=unused-argument
+) -> None:
+    """
+    Test ``import_resources_individually`` with a batch size.
+
+    Failed bundles are retried in smaller bundles, until the failing asset is found.
+    """
+    client = mocker.MagicMock()
+    mocker.patch("preset_cli.cli.superset.lib.LOG_FILE_PATH", Path("progress.log"))
+    configs: Dict[Path, AssetConfig] = {
+        Path(f"bundle/databases/db{i}.yaml"): {"name": f"db{i}", "uuid": f"uuid{i}"}
+        for i in range(1, 6)
+    }
+    bundles: List[List[str]] = []
+
+    def import_resources(contents, client, overwrite, resource_type, **kwargs):
+        bundles.append(sorted(contents))
+        if "bundle/databases/db3.yaml" in contents:
+            raise Exception("An error occurred!")
+
+    mocker.patch(
+        "preset_cli.cli.superset.sync.native.command.import_resources",
+        side_effect=import_resources,
+    )
+
+    import_resources_individually(
+        configs,
+        client,
+        True,
+        ResourceType.ASSET,
+        continue_on_error=True,
+        batch_size=4,
+    )
+
+    assert bundles == [
+        [f"bundle/databases/db{i}.yaml" for i in (1, 2, 3, 4)],
+        [f"bundle/databases/db{i}.yaml" for i in (1, 2)],
+        [f"bundle/databases/db{i}.yaml" for i in (3, 4, 5)],
+        ["bundle/databases/db3.yaml"],
+        ["bundle/databases/db4.yaml"],
+        ["bundle/databases/db5.yaml"],
+    ]
+
+    with open("progress.log", encoding="utf-8") as log:
+        content = read_logs(log)
+
+    assert content["assets"] == [
+        {
+            "path": f"bundle/databases/db{i}.yaml",
+            "uuid": f"uuid{i}",
+            "status": "FAILED" if i == 3 else "SUCCESS",
+        }
+        for i in (1, 2, 3, 4, 5)
+    ]
+
+    # without ``continue_on_error`` the failing asset is raised
+    Path("progress.log").unlink()
+    bundles.clear()
+    with pytest.raises(Exception) as excinfo:
+        import_resources_individually(
+            configs,
+            client,
+            True,
+            ResourceType.ASSET,
+            batch_size=4,
+        )
+    assert str(excinfo.value) == "An error occurred!"
+    assert bundles[-1] == ["bundle/databases/db3.yaml"]
+
+    with open("progress.log", encoding="utf-8") as log:
+        content = read_logs(log)
+
+    assert [log["path"] for log in content["assets"]] == [
+        "bundle/databases/db1.yaml",
+        "bundle/databases/db2.yaml",
+    ]
+
+
 def test_import_resources_individually_debug(mocker: MockerFixture) -> None:
     """
     Test the ``import_resources_individually`` method with logger set
@@ -1989,6 +2347,7 @@ GROUP BY action""",
         client,
         False,
         ResourceType.ASSET,
+        compression_level=6,
     )
     client.get_uuids.assert_not_called()
 
@@ -2103,7 +2462,13 @@ def test_native_asset_types(
         "bundle/dashboards/dashboard.yaml": yaml.dump(dashboard_config),
     }
 
-    import_resources.assert_called_once_with(contents, client, False, resource_type)
+    import_resources.assert_called_once_with(
+        contents,
+        client,
+        False,
+        resource_type,
+        compression_level=6,
+    )
     client.get_uuids.assert_not_called()
 
 
@@ -2391,6 +2756,7 @@ def test_native_split_asset_types(
                 client,
                 False,
                 call_type,
+                compression_level=6,
             )
             for content, call_type in expected_calls
         ],
@@ -2551,6 +2917,90 @@ def test_native_no_cascade_forces_split(
     assert not Path("progress.log").exists()
 
 
+def test_native_batch_size_forces_split(
+    mocker: MockerFixture,
+    fs: FakeFilesystem,
+) -> None:
+    """
+    Test ``--batch-size`` forces split imports.
+    """
+    root = Path("/path/to/root")
+    fs.create_dir(root)
+    fs.create_dir(root / "databases")
+    fs.create_file(
+        root / "databases/db.yaml",
+        contents=yaml.dump(
+            {
+                "database_name": "db",
+                "sqlalchemy_uri": "sqlite://",
+                "uuid": "db-uuid",
+            },
+        ),
+    )
+
+    SupersetClient = mocker.patch(
+        "preset_cli.cli.superset.sync.native.command.SupersetClient",
+    )
+    client = SupersetClient()
+    client.get_databases.return_value = [{"uuid": "db-uuid"}]
+    import_resources_individually_mock = mocker.patch(
+        "preset_cli.cli.superset.sync.native.command.import_resources_individually",
+    )
+    mocker.patch("preset_cli.cli.superset.main.UsernamePasswordAuth")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        superset_cli,
+        [
+            "https://superset.example.org/",
+            "sync",
+            "native",
+            str(root),
+            "--batch-size",
+            "100",
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    import_resources_individually_mock.assert_called_once()
+    assert import_resources_individually_mock.call_args.kwargs["batch_size"] == 100
+
+
+def test_native_batch_size_workers(mocker: MockerFixture, fs: FakeFilesystem) -> None:
+    """
+    Test that ``--batch-size`` can't be used with ``--workers``.
+    """
+    root = Path("/path/to/root")
+    fs.create_dir(root)
+    SupersetClient = mocker.patch(
+        "preset_cli.cli.superset.sync.native.command.SupersetClient",
+    )
+    import_resources_individually_mock = mocker.patch(
+        "preset_cli.cli.superset.sync.native.command.import_resources_individually",
+    )
+    mocker.patch("preset_cli.cli.superset.main.UsernamePasswordAuth")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        superset_cli,
+        [
+            "https://superset.example.org/",
+            "sync",
+            "native",
+            str(root),
+            "--batch-size",
+            "100",
+            "--workers",
+            "4",
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 2
+    assert "--workers can't be used with --batch-size" in result.output
+    SupersetClient.assert_not_called()
+    import_resources_individually_mock.assert_not_called()
+
+
 def test_native_cascade_chart_does_not_force_split(
     mocker: MockerFixture,
     fs: FakeFilesystem,
@@ -3878,6 +4328,7 @@ def test_native_with_db_passwords(mocker: MockerFixture, fs: FakeFilesystem) ->
         client,
         False,
         ResourceType.ASSET,
+        compression_level=6,
     )
     getpass.getpass.assert_called_once_with(
         "Please provide the password for databases/other_db_config_masked_no_password.yaml: ",
@@ -2,18 +2,26 @@
 Tests for ``preset_cli.lib``.
 """
 
+import io
+import json
 import logging
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
+import click
 import pytest
 from pytest_mock import MockerFixture
 
 from preset_cli.exceptions import CLIError, ErrorLevel, SupersetError
 from preset_cli.lib import (
+    copy_zip_member,
     dict_merge,
     raise_cli_errors,
     remove_root,
+    setup_http_stats,
     setup_logging,
     validate_response,
+    write_deflated_zip,
 )
 
 
@@ -36,6 +44,35 @@ def test_setup_logging() -> None:
     assert str(excinfo.value) == "Invalid log level: invalid"
 
 
+def test_setup_http_stats(mocker: MockerFixture, tmp_path: Path) -> None:
+    """
+    Test ``setup_http_stats``.
+    """
+    HTTPStats = mocker.patch("preset_cli.lib.HTTPStats")  # pylint: disable=invalid-name
+    HTTPStats().to_dict.return_value = {"GET /api/v1/chart/": {"count": 1}}
+    HTTPStats().format.return_value = "table"
+    echo = mocker.patch("preset_cli.lib.click.echo")
+    auth = mocker.MagicMock()
+
+    # not requested
+    ctx = click.Context(click.Command("test"), obj={"AUTH": auth})
+    setup_http_stats(ctx, False)
+    assert "HTTP_STATS" not in ctx.obj
+
+    with click.Context(click.Command("test"), obj={"AUTH": auth}) as ctx:
+        setup_http_stats(ctx, True)
+        setup_http_stats(ctx, True)
+    HTTPStats().install.assert_called_once_with(auth.session)
+    echo.assert_called_once_with("table", err=True)
+
+    output = tmp_path / "stats.json"
+    with click.Context(click.Command("test"), obj={"AUTH": auth}) as ctx:
+        setup_http_stats(ctx, False, str(output))
+    assert json.loads(output.read_text(encoding="utf-8")) == {
+        "GET /api/v1/chart/": {"count": 1},
+    }
+
+
 def test_validate_response(mocker: MockerFixture) -> None:
     """
     Test ``validate_response``.
@@ -144,3 +181,84 @@ def test_raise_cli_errors_decorator_when_not_raising() -> None:
 
     result = mock_function()
     assert result == "All good!"
+
+
+class UnseekableBuffer(io.RawIOBase):
+    """
+    A write-only buffer that can't seek, so ZIP members get data descriptors.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.buffer = io.BytesIO()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:  # type: ignore
+        return self.buffer.write(b)
+
+
+@pytest.mark.parametrize("zip_internals", [True, False])
+def test_copy_zip_member(mocker: MockerFixture, zip_internals: bool) -> None:
+    """
+    Test ``copy_zip_member``, with and without the ``zipfile`` internals.
+    """
+    mocker.patch("preset_cli.lib._ZIP_INTERNALS", zip_internals)
+
+    deflated = io.BytesIO()
+    with ZipFile(deflated, "w", compression=ZIP_DEFLATED) as bundle:
+        bundle.writestr("bundle/charts/chart.yaml", "slice_name: Chart\n" * 100)
+        bundle.writestr("bundle/metadata.yaml", "version: 1.0.0\n")
+
+    unseekable = UnseekableBuffer()
+    with ZipFile(unseekable, "w", compression=ZIP_DEFLATED) as bundle:
+        with bundle.open("bundle/datasets/dataset.yaml", "w") as output:
+            output.write(b"table_name: t\n")
+    streamed = io.BytesIO(unseekable.buffer.getvalue())
+
+    target = io.BytesIO()
+    with ZipFile(target, "w", compression=ZIP_STORED) as bundle:
+        for source in (deflated, streamed):
+            with ZipFile(source) as subset:
+                for info in subset.infolist():
+                    copy_zip_member(subset, info, bundle)
+
+    with ZipFile(target) as bundle:
+        assert bundle.testzip() is None
+        assert bundle.namelist() == [
+            "bundle/charts/chart.yaml",
+            "bundle/metadata.yaml",
+            "bundle/datasets/dataset.yaml",
+        ]
+        assert all(info.compress_type == ZIP_DEFLATED for info in bundle.infolist())
+        assert bundle.read("bundle/charts/chart.yaml") == b"slice_name: Chart\n" * 100
+        assert bundle.read("bundle/datasets/dataset.yaml") == b"table_name: t\n"
+
+
+@pytest.mark.parametrize("zip_internals", [True, False])
+def test_write_deflated_zip(mocker: MockerFixture, zip_internals: bool) -> None:
+    """
+    Test ``write_deflated_zip``, with and without the ``zipfile`` internals.
+    """
+    mocker.patch("preset_cli.lib._ZIP_INTERNALS", zip_internals)
+
+    contents = {
+        "bundle/charts/chart.yaml": b"slice_name: Chart\n" * 100,
+        "bundle/databases/empty.yaml": b"",
+        "bundle/metadata.yaml": b"version: 1.0.0\n",
+    }
+
+    sizes = {}
+    for compression_level in (0, 9):
+        target = io.BytesIO()
+        write_deflated_zip(target, contents, compression_level, max_workers=2)
+        sizes[compression_level] = len(target.getvalue())
+
+        with ZipFile(target) as bundle:
+            assert bundle.testzip() is None
+            assert bundle.namelist() == list(contents)
+            assert all(info.compress_type == ZIP_DEFLATED for info in bundle.infolist())
+            assert {name: bundle.read(name) for name in contents} == contents
+
+    assert sizes[9] < sizes[0]